@@ -0,0 +1,235 @@
+"""Downloadable outputs of one analysis, each rendered once and shared across reruns
+
+An ``ArtifactBundle`` holds the text report, narration script, audio, JSON,
+HTML report and a ZIP of all of them. Every format is rendered on first use
+with the bundle's single timestamp and then reused; the ZIP is built from the
+already rendered members. Bundles are cached by a fingerprint of the
+analysis, so reruns and extra download formats never render twice.
+"""
+import hashlib
+import html
+import io
+import json
+import threading
+import zipfile
+from collections import OrderedDict
+from datetime import datetime
+
+from dental_analysis import create_downloadable_report
+from locales import strings, value_label
+from metrics import register_gauges, timed
+
+
+# name -> (file name pattern, MIME type, member of the ZIP)
+ARTIFACT_FORMATS = {
+    "report": ("dental_analysis_report_{stamp}.txt", "text/plain", True),
+    "script": ("dental_audio_script_{stamp}.txt", "text/plain", True),
+    "audio": ("dental_analysis_audio_{stamp}.mp3", "audio/mp3", True),
+    "json": ("dental_analysis_{stamp}.json", "application/json", True),
+    "html": ("dental_analysis_report_{stamp}.html", "text/html", True),
+    "zip": ("dental_analysis_{stamp}.zip", "application/zip", False),
+}
+
+HTML_STYLE = """
+body { font-family: system-ui, sans-serif; max-width: 46rem; margin: 2rem auto; color: #1a202c; line-height: 1.45; }
+h1 { color: #2E86AB; margin-bottom: 0.2rem; }
+h2 { font-size: 1rem; letter-spacing: 0.04em; border-bottom: 2px solid #2E86AB; padding-bottom: 0.2rem; margin-top: 1.6rem; }
+table { border-collapse: collapse; }
+td { padding: 0.15rem 1rem 0.15rem 0; vertical-align: top; }
+.meta, .disclaimer { color: #4a5568; font-size: 0.9rem; }
+@media print { body { margin: 0; } h2 { break-after: avoid; } }
+"""
+
+
+def analysis_fingerprint(analysis, audio_summary, audio, lang):
+    """Content hash of everything a bundle is rendered from"""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(json.dumps([analysis, audio_summary, lang], sort_keys=True, ensure_ascii=False).encode("utf-8"))
+    digest.update(audio or b"")
+    return digest.hexdigest()
+
+
+def render_html_report(analysis, lang, generated):
+    """Compact self-contained HTML report (print it to get a PDF)"""
+    text = strings(lang, "REPORT")
+    escape = lambda value: html.escape(str(value))
+
+    def rows(pairs):
+        return "".join(f"<tr><td><strong>{escape(label)}</strong></td><td>{escape(value)}</td></tr>" for label, value in pairs)
+
+    def bullets(items):
+        return "<ul>" + "".join(f"<li>{escape(item)}</li>" for item in items) + "</ul>"
+
+    def section(title, body):
+        return f"<h2>{escape(title)}</h2>{body}"
+
+    def teeth(item):
+        return ", ".join(item.get("affected_teeth", [])) or text["not_specified"]
+
+    def label(item, field, default="unknown"):
+        return value_label(lang, field, item[field]) if item.get(field) else text[default]
+
+    parts = [
+        f"<h1>{escape(text['title'])}</h1>",
+        f"<p class=\"meta\">{escape(text['generated'])}: {generated.strftime('%Y-%m-%d %H:%M:%S')}</p>",
+        section(text["summary"], "<table>" + rows([
+            (text["cavity_stage"], label(analysis, "cavity_stage")),
+            (text["severity"], label(analysis, "severity_level")),
+            (text["emergency_level"], label(analysis, "emergency_level", "none")),
+            (text["cavity_present"], text["yes"] if analysis.get("cavity_present", False) else text["no"]),
+            (text["affected_teeth"], teeth(analysis)),
+        ]) + "</table>"),
+    ]
+    for key, title, default in (
+        ("visible_issues", "visible_issues", "none_identified"),
+        ("possible_causes", "possible_causes", "not_specified"),
+        ("recommended_treatments", "recommended_treatments", "consult_dentist"),
+        ("immediate_concerns", "immediate_concerns", "none_identified"),
+        ("prevention_tips", "prevention_tips", "default_prevention"),
+        ("home_care_instructions", "home_care", "default_home_care"),
+    ):
+        parts.append(section(text[title], bullets(analysis.get(key, [text[default]]))))
+
+    views = []
+    for item in analysis.get("per_image") or []:
+        views.append(
+            f"<h3>{escape(item.get('label', text['image']))}</h3><table>" + rows([
+                (text["cavity_stage"], label(item, "cavity_stage")),
+                (text["severity"], label(item, "severity_level")),
+                (text["affected_teeth"], teeth(item)),
+            ]) + "</table>" + (bullets(item["visible_issues"]) if item.get("visible_issues") else "")
+        )
+    if views:
+        parts.append(section(text["per_image"], "".join(views)))
+
+    parts.append(section(text["additional_information"], "<table>" + rows([
+        (text["when_to_see_dentist"], analysis.get("when_to_see_dentist", text["as_soon_as_possible"])),
+        (text["estimated_timeline"], analysis.get("estimated_timeline", text["not_specified"])),
+        (text["prognosis"], analysis.get("prognosis", text["default_prognosis"])),
+        (text["additional_notes"], analysis.get("additional_notes", text["none"])),
+    ]) + "</table>"))
+    parts.append(section(text["disclaimer_title"], f"<p class=\"disclaimer\">{escape(text['disclaimer'])}</p>"))
+
+    return (
+        f"<!DOCTYPE html><html lang=\"{escape(lang)}\"><head><meta charset=\"utf-8\">"
+        f"<title>{escape(text['title'])}</title><style>{HTML_STYLE}</style></head><body>"
+        + "".join(parts) + "</body></html>"
+    )
+
+
+class ArtifactBundle:
+    """All downloadable formats of one analysis, rendered lazily and at most once each
+
+    Safe to share between threads: Streamlit runs deferred download callables
+    off the script thread.
+    """
+
+    def __init__(self, analysis, audio_summary, audio, lang, fingerprint=None, generated=None):
+        self.analysis = analysis
+        self.audio_summary = audio_summary
+        self.audio = audio
+        self.lang = lang
+        self.fingerprint = fingerprint or analysis_fingerprint(analysis, audio_summary, audio, lang)
+        # One timestamp for every file name and every rendered document
+        self.generated = generated or datetime.now()
+        self.stamp = self.generated.strftime("%Y%m%d_%H%M%S")
+        self.renders = 0
+        self._rendered = {}
+        self._lock = threading.RLock()
+
+    def available(self):
+        """Names of the formats this bundle can produce (no audio after a failed synthesis)"""
+        return [name for name in ARTIFACT_FORMATS if name != "audio" or self.audio]
+
+    def file_name(self, name):
+        return ARTIFACT_FORMATS[name][0].format(stamp=self.stamp)
+
+    def mime(self, name):
+        return ARTIFACT_FORMATS[name][1]
+
+    def data(self, name):
+        """Bytes of one format, rendered on first request"""
+        with self._lock:
+            data = self._rendered.get(name)
+            if data is None:
+                if name not in self.available():
+                    raise KeyError(name)
+                with timed(f"artifact_{name}"):
+                    data = getattr(self, f"_render_{name}")()
+                self._rendered[name] = data
+                self.renders += 1
+            return data
+
+    def _render_report(self):
+        return create_downloadable_report(self.analysis, self.lang, generated=self.generated).encode("utf-8")
+
+    def _render_script(self):
+        return self.audio_summary.encode("utf-8")
+
+    def _render_audio(self):
+        return self.audio
+
+    def _render_json(self):
+        document = {
+            "generated": self.generated.isoformat(timespec="seconds"),
+            "lang": self.lang,
+            "fingerprint": self.fingerprint,
+            "analysis": self.analysis,
+            "audio_summary": self.audio_summary,
+        }
+        return json.dumps(document, ensure_ascii=False, indent=2).encode("utf-8")
+
+    def _render_html(self):
+        return render_html_report(self.analysis, self.lang, self.generated).encode("utf-8")
+
+    def _render_zip(self):
+        buffered = io.BytesIO()
+        with zipfile.ZipFile(buffered, "w") as archive:
+            for name in self.available():
+                if not ARTIFACT_FORMATS[name][2]:
+                    continue
+                # MP3 is already compressed; deflating it only costs time
+                compression = zipfile.ZIP_STORED if name == "audio" else zipfile.ZIP_DEFLATED
+                archive.writestr(self.file_name(name), self.data(name), compress_type=compression)
+        return buffered.getvalue()
+
+
+class ArtifactCache:
+    """Small thread-safe LRU of bundles keyed by analysis fingerprint"""
+
+    def __init__(self, max_entries=32):
+        self.max_entries = max_entries
+        self._bundles = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_create(self, analysis, audio_summary, audio, lang):
+        fingerprint = analysis_fingerprint(analysis, audio_summary, audio, lang)
+        with self._lock:
+            bundle = self._bundles.get(fingerprint)
+            if bundle is not None:
+                self._bundles.move_to_end(fingerprint)
+                self.hits += 1
+                return bundle
+            self.misses += 1
+            bundle = self._bundles[fingerprint] = ArtifactBundle(analysis, audio_summary, audio, lang, fingerprint)
+            while len(self._bundles) > self.max_entries:
+                self._bundles.popitem(last=False)
+            return bundle
+
+    def stats(self):
+        with self._lock:
+            bundles = list(self._bundles.values())
+            stats = {"entries": len(bundles), "hits": self.hits, "misses": self.misses}
+        stats["renders"] = sum(bundle.renders for bundle in bundles)
+        return stats
+
+
+_artifact_cache = ArtifactCache()
+register_gauges("artifacts", _artifact_cache.stats)
+
+
+def get_artifacts(analysis, audio_summary, audio, lang):
+    """Bundle for this analysis from the process-wide cache, created on first use"""
+    return _artifact_cache.get_or_create(analysis, audio_summary, audio, lang)
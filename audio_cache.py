@@ -0,0 +1,179 @@
+"""Disk-backed cache of synthesized summary audio
+
+Usage (pre-warm the most requested scripts ahead of traffic):
+    python audio_cache.py --prewarm --per-voice 5
+"""
+import argparse
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+import unicodedata
+
+from result_cache import DEFAULT_CACHE_DIR, SQLiteStore
+
+
+def normalize_text(text):
+    """Canonical form of a script so trivially different strings share audio"""
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+def make_audio_key(text, voice, rate, pitch):
+    digest = hashlib.sha256()
+    for part in (normalize_text(text), voice, rate, pitch):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+def looks_like_mp3(data):
+    """Cheap check for an ID3 tag or an MPEG audio frame sync at the start"""
+    return data[:3] == b"ID3" or (len(data) > 1 and data[0] == 0xFF and data[1] & 0xE0 == 0xE0)
+
+
+class AudioCache:
+    """MP3 bytes keyed by (normalized text, voice, rate, pitch) with LRU size cap
+
+    Every entry is stored with its SHA-256 and verified on read, so a torn
+    write or a corrupted page is treated as a miss instead of being played.
+    Request counts for pre-warming are kept for every cached entry plus at
+    most ``max_requests`` scripts whose audio was evicted.
+    """
+
+    def __init__(self, path=None, max_bytes=512 * 1024 * 1024, ttl_seconds=None, max_requests=10_000):
+        self.path = path or os.path.join(DEFAULT_CACHE_DIR, "audio.sqlite3")
+        self._store = SQLiteStore(self.path, table="audio", ttl_seconds=ttl_seconds, max_bytes=max_bytes)
+        self.max_requests = max_requests
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.corrupt = 0
+
+        with self._connect() as conn:
+            conn.execute(
+                """CREATE TABLE IF NOT EXISTS audio_requests (
+                    key TEXT PRIMARY KEY,
+                    text TEXT NOT NULL,
+                    voice TEXT NOT NULL,
+                    rate TEXT NOT NULL,
+                    pitch TEXT NOT NULL,
+                    count INTEGER NOT NULL,
+                    last_requested REAL NOT NULL
+                )"""
+            )
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=5)
+
+    def get(self, text, voice, rate, pitch="+0Hz"):
+        key = make_audio_key(text, voice, rate, pitch)
+        audio = None
+        try:
+            self._record_request(key, text, voice, rate, pitch)
+            entry = self._store.get(key)
+            if entry is not None:
+                data, _ = entry
+                checksum, audio = data[:32], data[32:]
+                if hashlib.sha256(audio).digest() != checksum or not looks_like_mp3(audio):
+                    audio = None
+                    with self._lock:
+                        self.corrupt += 1
+                    self._store.delete(key)
+        except sqlite3.Error:
+            audio = None
+
+        with self._lock:
+            if audio is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return audio
+
+    def set(self, text, voice, rate, pitch, audio):
+        if not audio:
+            return
+        key = make_audio_key(text, voice, rate, pitch)
+        try:
+            self._store.set(key, hashlib.sha256(audio).digest() + audio)
+            self._prune_requests()
+        except sqlite3.Error:
+            pass
+
+    def _prune_requests(self):
+        # Runs after the store's LRU eviction: scripts whose audio is gone are
+        # dropped least requested first once there are too many of them
+        with self._connect() as conn:
+            conn.execute(
+                """DELETE FROM audio_requests WHERE key IN (
+                    SELECT key FROM audio_requests WHERE key NOT IN (SELECT key FROM audio)
+                    ORDER BY count DESC, last_requested DESC LIMIT -1 OFFSET ?
+                )""",
+                (self.max_requests,),
+            )
+
+    def _record_request(self, key, text, voice, rate, pitch):
+        with self._connect() as conn:
+            conn.execute(
+                """INSERT INTO audio_requests (key, text, voice, rate, pitch, count, last_requested)
+                VALUES (?, ?, ?, ?, ?, 1, ?)
+                ON CONFLICT(key) DO UPDATE SET count = count + 1, last_requested = excluded.last_requested""",
+                (key, normalize_text(text), voice, rate, pitch, time.time()),
+            )
+
+    def popular_scripts(self, per_voice=5):
+        """Most requested (text, voice, rate, pitch) combinations, top N per voice"""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT text, voice, rate, pitch FROM audio_requests ORDER BY voice, count DESC, last_requested DESC"
+            ).fetchall()
+        popular = []
+        taken = {}
+        for text, voice, rate, pitch in rows:
+            if taken.get(voice, 0) < per_voice:
+                taken[voice] = taken.get(voice, 0) + 1
+                popular.append((text, voice, rate, pitch))
+        return popular
+
+    def prewarm(self, synthesize, per_voice=5):
+        """Synthesize popular scripts that are not cached yet; returns how many were added"""
+        added = 0
+        for text, voice, rate, pitch in self.popular_scripts(per_voice):
+            key = make_audio_key(text, voice, rate, pitch)
+            if self._store.get(key) is not None:
+                continue
+            try:
+                self.set(text, voice, rate, pitch, synthesize(text, voice, rate, pitch))
+                added += 1
+            except Exception:
+                # Pre-warming is best effort; the next real request will retry
+                continue
+        return added
+
+    def stats(self):
+        with self._lock:
+            stats = {"hits": self.hits, "misses": self.misses, "corrupt": self.corrupt}
+        try:
+            stats.update({f"disk_{k}": v for k, v in self._store.stats().items()})
+        except sqlite3.Error:
+            pass
+        return stats
+
+
+def main(argv=None):
+    from dental_analysis import generate_audio_bytes
+
+    parser = argparse.ArgumentParser(description="Maintain the synthesized audio cache.")
+    parser.add_argument("--prewarm", action="store_true", help="synthesize the most requested scripts")
+    parser.add_argument("--per-voice", type=int, default=5, help="scripts to pre-warm per voice")
+    args = parser.parse_args(argv)
+
+    cache = AudioCache()
+    if args.prewarm:
+        added = cache.prewarm(lambda text, voice, rate, pitch: generate_audio_bytes(text, voice, rate, pitch), args.per_voice)
+        print(f"Pre-warmed {added} scripts")
+    print(cache.stats())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,245 @@
+"""Headless batch analysis of archived dental photos
+
+Usage:
+    python batch_analyze.py photos/ --output results.jsonl --concurrency 8 --rate 4
+    python batch_analyze.py manifest.txt --output results.jsonl --audio-dir audio/
+
+The input is either a directory (searched recursively for images) or a
+manifest file with one image path per line. Results are appended to the
+JSONL output as they complete; re-running with the same output skips items
+that already succeeded there.
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from dotenv import load_dotenv
+from PIL import Image
+
+from dental_analysis import (
+    analyze_tooth_image,
+    create_downloadable_report,
+    generate_audio_bytes,
+    generate_audio_summary,
+)
+from image_prep import PrepConfig, prepare_image
+from image_quality import GATE_MODES, QualityConfig, QualityLog, assess_image
+from image_processing import image_fingerprint
+from locales import LANGUAGES, default_voice
+from audio_cache import AudioCache
+from openrouter_client import get_client
+from result_cache import ResultCache
+
+
+IMAGE_EXTENSIONS = {".png", ".jpg", ".jpeg", ".webp"}
+
+
+def collect_items(source):
+    """List (item_id, path) pairs from a directory or manifest file"""
+    if os.path.isdir(source):
+        items = []
+        for root, _, files in os.walk(source):
+            for name in sorted(files):
+                if os.path.splitext(name)[1].lower() in IMAGE_EXTENSIONS:
+                    path = os.path.join(root, name)
+                    items.append((os.path.relpath(path, source), path))
+        return sorted(items)
+
+    base = os.path.dirname(os.path.abspath(source))
+    items = []
+    with open(source, encoding="utf-8") as manifest:
+        for line in manifest:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            path = line if os.path.isabs(line) else os.path.join(base, line)
+            items.append((line, path))
+    return items
+
+
+def load_completed(output_path):
+    """IDs that already have a successful record in the output file"""
+    completed = set()
+    if not os.path.exists(output_path):
+        return completed
+    with open(output_path, encoding="utf-8") as output:
+        for line in output:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                # A partially written last line from an interrupted run
+                continue
+            if record.get("status") == "ok":
+                completed.add(record["id"])
+    return completed
+
+
+def ends_cleanly(path):
+    """False if the file's last line was cut off by an interrupted write"""
+    if not os.path.exists(path) or os.path.getsize(path) == 0:
+        return True
+    with open(path, "rb") as output:
+        output.seek(-1, os.SEEK_END)
+        return output.read(1) == b"\n"
+
+
+def safe_name(item_id):
+    return os.path.splitext(item_id)[0].replace(os.sep, "__").replace("/", "__")
+
+
+def process_item(item_id, path, args, api_key, cache, audio_cache, quality_log=None):
+    """Analyze one image and write its optional report/audio artifacts"""
+    started = time.monotonic()
+    record = {"id": item_id, "path": path}
+    try:
+        with Image.open(path) as image:
+            if args.quality_config.mode != "off":
+                quality = assess_image(image, args.quality_config)
+                record["quality"] = {"scores": quality.scores, "issues": quality.issues}
+                if quality_log is not None:
+                    with open(path, "rb") as source:
+                        quality_log.record(image_fingerprint(source.read()), quality, source="batch")
+                if not quality.passed and args.quality_config.mode == "reject":
+                    record["status"] = "rejected"
+                    record["latency_s"] = round(time.monotonic() - started, 3)
+                    return record
+            prepared = prepare_image(image, args.prep_config)
+        request_started = time.monotonic()
+        analysis = analyze_tooth_image(prepared, api_key, args.lang, cache=cache)
+        record["model_latency_s"] = round(time.monotonic() - request_started, 3)
+    except Exception as e:
+        analysis = {"error": f"{type(e).__name__}: {e}", "error_type": "local"}
+
+    if "error" in analysis:
+        record["status"] = "error"
+        record["error"] = analysis
+    else:
+        record["status"] = "ok"
+        record["analysis"] = analysis
+        record["summary"] = generate_audio_summary(analysis, args.lang)
+
+        if args.report_dir:
+            report_path = os.path.join(args.report_dir, f"{safe_name(item_id)}.txt")
+            with open(report_path, "w", encoding="utf-8") as report:
+                report.write(create_downloadable_report(analysis, args.lang))
+            record["report_path"] = report_path
+
+        if args.audio_dir:
+            try:
+                audio_bytes = generate_audio_bytes(record["summary"], args.voice, args.speed, cache=audio_cache)
+                audio_path = os.path.join(args.audio_dir, f"{safe_name(item_id)}.mp3")
+                with open(audio_path, "wb") as audio_file:
+                    audio_file.write(audio_bytes)
+                record["audio_path"] = audio_path
+            except Exception as e:
+                record["audio_error"] = f"{type(e).__name__}: {e}"
+
+    record["latency_s"] = round(time.monotonic() - started, 3)
+    return record
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def print_summary(records, skipped, elapsed):
+    ok = [r for r in records if r["status"] == "ok"]
+    latencies = [r["latency_s"] for r in records]
+    print(f"\nProcessed {len(records)} items in {elapsed:.1f}s ({skipped} skipped as already done)")
+    rejected = sum(1 for r in records if r["status"] == "rejected")
+    print(f"  succeeded: {len(ok)}  failed: {len(records) - len(ok) - rejected}  rejected by quality gate: {rejected}")
+    if records:
+        print(f"  throughput: {len(records) / elapsed:.2f} items/s")
+        print(
+            f"  latency: mean {statistics.mean(latencies):.2f}s  p50 {percentile(latencies, 0.5):.2f}s"
+            f"  p95 {percentile(latencies, 0.95):.2f}s  max {max(latencies):.2f}s"
+        )
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Batch-analyze dental images into a JSONL file.")
+    parser.add_argument("source", help="image directory or manifest file (one path per line)")
+    parser.add_argument("-o", "--output", default="results.jsonl", help="JSONL file results are appended to")
+    parser.add_argument("-c", "--concurrency", type=int, default=4, help="number of requests in flight")
+    parser.add_argument("-r", "--rate", type=float, default=0, help="max requests started per second (0 = unlimited)")
+    parser.add_argument("--lang", default="en", choices=LANGUAGES)
+    parser.add_argument("--api-key", default=None, help="defaults to OPENROUTER_API_KEY")
+    parser.add_argument("--report-dir", help="also write a text report per image here")
+    parser.add_argument("--audio-dir", help="also synthesize an MP3 summary per image here")
+    parser.add_argument("--voice", help="Edge TTS voice (default: the app's first voice for --lang)")
+    parser.add_argument("--speed", default="+0%")
+    parser.add_argument("--quality-gate", choices=GATE_MODES, help="local photo checks (default: QUALITY_GATE or warn)")
+    parser.add_argument("--no-cache", action="store_true", help="bypass the shared analysis and audio caches")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    load_dotenv()
+    args = parse_args(argv)
+    api_key = args.api_key or os.getenv("OPENROUTER_API_KEY")
+    if not api_key:
+        print("An OpenRouter API key is required (--api-key or OPENROUTER_API_KEY)", file=sys.stderr)
+        return 2
+
+    args.voice = args.voice or default_voice(args.lang)
+    args.prep_config = PrepConfig.from_env()
+    args.quality_config = QualityConfig.from_env()
+    if args.quality_gate:
+        args.quality_config.mode = args.quality_gate
+    for directory in (args.report_dir, args.audio_dir):
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    items = collect_items(args.source)
+    completed = load_completed(args.output)
+    todo = [(item_id, path) for item_id, path in items if item_id not in completed]
+    print(f"{len(items)} items, {len(items) - len(todo)} already done, {len(todo)} to process")
+
+    cache = None if args.no_cache else ResultCache()
+    audio_cache = None if args.no_cache or not args.audio_dir else AudioCache()
+    quality_log = QualityLog() if args.quality_config.mode != "off" else None
+
+    # Every model request goes through the process-wide scheduler, whose defaults
+    # (OPENROUTER_RATE/BURST/MAX_IN_FLIGHT) would otherwise cap these flags
+    client = get_client()
+    client.scheduler.configure(rate=args.rate, burst=1, max_in_flight=max(1, args.concurrency))
+    # Workers wait for the rate, not for other sessions, so no queue timeout
+    client.queue_timeout = None
+    records = []
+    started = time.monotonic()
+    cut_off = not ends_cleanly(args.output)
+
+    with open(args.output, "a", encoding="utf-8") as output, \
+            ThreadPoolExecutor(max_workers=max(1, args.concurrency)) as executor:
+        if cut_off:
+            # Otherwise the first new record would be glued to the broken line
+            output.write("\n")
+        futures = [
+            executor.submit(process_item, item_id, path, args, api_key, cache, audio_cache, quality_log)
+            for item_id, path in todo
+        ]
+        try:
+            for future in as_completed(futures):
+                record = future.result()
+                records.append(record)
+                # Flush each record so an interrupted run can resume from here
+                output.write(json.dumps(record, ensure_ascii=False) + "\n")
+                output.flush()
+                print(f"[{len(records)}/{len(todo)}] {record['status']:8} {record['latency_s']:6.2f}s  {record['id']}")
+        except KeyboardInterrupt:
+            for future in futures:
+                future.cancel()
+            print("Interrupted; re-run the same command to resume.", file=sys.stderr)
+
+    print_summary(records, len(items) - len(todo), time.monotonic() - started)
+    return 0 if all(r["status"] == "ok" for r in records) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+"""Tail latency of analyses with and without hedging to a backup model
+
+Usage:
+    python benchmarks/bench_hedging.py [--requests 200] [--warmup 30] [--concurrency 4]
+        [--primary-latency 0.2] [--primary-jitter 0.1] [--primary-tail-rate 0.1] [--primary-tail-latency 2]
+        [--backup-latency 0.4] [--backup-jitter 0.1] [--json out.json]
+
+Starts two mock chat-completions endpoints (benchmarks/mock_servers.py): a
+primary that is usually fast but sometimes very slow, and a slower but
+steady backup. The same analyses run once against the primary alone and once
+with hedging on; each run prints one JSON row with p50/p90/p99, how often the
+backup was started and won, and how many upstream streams were cancelled.
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from PIL import Image
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mock_servers import MockConfig, MockServers  # noqa: E402
+
+
+PRIMARY = "mock/primary"
+BACKUP = "mock/backup"
+
+
+def percentiles(samples):
+    ordered = sorted(samples)
+    pick = lambda q: ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+    return {
+        "n": len(ordered),
+        "mean_ms": round(1000 * sum(ordered) / len(ordered), 1),
+        **{f"p{int(q * 100)}_ms": round(1000 * pick(q), 1) for q in (0.5, 0.9, 0.99)},
+        "max_ms": round(1000 * ordered[-1], 1),
+    }
+
+
+def run(args, servers, hedge):
+    import model_registry
+    from dental_analysis import analyze_tooth_image
+
+    registry = model_registry.ModelRegistry(
+        [(PRIMARY, servers[0].base_url), (BACKUP, servers[1].base_url)],
+        hedge=hedge, hedge_delay=args.hedge_delay, min_samples=args.min_samples,
+    )
+    # The app builds its registry from the environment once; swap in this run's
+    model_registry._registry = registry
+    before = [dict(server.requests) for server in servers]
+
+    def analyze(index):
+        # A distinct image per call so request coalescing never merges two of them
+        image = Image.frombytes("RGB", (64, 48), random.Random(index).randbytes(64 * 48 * 3))
+        started = time.perf_counter()
+        result = analyze_tooth_image(image, "bench", "en", on_field=lambda key, value: None)
+        return time.perf_counter() - started, result
+
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        list(executor.map(analyze, range(args.warmup)))
+        measured = list(executor.map(analyze, range(args.warmup, args.warmup + args.requests)))
+    # Let cancelled streams reach the servers' counters
+    time.sleep(0.2)
+
+    stats = registry.stats()
+    upstream = lambda index, key: servers[index].requests[key] - before[index][key]
+    return {
+        "benchmark": "analyze_tooth_image",
+        "hedge": hedge,
+        "concurrency": args.concurrency,
+        "errors": sum(1 for _, result in measured if "error" in result),
+        **percentiles([duration for duration, _ in measured]),
+        "hedge_delay_ms": round(1000 * registry.hedge_delay(), 1),
+        "hedged": stats["hedged"],
+        "failovers": stats["failovers"],
+        "primary_wins": stats["primary_wins"],
+        "backup_wins": stats["backup_wins"],
+        "primary_requests": upstream(0, "chat"),
+        "backup_requests": upstream(1, "chat"),
+        "cancelled_streams": upstream(0, "chat_cancelled") + upstream(1, "chat_cancelled"),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--warmup", type=int, default=30, help="unmeasured calls that fill the latency window")
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--primary-latency", type=float, default=0.2)
+    parser.add_argument("--primary-jitter", type=float, default=0.1)
+    parser.add_argument("--primary-tail-rate", type=float, default=0.1)
+    parser.add_argument("--primary-tail-latency", type=float, default=2.0)
+    parser.add_argument("--backup-latency", type=float, default=0.4)
+    parser.add_argument("--backup-jitter", type=float, default=0.1)
+    parser.add_argument("--hedge-delay", type=float, default=1.0, help="delay before the primary has enough samples")
+    parser.add_argument("--min-samples", type=int, default=20)
+    parser.add_argument("--json", help="also write results to this file")
+    args = parser.parse_args(argv)
+
+    servers = [
+        MockServers(MockConfig(model_latency=args.primary_latency, model_latency_jitter=args.primary_jitter,
+                               model_tail_rate=args.primary_tail_rate, model_tail_latency=args.primary_tail_latency,
+                               seed=1)).start(),
+        MockServers(MockConfig(model_latency=args.backup_latency, model_latency_jitter=args.backup_jitter,
+                               seed=2)).start(),
+    ]
+    # Read at import time, so set before the app modules load
+    os.environ["OPENROUTER_BASE_URL"] = servers[0].base_url
+    os.environ.setdefault("OPENROUTER_RATE", "0")
+    os.environ.setdefault("OPENROUTER_MAX_IN_FLIGHT", "0")
+
+    results = []
+    try:
+        for hedge in (False, True):
+            row = run(args, servers, hedge)
+            results.append(row)
+            print(json.dumps(row), flush=True)
+    finally:
+        for server in servers:
+            server.stop()
+
+    if args.json:
+        with open(args.json, "w") as output:
+            json.dump(results, output, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""Per-rerun cost of the image processing panel, before and after caching
+
+Usage:
+    python benchmarks/bench_image_processing.py [--sizes 0.3 3 12 48] [--reruns 5] [--json out.json]
+
+Both paths render what the page shows, with Streamlit in bare mode (st.image
+still encodes each view). "before" replays the original code path:
+recompute grayscale, Canny and CLAHE, draw a 256-bin matplotlib histogram
+and render it to PNG the way st.pyplot does, without closing the figure,
+then st.image the three views. It needs matplotlib, which the app itself no
+longer depends on. "after" is the current path: hash the upload, look the
+panel up (computing it on the first run only) and render it with
+render_image_processing; the lookup alone is reported as well.
+"""
+import argparse
+import importlib.util
+import io
+import json
+import os
+import sys
+import time
+
+import cv2
+import numpy as np
+from PIL import Image
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from image_processing import PanelCache, image_fingerprint  # noqa: E402
+
+
+def make_upload(megapixels):
+    """Noisy synthetic JPEG of roughly the given size, as uploaded bytes"""
+    width = int((megapixels * 1e6 * 4 / 3) ** 0.5)
+    height = int(width * 3 / 4)
+    rng = np.random.default_rng(0)
+    pixels = rng.integers(0, 256, (height, width, 3), dtype=np.uint8)
+    buffered = io.BytesIO()
+    Image.fromarray(pixels).save(buffered, format="JPEG", quality=90)
+    return buffered.getvalue()
+
+
+def rerun_before(image):
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    import streamlit as st
+
+    img_cv = cv2.cvtColor(np.array(image), cv2.COLOR_RGB2BGR)
+    gray = cv2.cvtColor(img_cv, cv2.COLOR_BGR2GRAY)
+    edges = cv2.Canny(gray, 100, 200)
+    fig, ax = plt.subplots()
+    ax.hist(gray.ravel(), bins=256, range=(0, 256), color='gray')
+    fig.savefig(io.BytesIO(), format="png")
+    clahe_img = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8)).apply(gray)
+    for view in (gray, edges, clahe_img):
+        st.image(view, use_column_width=True, clamp=True)
+
+
+def lookup_after(cache, data, image):
+    return cache.get_or_compute(image_fingerprint(data), image)
+
+
+def rerun_after(cache, data, image):
+    from cavatyai.views import render_image_processing
+
+    render_image_processing(lookup_after(cache, data, image), "en")
+
+
+def time_call(fn, *args):
+    started = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - started
+
+
+def rss_mb():
+    try:
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    except ImportError:
+        return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=float, nargs="+", default=[0.3, 3, 12, 48], help="megapixels")
+    parser.add_argument("--reruns", type=int, default=5)
+    parser.add_argument("--json", help="also write results to this file")
+    args = parser.parse_args(argv)
+
+    import streamlit.logger
+    import cavatyai.views  # noqa: F401
+
+    # Bare mode warns on every element; Streamlit resets the level while importing
+    streamlit.logger.set_log_level("error")
+
+    have_matplotlib = importlib.util.find_spec("matplotlib") is not None
+    if not have_matplotlib:
+        print("matplotlib not installed; skipping the 'before' baseline")
+
+    results = []
+    for megapixels in args.sizes:
+        data = make_upload(megapixels)
+        image = Image.open(io.BytesIO(data)).convert("RGB")
+        row = {"megapixels": megapixels, "upload_bytes": len(data)}
+
+        if have_matplotlib:
+            before = [time_call(rerun_before, image) for _ in range(args.reruns)]
+            row["before_rerun_ms"] = round(1000 * sum(before) / len(before), 2)
+            row["rss_mb_after_before"] = rss_mb()
+
+        cache = PanelCache()
+        row["after_first_run_ms"] = round(1000 * time_call(rerun_after, cache, data, image), 2)
+        after = [time_call(rerun_after, cache, data, image) for _ in range(args.reruns)]
+        row["after_rerun_ms"] = round(1000 * sum(after) / len(after), 2)
+        lookups = [time_call(lookup_after, cache, data, image) for _ in range(args.reruns)]
+        row["after_lookup_ms"] = round(1000 * sum(lookups) / len(lookups), 2)
+        results.append(row)
+        print(json.dumps(row))
+
+    if args.json:
+        with open(args.json, "w") as output:
+            json.dump(results, output, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,231 @@
+"""End-to-end pipeline timings against local mock OpenRouter and Edge TTS servers
+
+Usage:
+    python benchmarks/bench_pipeline.py [--sizes 0.3 3 12 48] [--concurrency 1 4 16]
+        [--repeats 3] [--model-latency 0.2] [--model-error-rate 0] [--list-items 3]
+        [--tts-latency 0.05] [--audio-bytes 48000] [--stream] [--json out.json]
+
+Nothing leaves the machine: the chat-completions endpoint and the TTS
+websocket are served by benchmarks/mock_servers.py. Per image size it times
+encode_image, show_image_processing (cold and cached, in Streamlit bare
+mode) and analyze_tooth_image; per concurrency level it runs that many
+analyses, encodes and syntheses at once. Parsing, generate_audio_summary and
+create_downloadable_report are timed against mock payloads of several sizes.
+Every row is printed as one JSON object.
+"""
+import argparse
+import io
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import cv2
+import numpy as np
+from PIL import Image
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mock_servers import MockConfig, MockServers, mock_analysis  # noqa: E402
+
+
+def make_photo(megapixels, seed=0):
+    """Smooth synthetic JPEG with mild noise (compresses like a photo), as uploaded bytes"""
+    width = int((megapixels * 1e6 * 4 / 3) ** 0.5)
+    height = int(width * 3 / 4)
+    rng = np.random.default_rng(seed)
+    coarse = rng.integers(0, 256, (12, 16, 3), dtype=np.uint8)
+    pixels = cv2.resize(coarse, (width, height), interpolation=cv2.INTER_CUBIC)
+    pixels = cv2.add(pixels, rng.integers(0, 12, (height, width, 3), dtype=np.uint8))
+    buffered = io.BytesIO()
+    Image.fromarray(pixels).save(buffered, format="JPEG", quality=90)
+    return buffered.getvalue()
+
+
+def open_upload(data):
+    image = Image.open(io.BytesIO(data))
+    image.load()
+    return image
+
+
+def time_call(fn, *args, **kwargs):
+    started = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return time.perf_counter() - started, result
+
+
+def summarize(samples):
+    """Mean, p50, p95 and max of durations in seconds, as milliseconds"""
+    ordered = sorted(samples)
+    pick = lambda q: ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+    return {
+        "n": len(ordered),
+        "mean_ms": round(1000 * sum(ordered) / len(ordered), 2),
+        "p50_ms": round(1000 * pick(0.5), 2),
+        "p95_ms": round(1000 * pick(0.95), 2),
+        "max_ms": round(1000 * ordered[-1], 2),
+    }
+
+
+def run_concurrently(fn, inputs, concurrency):
+    """Call ``fn`` on every input with ``concurrency`` threads; per-call durations and wall time"""
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        started = time.perf_counter()
+        results = list(executor.map(lambda item: time_call(fn, item), inputs))
+        wall = time.perf_counter() - started
+    return [duration for duration, _ in results], [result for _, result in results], wall
+
+
+def bench_sizes(args, emit):
+    import streamlit.logger
+    from cavatyai.views import show_image_processing
+    from dental_analysis import analyze_tooth_image, encode_image
+    from image_prep import PrepConfig, prepare_image
+    from image_processing import image_fingerprint
+
+    # Bare mode warns on every element; Streamlit resets the level while importing
+    streamlit.logger.set_log_level("error")
+    prep_config = PrepConfig.from_env()
+    for megapixels in args.sizes:
+        data = make_photo(megapixels)
+        image = open_upload(data)
+        base = {"megapixels": megapixels, "upload_bytes": len(data)}
+
+        encodes = [time_call(encode_image, open_upload(data), prep_config)[0] for _ in range(args.repeats)]
+        encoded_bytes = len(prepare_image(open_upload(data), prep_config).data)
+        emit({"benchmark": "encode_image", **base, "encoded_bytes": encoded_bytes, **summarize(encodes)})
+
+        # A fresh key per repeat forces the cold path; reusing one measures a rerun
+        cold = [time_call(show_image_processing, [image], "en", [f"bench-{megapixels}-{index}"], [])[0]
+                for index in range(args.repeats)]
+        emit({"benchmark": "show_image_processing", "cache": "cold", **base, **summarize(cold)})
+        key = image_fingerprint(data)
+        show_image_processing([image], "en", [key], [])
+        warm = [time_call(show_image_processing, [image], "en", [key], [])[0] for _ in range(args.repeats)]
+        emit({"benchmark": "show_image_processing", "cache": "warm", **base, **summarize(warm)})
+
+        on_field = (lambda key, value: None) if args.stream else None
+        analyses = [time_call(analyze_tooth_image, image, "bench", "en", prep_config=prep_config, on_field=on_field)
+                    for _ in range(args.repeats)]
+        errors = sum(1 for _, result in analyses if "error" in result)
+        emit({"benchmark": "analyze_tooth_image", **base, "stream": args.stream, "errors": errors,
+              **summarize([duration for duration, _ in analyses])})
+
+
+def bench_concurrency(args, servers, emit):
+    from dental_analysis import analyze_tooth_image, encode_image, generate_audio_bytes
+    from image_prep import PrepConfig
+
+    prep_config = PrepConfig.from_env()
+    on_field = (lambda key, value: None) if args.stream else None
+    for concurrency in args.concurrency:
+        # Distinct images and texts so request coalescing cannot merge the calls
+        uploads = [make_photo(args.concurrency_size, seed=seed) for seed in range(concurrency)]
+        base = {"concurrency": concurrency, "megapixels": args.concurrency_size}
+
+        durations, _, wall = run_concurrently(lambda data: encode_image(open_upload(data), prep_config),
+                                              uploads, concurrency)
+        emit({"benchmark": "encode_image", **base, "wall_ms": round(1000 * wall, 2),
+              "per_s": round(concurrency / wall, 2), **summarize(durations)})
+
+        chat_before = servers.requests["chat"]
+        images = [open_upload(data) for data in uploads]
+        durations, results, wall = run_concurrently(
+            lambda image: analyze_tooth_image(image, "bench", "en", prep_config=prep_config, on_field=on_field),
+            images, concurrency)
+        errors = sum(1 for result in results if "error" in result)
+        emit({"benchmark": "analyze_tooth_image", **base, "stream": args.stream, "errors": errors,
+              "upstream_requests": servers.requests["chat"] - chat_before,
+              "wall_ms": round(1000 * wall, 2), "per_s": round(concurrency / wall, 2), **summarize(durations)})
+
+        texts = [f"Dental Analysis Summary number {index}. Cavity stage: Stage 2." for index in range(concurrency)]
+
+        def synthesize(text):
+            try:
+                return generate_audio_bytes(text, "en-US-AriaNeural", "+0%")
+            except Exception as e:
+                return e
+
+        durations, results, wall = run_concurrently(synthesize, texts, concurrency)
+        errors = sum(1 for result in results if isinstance(result, Exception))
+        emit({"benchmark": "generate_audio_bytes", "concurrency": concurrency, "errors": errors,
+              "wall_ms": round(1000 * wall, 2), "per_s": round(concurrency / wall, 2), **summarize(durations)})
+
+
+def bench_text(args, emit):
+    from dental_analysis import create_downloadable_report, generate_audio_summary
+    from response_parser import parse_analysis_response
+
+    iterations = max(20, args.repeats * 20)
+    for list_items in sorted({1, args.list_items, args.list_items * 10}):
+        for views in (1, 4):
+            labels = [f"View {index + 1}" for index in range(views)] if views > 1 else ()
+            analysis = mock_analysis(list_items, labels)
+            content = json.dumps(analysis)
+            base = {"list_items": list_items, "views": views, "payload_bytes": len(content.encode("utf-8"))}
+
+            parses = [time_call(parse_analysis_response, content)[0] for _ in range(iterations)]
+            emit({"benchmark": "parse_analysis_response", "input": "valid", **base, **summarize(parses)})
+            # Cut off mid-way, as a hit max_tokens would, to exercise the repair path
+            truncated = content[:len(content) * 2 // 3]
+            repairs = [time_call(parse_analysis_response, truncated)[0] for _ in range(iterations)]
+            emit({"benchmark": "parse_analysis_response", "input": "truncated", **base, **summarize(repairs)})
+
+            summaries = [time_call(generate_audio_summary, analysis, "en")[0] for _ in range(iterations)]
+            emit({"benchmark": "generate_audio_summary", **base, **summarize(summaries)})
+            reports = [time_call(create_downloadable_report, analysis, "en")[0] for _ in range(iterations)]
+            emit({"benchmark": "create_downloadable_report", **base, **summarize(reports)})
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=float, nargs="+", default=[0.3, 3, 12, 48], help="megapixels")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--concurrency-size", type=float, default=3, help="megapixels of the concurrent uploads")
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--stream", action="store_true", help="stream analyses (the app's on_field path)")
+    parser.add_argument("--model-latency", type=float, default=0.2)
+    parser.add_argument("--model-error-rate", type=float, default=0.0)
+    parser.add_argument("--list-items", type=int, default=MockConfig.list_items)
+    parser.add_argument("--tts-latency", type=float, default=0.05)
+    parser.add_argument("--tts-error-rate", type=float, default=0.0)
+    parser.add_argument("--audio-bytes", type=int, default=MockConfig.audio_bytes)
+    parser.add_argument("--json", help="also write results to this file")
+    args = parser.parse_args(argv)
+
+    servers = MockServers(MockConfig(
+        model_latency=args.model_latency,
+        model_error_rate=args.model_error_rate,
+        list_items=args.list_items,
+        tts_latency=args.tts_latency,
+        tts_error_rate=args.tts_error_rate,
+        audio_bytes=args.audio_bytes,
+    )).start()
+    # Read at import time, so set before the app modules load. The scheduler
+    # is opened up unless asked otherwise so it does not cap the concurrency runs.
+    os.environ["OPENROUTER_BASE_URL"] = servers.base_url
+    os.environ.setdefault("OPENROUTER_RATE", "0")
+    os.environ.setdefault("OPENROUTER_MAX_IN_FLIGHT", "0")
+    servers.patch_edge_tts()
+
+    results = []
+
+    def emit(row):
+        results.append(row)
+        print(json.dumps(row), flush=True)
+
+    try:
+        bench_text(args, emit)
+        bench_sizes(args, emit)
+        bench_concurrency(args, servers, emit)
+    finally:
+        servers.stop()
+
+    if args.json:
+        with open(args.json, "w") as output:
+            json.dump(results, output, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Fail when importing the app gets slower or starts loading the heavy stack
+
+Usage:
+    python benchmarks/check_import_time.py [--module cavatyai.app] [--budget-ms 750]
+        [--forbid cv2 numpy requests aiohttp edge_tts pandas] [--runs 3] [--top 15] [--json out.json]
+
+Imports ``--module`` in fresh interpreters under ``python -X importtime``
+and keeps the fastest run. Prints the total, the slowest modules and the
+peak RSS as one JSON object, and exits 1 when the total exceeds the budget
+or any ``--forbid`` module was imported: those should only load once a user
+uploads a photo, not on the first page render of a new replica.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_FORBIDDEN = ["cv2", "numpy", "requests", "aiohttp", "edge_tts", "pandas"]
+
+# Runs in the child after the import, so the RSS includes everything it loaded
+REPORT_RSS = "import resource, sys; print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss, file=sys.stdout)"
+
+
+def parse_importtime(stderr):
+    """``[(name, self_us, cumulative_us, depth)]`` from ``-X importtime`` output"""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip(" ")) - 1) // 2
+        rows.append((name.strip(), int(self_us), int(cumulative_us), depth))
+    return rows
+
+
+def measure(module):
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}; {REPORT_RSS}"],
+        cwd=REPO_ROOT, capture_output=True, text=True, check=True,
+    )
+    rows = parse_importtime(completed.stderr)
+    return {
+        "total_ms": round(sum(cumulative for _, _, cumulative, depth in rows if depth == 0) / 1000, 1),
+        # ru_maxrss is KiB on Linux
+        "rss_mb": round(int(completed.stdout.split()[-1]) / 1024, 1),
+        "rows": rows,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--module", default="cavatyai.app")
+    parser.add_argument("--budget-ms", type=float, default=750)
+    parser.add_argument("--forbid", nargs="*", default=DEFAULT_FORBIDDEN)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--json", help="also write the result to this file")
+    args = parser.parse_args(argv)
+
+    best = min((measure(args.module) for _ in range(args.runs)), key=lambda run: run["total_ms"])
+    imported = {name for name, _, _, _ in best["rows"]}
+    forbidden = sorted(name for name in args.forbid if name in imported)
+    slowest = sorted(best["rows"], key=lambda row: row[1], reverse=True)[:args.top]
+
+    result = {
+        "module": args.module,
+        "total_ms": best["total_ms"],
+        "budget_ms": args.budget_ms,
+        "rss_mb": best["rss_mb"],
+        "modules": len(best["rows"]),
+        "forbidden_imported": forbidden,
+        "slowest_self_ms": {name: round(self_us / 1000, 1) for name, self_us, _, _ in slowest},
+        "ok": best["total_ms"] <= args.budget_ms and not forbidden,
+    }
+    print(json.dumps(result, indent=2))
+    if args.json:
+        with open(args.json, "w") as output:
+            json.dump(result, output, indent=2)
+    return 0 if result["ok"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,275 @@
+"""Local aiohttp stand-ins for OpenRouter chat completions and the Edge TTS websocket
+
+Usage (standalone, e.g. to point the app at it):
+    python benchmarks/mock_servers.py --model-latency 1.5 --tts-latency 0.3
+    python benchmarks/mock_servers.py --port 8766 --model-latency 0.8 --model-tail-rate 0.2
+    OPENROUTER_BASE_URL=http://127.0.0.1:8765/api/v1 streamlit run app.py
+
+Both servers share one event loop on a background thread. Latency, error
+rate and payload sizes are configurable so benchmarks can exercise slow,
+flaky or verbose upstreams without network access.
+"""
+import argparse
+import asyncio
+import json
+import random
+import threading
+import time
+import uuid
+from collections import deque
+from dataclasses import dataclass
+
+from aiohttp import WSMsgType, web
+
+
+@dataclass
+class MockConfig:
+    """Behaviour of the mock upstreams"""
+    model_latency: float = 0.5
+    # Extra uniform 0..jitter delay, and a share of requests that take tail_latency instead
+    model_latency_jitter: float = 0.0
+    model_tail_rate: float = 0.0
+    model_tail_latency: float = 5.0
+    model_error_rate: float = 0.0
+    # Items per list field in the analysis JSON; larger values mean bigger completions
+    list_items: int = 3
+    stream_chunk_chars: int = 24
+    tts_latency: float = 0.1
+    tts_error_rate: float = 0.0
+    audio_bytes: int = 48_000
+    audio_chunk_bytes: int = 4096
+    seed: int = 0
+
+
+def mock_analysis(list_items=3, per_image_labels=()):
+    """Deterministic analysis JSON shaped like the real model output"""
+    items = lambda prefix: [f"{prefix} {index + 1}" for index in range(list_items)]
+    analysis = {
+        "cavity_stage": "Stage 2 - Dentin decay",
+        "cavity_present": True,
+        "affected_teeth": ["14", "15"][:max(1, min(2, list_items))],
+        "severity_level": "Moderate",
+        "visible_issues": items("Visible issue"),
+        "possible_causes": items("Possible cause"),
+        "immediate_concerns": items("Concern"),
+        "recommended_treatments": items("Treatment"),
+        "prevention_tips": items("Prevention tip"),
+        "emergency_level": "Medium",
+        "estimated_timeline": "Several months",
+        "prognosis": "Good with a filling; worsens without treatment",
+        "home_care_instructions": items("Home care step"),
+        "when_to_see_dentist": "Within 2 weeks",
+        # Non-ASCII on purpose: real answers in hi/ta/es are, and SSE must be read as UTF-8
+        "additional_notes": "Mock response – नमूना उत्तर",
+    }
+    if per_image_labels:
+        analysis["per_image"] = [dict(analysis, label=label) for label in per_image_labels]
+    return analysis
+
+
+def fake_mp3(size):
+    """Bytes that pass the MP3 sniffing in audio_cache (ID3 header + padding)"""
+    return b"ID3\x04\x00\x00\x00\x00\x00\x00" + bytes(max(0, size - 10))
+
+
+class MockServers:
+    """Runs the mock chat-completions and TTS servers on a background loop"""
+
+    def __init__(self, config=None, host="127.0.0.1", port=0):
+        self.config = config or MockConfig()
+        self.host = host
+        self.port = port
+        self.requests = {"chat": 0, "chat_errors": 0, "chat_cancelled": 0, "tts": 0, "tts_errors": 0}
+        # Canned chat responses served in order before the configured behaviour
+        self.script = deque()
+        self._random = random.Random(self.config.seed)
+        self._loop = None
+        self._runner = None
+        self._thread = None
+
+    @property
+    def base_url(self):
+        return f"http://{self.host}:{self.port}/api/v1"
+
+    @property
+    def tts_url(self):
+        # edge_tts appends "&ConnectionId=..." so the URL must already carry a query
+        return f"ws://{self.host}:{self.port}/tts?TrustedClientToken=mock"
+
+    def respond(self, status, body=None, headers=None, delay=0.0):
+        """Queue one canned chat response, e.g. a 429 with a Retry-After header"""
+        if body is None:
+            body = json.dumps({"error": {"message": f"mock status {status}"}})
+        self.script.append((status, body, headers or {}, delay))
+        return self
+
+    def _fail(self, rate):
+        return rate and self._random.random() < rate
+
+    def _model_delay(self):
+        config = self.config
+        if self._fail(config.model_tail_rate):
+            return config.model_tail_latency
+        return config.model_latency + self._random.uniform(0, config.model_latency_jitter)
+
+    async def _chat(self, request):
+        self.requests["chat"] += 1
+        body = await request.json()
+        if self.script:
+            status, text, headers, delay = self.script.popleft()
+            if status != 200:
+                self.requests["chat_errors"] += 1
+            await asyncio.sleep(delay)
+            return web.Response(status=status, text=text, headers=headers)
+        delay = self._model_delay()
+        failed = self._fail(self.config.model_error_rate)
+        if failed:
+            self.requests["chat_errors"] += 1
+
+        message = body["messages"][0]["content"]
+        if isinstance(message, str) and message.startswith("Translate each string"):
+            texts = json.loads(message[message.index("\n\n") + 2:])
+            content = json.dumps([f"[{body.get('model')}] {text}" for text in texts], ensure_ascii=False)
+        else:
+            # Image labels arrive as "Image N: label" text parts after the prompt
+            labels = [part["text"].split(": ", 1)[1] for part in message[1:] if part.get("type") == "text"]
+            content = json.dumps(mock_analysis(self.config.list_items, labels), ensure_ascii=False)
+
+        if failed or not body.get("stream"):
+            await asyncio.sleep(delay)
+            if failed:
+                return web.json_response({"error": {"message": "mock upstream failure"}}, status=503)
+            return web.json_response({"choices": [{"message": {"role": "assistant", "content": content}}]})
+
+        # Like OpenRouter, a stream answers at once and sends keep-alive comments while the model works
+        response = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+        await response.prepare(request)
+        try:
+            deadline = time.monotonic() + delay
+            while True:
+                await response.write(b": OPENROUTER PROCESSING\n\n")
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                await asyncio.sleep(min(0.05, remaining))
+            step = self.config.stream_chunk_chars
+            for start in range(0, len(content), step):
+                event = {"choices": [{"delta": {"content": content[start:start + step]}}]}
+                await response.write(f"data: {json.dumps(event, ensure_ascii=False)}\n\n".encode("utf-8"))
+            await response.write(b"data: [DONE]\n\n")
+            await response.write_eof()
+        except ConnectionResetError:
+            # The client hung up, e.g. the losing side of a hedged request
+            self.requests["chat_cancelled"] += 1
+        return response
+
+    async def _models(self, request):
+        return web.json_response({"data": []})
+
+    async def _tts(self, request):
+        self.requests["tts"] += 1
+        websocket = web.WebSocketResponse()
+        await websocket.prepare(request)
+        request_id = uuid.uuid4().hex
+
+        # The client sends speech.config, then the SSML; answer after the SSML
+        received = 0
+        async for message in websocket:
+            if message.type != WSMsgType.TEXT:
+                continue
+            received += 1
+            if received < 2:
+                continue
+
+            await asyncio.sleep(self.config.tts_latency)
+            if self._fail(self.config.tts_error_rate):
+                self.requests["tts_errors"] += 1
+                await websocket.close(code=1011, message=b"mock tts failure")
+                break
+
+            await websocket.send_str(
+                f"X-RequestId:{request_id}\r\nContent-Type:application/json; charset=utf-8\r\n"
+                "Path:turn.start\r\n\r\n{}"
+            )
+            audio = fake_mp3(self.config.audio_bytes)
+            headers = f"X-RequestId:{request_id}\r\nContent-Type:audio/mpeg\r\nPath:audio\r\n".encode("ascii")
+            for start in range(0, len(audio), self.config.audio_chunk_bytes):
+                chunk = audio[start:start + self.config.audio_chunk_bytes]
+                await websocket.send_bytes(len(headers).to_bytes(2, "big") + headers + chunk)
+            await websocket.send_str(f"X-RequestId:{request_id}\r\nPath:turn.end\r\n\r\n{{}}")
+            break
+        await websocket.close()
+        return websocket
+
+    def _app(self):
+        app = web.Application(client_max_size=256 * 1024 * 1024)
+        app.router.add_post("/api/v1/chat/completions", self._chat)
+        app.router.add_get("/api/v1/models", self._models)
+        app.router.add_get("/tts", self._tts)
+        return app
+
+    def start(self):
+        """Start serving; returns once the port is bound"""
+        async def serve():
+            self._runner = web.AppRunner(self._app(), access_log=None)
+            await self._runner.setup()
+            site = web.TCPSite(self._runner, self.host, self.port)
+            await site.start()
+            self.port = site._server.sockets[0].getsockname()[1]
+
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="mock-servers", daemon=True)
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(serve(), self._loop).result()
+        return self
+
+    def stop(self):
+        if self._loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(self._runner.cleanup(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop = None
+
+    def patch_edge_tts(self):
+        """Point edge_tts at the mock websocket (it reads WSS_URL at call time)"""
+        import edge_tts.communicate
+
+        edge_tts.communicate.WSS_URL = self.tts_url
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the mock OpenRouter and Edge TTS servers.")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--model-latency", type=float, default=MockConfig.model_latency)
+    parser.add_argument("--model-latency-jitter", type=float, default=MockConfig.model_latency_jitter)
+    parser.add_argument("--model-tail-rate", type=float, default=MockConfig.model_tail_rate)
+    parser.add_argument("--model-tail-latency", type=float, default=MockConfig.model_tail_latency)
+    parser.add_argument("--model-error-rate", type=float, default=MockConfig.model_error_rate)
+    parser.add_argument("--list-items", type=int, default=MockConfig.list_items)
+    parser.add_argument("--tts-latency", type=float, default=MockConfig.tts_latency)
+    parser.add_argument("--tts-error-rate", type=float, default=MockConfig.tts_error_rate)
+    parser.add_argument("--audio-bytes", type=int, default=MockConfig.audio_bytes)
+    args = parser.parse_args(argv)
+
+    servers = MockServers(MockConfig(
+        model_latency=args.model_latency,
+        model_latency_jitter=args.model_latency_jitter,
+        model_tail_rate=args.model_tail_rate,
+        model_tail_latency=args.model_tail_latency,
+        model_error_rate=args.model_error_rate,
+        list_items=args.list_items,
+        tts_latency=args.tts_latency,
+        tts_error_rate=args.tts_error_rate,
+        audio_bytes=args.audio_bytes,
+    ), port=args.port).start()
+    print(f"chat completions: {servers.base_url}\nedge tts websocket: {servers.tts_url}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        servers.stop()
+
+
+if __name__ == "__main__":
+    main()
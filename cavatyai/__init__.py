@@ -0,0 +1,7 @@
+"""Streamlit front end of the dental analysis portal
+
+``app.py`` at the repository root is only the ``streamlit run`` entry point;
+the page lives in ``cavatyai.app``. Modules here import the heavy backends
+(OpenCV, requests, aiohttp, Edge TTS) inside the functions that need them,
+so the first page load of a fresh process does not pay for them.
+"""
@@ -0,0 +1,444 @@
+"""The dental analysis page: sidebar settings, upload flow and results"""
+import os
+
+import streamlit as st
+from dotenv import load_dotenv
+
+from cavatyai.pipeline import run_analysis_pipeline
+from cavatyai.resources import (
+    METRICS_PORT,
+    SHOW_DIAGNOSTICS,
+    WARMUP_ON_START,
+    get_audio_cache,
+    get_job_queue,
+    get_metrics_server,
+    get_quality_log,
+    get_result_cache,
+    get_translation_cache,
+    get_warmup_report,
+)
+from cavatyai.translations import t
+from cavatyai.views import (
+    assess_uploads,
+    poll_analysis_job,
+    render_analysis_outputs,
+    show_analysis_error,
+    show_degraded_mode,
+    show_image_processing,
+)
+from circuit_breaker import breaker_states
+from image_prep import PrepConfig, prepare_image
+from image_quality import QualityConfig
+from job_queue import FAILED, JobQueueFull
+from locales import voices
+from metrics import gauge_snapshot, stage_summary
+from response_parser import parse_stats
+from scheduler import PRIORITY_EMERGENCY, PRIORITY_NORMAL
+from stage_graph import StageGraph, fingerprint
+
+load_dotenv()
+
+# Render analysis fields as the model streams them (set OPENROUTER_STREAM=0 to disable)
+STREAM_ANALYSIS = os.getenv("OPENROUTER_STREAM", "1") != "0"
+
+# Session state key of the background job this session is waiting for
+ANALYSIS_JOB_KEY = "analysis_job"
+
+# Custom CSS for better styling
+PAGE_CSS = """
+<style>
+    .main-header {
+        font-size: 3rem;
+        font-weight: bold;
+        text-align: center;
+        color: #2E86AB;
+        margin-bottom: 2rem;
+    }
+    .info-card {
+        background-color: #f0f8ff;
+        padding: 1.5rem;
+        border-radius: 10px;
+        border-left: 5px solid #2E86AB;
+        margin: 1rem 0;
+    }
+    .warning-card {
+        background-color: #fff5f5;
+        padding: 1.5rem;
+        border-radius: 10px;
+        border-left: 5px solid #e53e3e;
+        margin: 1rem 0;
+    }
+    .success-card {
+        background-color: #f0fff4;
+        padding: 1.5rem;
+        border-radius: 10px;
+        border-left: 5px solid #38a169;
+        margin: 1rem 0;
+    }
+    .cavity-stage {
+        font-size: 1.5rem;
+        font-weight: bold;
+        padding: 0.5rem;
+        border-radius: 5px;
+        text-align: center;
+        margin: 1rem 0;
+    }
+    .stage-0 { background-color: #c6f6d5; color: #22543d; }
+    .stage-1 { background-color: #fed7d7; color: #742a2a; }
+    .stage-2 { background-color: #fbb6ce; color: #702459; }
+    .stage-3 { background-color: #fc8181; color: #742a2a; }
+    .stage-4 { background-color: #e53e3e; color: white; }
+    .audio-section {
+        background-color: #f8f9ff;
+        padding: 1.5rem;
+        border-radius: 10px;
+        border-left: 5px solid #4c51bf;
+        margin: 1rem 0;
+    }
+</style>
+"""
+
+
+def setup_page():
+    """Page config, session defaults and CSS; must run first on every rerun"""
+    st.set_page_config(
+        page_title="🦷 Dental Analysis Portal",
+        page_icon="🦷",
+        layout="wide",
+        initial_sidebar_state="expanded"
+    )
+
+    # Initialize session state for language
+    if 'language' not in st.session_state:
+        st.session_state.language = 'en'
+
+    st.markdown(PAGE_CSS, unsafe_allow_html=True)
+
+
+def collect_analysis_job(job, graph, image_keys, labels, lang):
+    """Seed the stage graph from a finished job"""
+    if job.status == FAILED:
+        st.error(t("job_failed", lang))
+        return
+    results = job.result
+    analysis = results["analysis"]
+    if "error" in analysis:
+        st.header(t("analysis_failed", lang))
+        show_analysis_error(analysis, lang)
+        return
+
+    # The job may have been started in another language or voice than the page now shows
+    context = job.context
+    graph.put("source_analysis", [image_keys, labels], {"lang": context["lang"], "analysis": analysis})
+    graph.put("analysis", [graph.output("source_analysis"), context["lang"]], analysis)
+    graph.put("summary", [graph.output("analysis"), context["lang"]], results["summary"])
+    audio_inputs = [graph.output("summary"), context["voice"], context["speed"]]
+    if results.get("audio"):
+        graph.put("audio", audio_inputs, results["audio"])
+    elif "audio_error" in results:
+        # The worker already waited for TTS to fail; don't make the page wait for it again
+        graph.put("audio", audio_inputs, None, error=results["audio_error"])
+
+
+def show_saved_job(lang):
+    """Show the job named in the URL, for a page reloaded without its uploads"""
+    job_id = st.query_params.get("job")
+    job = get_job_queue().get(job_id) if job_id else None
+    if job is None:
+        return
+    if not job.done.is_set():
+        poll_analysis_job(job, lang)
+        return
+    if job.status == FAILED:
+        st.error(t("job_failed", lang))
+        return
+
+    results = job.result
+    if "error" in results["analysis"]:
+        st.header(t("analysis_failed", lang))
+        show_analysis_error(results["analysis"], lang)
+        return
+    st.info(t("job_resumed", lang))
+    render_analysis_outputs(results["analysis"], results["summary"], results.get("audio"), job.context["lang"])
+
+
+def show_diagnostics(quality_config):
+    """Operator panels in the sidebar (English only, shown with SHOW_DIAGNOSTICS=1)"""
+    with st.expander("Image quality"):
+        st.json({"thresholds": quality_config.__dict__, **get_quality_log().stats()})
+
+    with st.expander("Stage latency"):
+        st.json(stage_summary())
+
+    # Empty until the first request loads the client and the analysis module
+    with st.expander("Request scheduler"):
+        st.json(gauge_snapshot("scheduler"))
+
+    with st.expander("Background jobs"):
+        st.json(get_job_queue().stats())
+
+    with st.expander("Circuit breakers"):
+        st.json(breaker_states())
+
+    with st.expander("Models"):
+        st.json(gauge_snapshot("models"))
+
+    with st.expander("Request coalescing"):
+        st.json({"analysis": gauge_snapshot("analysis_flight"), "tts": gauge_snapshot("tts_flight")})
+
+    with st.expander("Analysis cache"):
+        st.json(get_result_cache().stats())
+
+    with st.expander("Audio cache"):
+        st.json(get_audio_cache().stats())
+
+    with st.expander("Download artifacts"):
+        st.json(gauge_snapshot("artifacts"))
+
+    with st.expander("Response parsing"):
+        st.json(parse_stats.snapshot())
+
+    if WARMUP_ON_START:
+        with st.expander("Warm-up"):
+            st.json(get_warmup_report())
+
+
+def main():
+    setup_page()
+    lang = st.session_state.language
+
+    if WARMUP_ON_START:
+        get_warmup_report()
+    if METRICS_PORT:
+        get_metrics_server()
+    
+    # Header
+    st.markdown(f'<h1 class="main-header">{t("main_header", lang)}</h1>', unsafe_allow_html=True)
+    
+    # Sidebar
+    with st.sidebar:
+        st.header(t("config", lang))
+        
+        # Language Selection
+        st.header(t("language_selection", lang))
+        language_options = {
+            "English": "en",
+            "हिन्दी (Hindi)": "hi",
+            "Español (Spanish)": "es",
+            "தமிழ் (Tamil)": "ta"
+        }
+        selected_lang = st.selectbox(
+            "Select Language",
+            list(language_options.keys()),
+            index=list(language_options.values()).index(st.session_state.language)
+        )
+        
+        if language_options[selected_lang] != st.session_state.language:
+            st.session_state.language = language_options[selected_lang]
+            st.rerun()
+        
+        lang = st.session_state.language
+        
+        # API Key
+        if "OPENROUTER_API_KEY" in os.environ:
+            api_key = os.getenv("OPENROUTER_API_KEY")
+            st.success(t("api_key_found", lang))
+        else:
+            st.warning(t("api_key_not_found", lang))
+            api_key = st.text_input(t("api_key_label", lang), type="password")
+
+        st.header(t("audio_settings", lang))
+        
+        # Voice options based on language
+        current_voices = voices(lang)
+        selected_voice = st.selectbox(t("voice_selection", lang), list(current_voices.keys()))
+        audio_speed = st.selectbox(t("speech_speed", lang), ["-20%", "-10%", "+0%", "+10%", "+20%"], index=2)
+        
+        st.header(t("instructions", lang))
+        st.markdown(t("instructions_text", lang))
+        
+        st.header(t("disclaimer", lang))
+        st.warning(t("disclaimer_text", lang))
+
+        # Payload settings are the operator's (IMAGE_* environment variables), not the patient's
+        prep_config = PrepConfig.from_env()
+        quality_config = QualityConfig.from_env()
+        if SHOW_DIAGNOSTICS:
+            show_diagnostics(quality_config)
+    
+    # Main content area
+    if not api_key:
+        st.markdown(f"""
+        <div class="info-card">
+            <h3>{t("welcome_title", lang)}</h3>
+            <p>{t("welcome_text", lang)}</p>
+            <p>{t("enter_api_key", lang)}</p>
+        </div>
+        """, unsafe_allow_html=True)
+        return
+    
+    # Local image processing and quality checks keep working while an upstream is down
+    show_degraded_mode(lang)
+
+    # File upload; several views of one patient are analyzed together
+    uploaded_files = st.file_uploader(
+        t("upload_image", lang), 
+        type=['png', 'jpg', 'jpeg'],
+        accept_multiple_files=True,
+        help=t("upload_help", lang)
+    )
+    
+    if uploaded_files:
+        # The image and model stack loads with the first upload, not with the page
+        from PIL import Image
+
+        from dental_analysis import audio_error_message, generate_audio_bytes, generate_audio_summary
+        from image_processing import image_fingerprint
+        from localization import localize_analysis
+
+        # Display uploaded images
+        images = [Image.open(uploaded_file) for uploaded_file in uploaded_files]
+        image_keys = [image_fingerprint(uploaded_file.getvalue()) for uploaded_file in uploaded_files]
+        
+        if len(images) == 1:
+            labels = []
+            col1, col2, col3 = st.columns([1, 2, 1])
+            with col2:
+                st.image(images[0], caption=t("uploaded_image", lang), use_column_width=True)
+        else:
+            # Each view gets a label that is sent to the model with the image
+            default_views = t("default_views", lang)
+            labels = []
+            columns = st.columns(min(len(images), 4))
+            for index, (image, uploaded_file) in enumerate(zip(images, uploaded_files)):
+                with columns[index % len(columns)]:
+                    st.image(image, use_column_width=True)
+                    default = default_views[index] if index < len(default_views) else os.path.splitext(uploaded_file.name)[0]
+                    labels.append(st.text_input(
+                        t("image_label", lang), value=default, key=f"image_label_{index}_{image_keys[index]}",
+                    ).strip() or f"Image {index + 1}")
+        
+        # Local OpenCV views, drawn from the panel cache whether or not a job is running
+        show_image_processing(images, lang, image_keys, labels)
+
+        graph = StageGraph(st.session_state)
+        voice_name = current_voices[selected_voice]
+
+        # Resizing a 48 MP photo is not free, so the payload is a memoized stage too
+        prepared = graph.run(
+            "prepared", [image_keys, prep_config],
+            lambda: [
+                prepare_image(image, prep_config, source_bytes=uploaded_file.getvalue())
+                for image, uploaded_file in zip(images, uploaded_files)
+            ],
+        )
+        if SHOW_DIAGNOSTICS:
+            with st.expander("Upload payload"):
+                st.json([image.stats for image in prepared] if len(prepared) > 1 else prepared[0].stats)
+        
+        # Blurry, dark or tiny photos are caught locally instead of costing a model call
+        quality = []
+        if quality_config.mode != "off":
+            quality = graph.run("quality", [image_keys, quality_config], lambda: assess_uploads(images, image_keys, quality_config))
+        flagged = False
+        for label, report in zip(labels or [t("uploaded_image", lang)], quality):
+            if not report.passed:
+                flagged = True
+                st.warning(f"{label}: " + " ".join(t(f"quality_{issue}", lang) for issue in report.issues))
+        blocked = flagged and quality_config.mode == "reject"
+        if blocked:
+            st.error(t("quality_rejected", lang))
+
+        # Analysis button
+        analyze_clicked = st.button(t("analyze_button", lang), type="primary", use_container_width=True, disabled=blocked)
+        # Once there is a result, an urgent case can be re-run ahead of routine queued requests
+        emergency_clicked = False
+        if graph.get("source_analysis", [image_keys, labels]) is not None:
+            emergency_clicked = st.button(
+                t("emergency_reanalysis", lang), help=t("emergency_help", lang), use_container_width=True, disabled=blocked,
+            )
+        run_clicked = analyze_clicked or emergency_clicked
+
+        jobs = get_job_queue()
+        job_inputs = fingerprint(image_keys, labels)
+        if run_clicked:
+            priority = PRIORITY_EMERGENCY if emergency_clicked else PRIORITY_NORMAL
+
+            def run_job(job):
+                results = run_analysis_pipeline(
+                    images, image_keys, prepared, labels, api_key, lang, voice_name, audio_speed,
+                    # An emergency re-analysis asks the model again instead of reusing the cached answer
+                    cache=None if emergency_clicked else get_result_cache(), audio_cache=get_audio_cache(),
+                    on_stage=job.on_stage, on_field=job.on_field if STREAM_ANALYSIS else None, on_queue=job.on_queue,
+                    priority=priority,
+                )
+                # The panels are in the process-wide cache; keep finished jobs small
+                results.pop("image_processing", None)
+                return results
+
+            try:
+                # Emergency jobs also jump the queue for a worker, not just the model request queue
+                job = jobs.submit(run_job, context={"inputs": job_inputs, "lang": lang, "voice": voice_name, "speed": audio_speed},
+                                  priority=priority)
+            except JobQueueFull:
+                st.warning(t("job_queue_full", lang))
+            else:
+                # The query parameter lets a reloaded page collect the job
+                st.session_state[ANALYSIS_JOB_KEY] = job.id
+                st.query_params["job"] = job.id
+
+        # The job runs on a worker, so reruns and reconnects only change who is watching it
+        job = jobs.get(st.session_state.get(ANALYSIS_JOB_KEY))
+        if job is not None and job.context["inputs"] == job_inputs:
+            if job.done.is_set():
+                del st.session_state[ANALYSIS_JOB_KEY]
+                collect_analysis_job(job, graph, image_keys, labels, lang)
+            else:
+                poll_analysis_job(job, lang)
+
+        # Results persist across reruns; each stage recomputes only if its inputs changed
+        source = graph.get("source_analysis", [image_keys, labels])
+        if source is not None:
+            analysis = graph.run(
+                "analysis", [graph.output("source_analysis"), lang],
+                lambda: localize_analysis(source["analysis"], source["lang"], lang, api_key, cache=get_translation_cache()),
+            )
+            audio_summary = graph.run(
+                "summary", [graph.output("analysis"), lang],
+                lambda: generate_audio_summary(analysis, lang),
+            )
+            try:
+                audio_bytes = graph.run(
+                    "audio", [graph.output("summary"), voice_name, audio_speed],
+                    lambda: generate_audio_bytes(audio_summary, voice_name, audio_speed, cache=get_audio_cache()),
+                    # A failed synthesis is retried after a voice, speed or text change, not on every rerun
+                    remember_errors=True,
+                )
+            except Exception as e:
+                st.warning(audio_error_message(e, lang))
+                audio_bytes = None
+            render_analysis_outputs(analysis, audio_summary, audio_bytes, lang)
+    else:
+        show_saved_job(lang)
+    
+    # Educational content
+    st.header(t("cavity_stages_guide", lang))
+    
+    stages_info = {
+        "Stage 0": (t("stage_0", lang), t("stage_0_desc", lang), "#c6f6d5"),
+        "Stage 1": (t("stage_1", lang), t("stage_1_desc", lang), "#fed7d7"),
+        "Stage 2": (t("stage_2", lang), t("stage_2_desc", lang), "#fbb6ce"),
+        "Stage 3": (t("stage_3", lang), t("stage_3_desc", lang), "#fc8181"),
+        "Stage 4": (t("stage_4", lang), t("stage_4_desc", lang), "#e53e3e")
+    }
+    
+    cols = st.columns(5)
+    for i, (stage, (title, desc, color)) in enumerate(stages_info.items()):
+        with cols[i]:
+            st.markdown(f"""
+            <div style="background-color: {color}; padding: 1rem; border-radius: 8px; text-align: center;">
+                <h4>{stage}</h4>
+                <p><strong>{title}</strong></p>
+                <p style="font-size: 0.9em;">{desc}</p>
+            </div>
+            """, unsafe_allow_html=True)
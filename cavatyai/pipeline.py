@@ -0,0 +1,92 @@
+"""Concurrent image processing, analysis and narration stages of one run"""
+import queue
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from scheduler import PRIORITY_NORMAL
+
+
+PIPELINE_STAGES = ("image_processing", "analysis", "summary", "audio")
+
+
+def run_analysis_pipeline(images, image_keys, prepared, labels, api_key, lang, voice, speed, cache=None,
+                          audio_cache=None, on_stage=None, on_field=None, on_queue=None, priority=PRIORITY_NORMAL):
+    """Run local image processing, the model call and TTS as concurrent stages
+
+    All images go to the model in one request. Image processing (one panel
+    per image) and the OpenRouter request start together; the summary
+    and audio stages start as soon as the analysis lands. ``on_stage`` is
+    called from the calling thread (so it may use Streamlit) with
+    ``(stage, result, completed, total)`` each time a stage finishes. When
+    ``on_field`` is given the analysis is streamed and ``on_field(key, value)``
+    is likewise called from the calling thread as each field arrives, as is
+    ``on_queue(position)`` while the request waits for a scheduler slot.
+    """
+    from dental_analysis import analyze_tooth_images, generate_audio_bytes, generate_audio_summary
+    from image_processing import get_processing_panel
+
+    results = {}
+    total = len(PIPELINE_STAGES)
+    completed = 0
+    events = queue.Queue()
+    polling = on_field is not None or on_queue is not None
+
+    def drain_events():
+        while True:
+            try:
+                kind, payload = events.get_nowait()
+            except queue.Empty:
+                return
+            if kind == "field":
+                on_field(*payload)
+            else:
+                on_queue(payload)
+
+    with ThreadPoolExecutor(max_workers=3, thread_name_prefix="analysis-pipeline") as executor:
+        field_sink = queue_sink = None
+        if on_field is not None:
+            field_sink = lambda key, value: events.put(("field", (key, value)))
+        if on_queue is not None:
+            queue_sink = lambda position: events.put(("queue", position))
+        pending = {
+            executor.submit(
+                analyze_tooth_images, prepared, api_key, lang, labels=labels, cache=cache, on_field=field_sink,
+                priority=priority, on_queue=queue_sink,
+            ): "analysis",
+            executor.submit(
+                lambda: [get_processing_panel(image, key) for image, key in zip(images, image_keys)]
+            ): "image_processing",
+        }
+
+        def finish(stage, result):
+            nonlocal completed
+            results[stage] = result
+            completed += 1
+            if on_stage is not None:
+                on_stage(stage, result, completed, total)
+
+        while pending:
+            # Wake up regularly so streamed fields and queue moves render as they happen
+            done, _ = wait(pending, timeout=0.1 if polling else None, return_when=FIRST_COMPLETED)
+            if polling:
+                drain_events()
+            for future in done:
+                stage = pending.pop(future)
+                try:
+                    result = future.result()
+                except Exception as e:
+                    if stage != "audio":
+                        raise
+                    results["audio_error"] = e
+                    result = None
+                finish(stage, result)
+
+                if stage == "analysis":
+                    if "error" in result:
+                        # Nothing to narrate; the remaining stages are skipped
+                        total -= 2
+                        continue
+                    audio_summary = generate_audio_summary(result, lang)
+                    pending[executor.submit(generate_audio_bytes, audio_summary, voice, speed, cache=audio_cache)] = "audio"
+                    finish("summary", audio_summary)
+
+    return results
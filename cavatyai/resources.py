@@ -0,0 +1,104 @@
+"""Process-wide singletons shared by every Streamlit session"""
+import os
+import threading
+
+import streamlit as st
+
+from audio_cache import AudioCache
+from image_quality import QualityLog
+from job_queue import JobQueue
+from metrics import register_gauges, start_metrics_server
+from result_cache import ResultCache
+
+
+# Pre-establish upstream connections on the first run of each process (set WARMUP_ON_START=1)
+WARMUP_ON_START = os.getenv("WARMUP_ON_START") == "1"
+
+# Serve Prometheus metrics on this local port (0 disables)
+METRICS_PORT = int(os.getenv("METRICS_PORT", "0"))
+# Operator panels (latency, queues, caches, breakers...) in the sidebar; off for patient-facing deployments
+SHOW_DIAGNOSTICS = os.getenv("SHOW_DIAGNOSTICS") == "1"
+
+# How often a page with a running analysis job checks on it, in seconds
+JOB_POLL_SECONDS = float(os.getenv("JOB_POLL_SECONDS", "0.5"))
+
+
+@st.cache_resource
+def get_result_cache():
+    """Process-wide analysis cache shared by all sessions"""
+    return ResultCache(
+        max_memory_items=int(os.getenv("ANALYSIS_CACHE_MEMORY_ITEMS", "128")),
+        ttl_seconds=int(os.getenv("ANALYSIS_CACHE_TTL_SECONDS", str(7 * 24 * 3600))),
+        max_disk_bytes=int(os.getenv("ANALYSIS_CACHE_MAX_BYTES", str(256 * 1024 * 1024))),
+    )
+
+
+@st.cache_resource
+def get_translation_cache():
+    """Process-wide cache of translated analysis strings"""
+    # localization pulls in the OpenRouter client
+    from localization import TranslationCache
+
+    return TranslationCache()
+
+
+@st.cache_resource
+def get_quality_log():
+    """Process-wide log of per-upload quality scores"""
+    return QualityLog()
+
+
+@st.cache_resource
+def get_audio_cache():
+    """Process-wide synthesized audio cache, optionally pre-warmed in the background"""
+    cache = AudioCache(
+        max_bytes=int(os.getenv("AUDIO_CACHE_MAX_BYTES", str(512 * 1024 * 1024))),
+        max_requests=int(os.getenv("AUDIO_CACHE_MAX_REQUESTS", "10000")),
+    )
+    if os.getenv("AUDIO_CACHE_PREWARM") == "1":
+        from dental_analysis import generate_audio_bytes
+
+        threading.Thread(
+            target=cache.prewarm,
+            args=(generate_audio_bytes, int(os.getenv("AUDIO_CACHE_PREWARM_PER_VOICE", "5"))),
+            name="audio-prewarm",
+            daemon=True,
+        ).start()
+    return cache
+
+
+@st.cache_resource
+def get_job_queue():
+    """Process-wide background analysis jobs; the worker count caps concurrent pipelines"""
+    jobs = JobQueue(
+        workers=int(os.getenv("JOB_WORKERS", "4")),
+        max_pending=int(os.getenv("JOB_MAX_PENDING", "64")),
+        retention_seconds=int(os.getenv("JOB_RETENTION_SECONDS", "3600")),
+    )
+    register_gauges("jobs", jobs.stats)
+    return jobs
+
+
+@st.cache_resource
+def get_metrics_server():
+    """Start the /metrics endpoint once per server process"""
+    try:
+        return start_metrics_server(METRICS_PORT)
+    except OSError:
+        # Another process already serves this port
+        return None
+
+
+@st.cache_resource(show_spinner=False)
+def get_warmup_report():
+    """Warm connections and first-call code paths once per server process, in the background"""
+    report = {"status": "running"}
+
+    def warm():
+        from warmup import run_warmup
+
+        report.update(run_warmup())
+        report["status"] = "done"
+
+    threading.Thread(target=warm, name="warmup", daemon=True).start()
+    return report
@@ -0,0 +1,7 @@
+"""User-facing strings of the Streamlit app, from the per-language catalogs in ``locales``"""
+from locales import strings
+
+
+def t(key, lang="en"):
+    """Translation helper function"""
+    return strings(lang, "UI").get(key, key)
@@ -0,0 +1,304 @@
+"""Rendering of image processing panels and analysis results"""
+import streamlit as st
+
+from cavatyai.pipeline import PIPELINE_STAGES
+from cavatyai.resources import JOB_POLL_SECONDS, get_job_queue, get_quality_log
+from cavatyai.translations import t
+from circuit_breaker import CLOSED, breaker_states
+from image_quality import assess_gray
+from locales import stage_number, strings, value_label
+from metrics import timed
+
+
+def render_image_processing(panel, lang, header=True):
+    """Display a computed image processing panel"""
+    if header:
+        st.header(t("image_processing", lang))
+
+    # Histogram of pixel intensities, drawn as a native chart (no matplotlib figure)
+    st.caption(t("histogram_title", lang))
+    st.bar_chart(panel["histogram"], x_label=t("pixel_intensity", lang), y_label=t("frequency", lang), height=250)
+
+    # Display results
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.image(panel["gray"], caption=t("grayscale", lang), use_column_width=True, clamp=True)
+    with col2:
+        st.image(panel["edges"], caption=t("edge_detection", lang), use_column_width=True, clamp=True)
+    with col3:
+        st.image(panel["clahe"], caption=t("clahe_enhanced", lang), use_column_width=True, clamp=True)
+
+
+def render_processing_panels(panels, labels, lang):
+    """Display one panel directly, or several in tabs named by image label"""
+    if len(panels) == 1:
+        render_image_processing(panels[0], lang)
+        return
+    st.header(t("image_processing", lang))
+    for tab, panel in zip(st.tabs(labels), panels):
+        with tab:
+            render_image_processing(panel, lang, header=False)
+
+
+def show_image_processing(images, lang, image_keys, labels):
+    """Perform (or reuse) and display image processing analysis"""
+    from image_processing import get_processing_panel
+
+    panels = [get_processing_panel(image, key) for image, key in zip(images, image_keys)]
+    with timed("render_image_processing"):
+        render_processing_panels(panels, labels, lang)
+
+
+def assess_uploads(images, image_keys, config):
+    """Score each upload from its (cached) grayscale panel and record the scores"""
+    from image_processing import get_processing_panel
+
+    reports = []
+    for image, key in zip(images, image_keys):
+        panel = get_processing_panel(image, key)
+        report = assess_gray(panel["gray"], config, histogram=panel["histogram"])
+        get_quality_log().record(key, report)
+        reports.append(report)
+    return reports
+
+
+def show_degraded_mode(lang):
+    """Tell users which upstreams are down while their circuit breakers are open"""
+    states = breaker_states()
+    models = [stats for name, stats in states.items() if name.startswith("model:")]
+    # With a backup endpoint still up, analyses are slower at worst
+    if models and all(stats["state"] != CLOSED for stats in models):
+        st.warning(t("degraded_model", lang).format(seconds=round(min(stats.get("retry_in_s", 0) for stats in models))))
+    if states.get("tts", {}).get("state", CLOSED) != CLOSED:
+        st.info(t("degraded_tts", lang))
+
+
+# Status line while the job waits for each stage
+JOB_STAGE_LABELS = {"analysis": "analyzing", "summary": "generating_audio", "audio": "creating_audio"}
+
+
+@st.fragment(run_every=JOB_POLL_SECONDS)
+def poll_analysis_job(job, lang):
+    """Progress and streamed fields of a background job, refreshed on its own
+
+    Only this fragment reruns while the job works; once it has finished the
+    whole page reruns so the main script can collect the result.
+    """
+    if job.done.is_set():
+        st.rerun()
+    snapshot = job.snapshot()
+    total = snapshot["total"] or len(PIPELINE_STAGES)
+    st.progress(min(100, int(100 * len(snapshot["stages"]) / total)))
+
+    waiting_for_worker = get_job_queue().position(job)
+    if waiting_for_worker:
+        st.text(t("job_queued", lang).format(position=waiting_for_worker))
+    elif snapshot["queue_position"]:
+        # Waiting for an upstream request slot
+        st.text(t("queue_position", lang).format(position=snapshot["queue_position"]))
+    else:
+        waiting = [stage for stage in JOB_STAGE_LABELS if stage not in snapshot["stages"]]
+        st.text(t(JOB_STAGE_LABELS[waiting[0]] if waiting else "analyzing", lang))
+
+    # Fields of a streamed response show up here until the full result is in
+    if snapshot["fields"]:
+        display_analysis_results(snapshot["fields"], lang, partial=True)
+
+
+def show_analysis_error(analysis, lang):
+    """Display an analysis error with a hint (``error_hint_<type>`` in the catalog) based on its type"""
+    st.error(f"{t('analysis_error', lang)}: {analysis['error']}")
+    hint = strings(lang, "UI").get(f"error_hint_{analysis.get('error_type')}")
+    if hint:
+        st.info(hint)
+    if "raw_response" in analysis:
+        st.text_area(t("raw_response", lang), analysis["raw_response"], height=200)
+
+
+def display_analysis_results(analysis, lang, partial=False):
+    """Display the analysis results in a structured format
+
+    With ``partial=True`` only the fields that have already arrived from a
+    streaming response are shown.
+    """
+    
+    if "error" in analysis:
+        show_analysis_error(analysis, lang)
+        return
+
+    def ready(key):
+        return not partial or key in analysis
+
+    # Field names and fallbacks are shared with the downloadable report
+    text = strings(lang, "REPORT")
+
+    def label(field, default="unknown"):
+        return value_label(lang, field, analysis[field]) if analysis.get(field) else text[default]
+
+    # Cavity Stage Display
+    stage_num = stage_number(analysis.get("cavity_stage")) or 0
+
+    if ready("cavity_stage"):
+        banner = t("severity_banner", lang).format(stage=label("cavity_stage"), severity=label("severity_level"))
+        st.markdown(f"""
+        <div class="cavity-stage stage-{stage_num}">
+            🦷 {banner}
+        </div>
+        """, unsafe_allow_html=True)
+
+    # Emergency Level Alert
+    emergency = analysis.get("emergency_level", "None")
+    if emergency in ["High", "Critical"]:
+        priority = t("emergency_priority", lang).format(emergency=label("emergency_level", "none"))
+        st.markdown(f"""
+        <div class="warning-card">
+            <h3>{t("emergency_alert", lang)}: {priority}</h3>
+            <p>{t("emergency_text", lang)}</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    # Create columns for organized display
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        # Visible Issues
+        if ready("visible_issues"):
+            st.subheader(t("visible_issues", lang))
+            issues = analysis.get("visible_issues", [])
+            if issues:
+                for issue in issues:
+                    st.write(f"• {issue}")
+            else:
+                st.write(text["none_identified"])
+        
+        # Possible Causes
+        if ready("possible_causes"):
+            st.subheader(t("possible_causes", lang))
+            causes = analysis.get("possible_causes", [])
+            if causes:
+                for cause in causes:
+                    st.write(f"• {cause}")
+        
+        # Affected Teeth
+        affected = analysis.get("affected_teeth", [])
+        if affected:
+            st.subheader(t("affected_teeth", lang))
+            st.write(", ".join(affected))
+    
+    with col2:
+        # Recommended Treatments
+        if ready("recommended_treatments"):
+            st.subheader(t("recommended_treatments", lang))
+            treatments = analysis.get("recommended_treatments", [])
+            if treatments:
+                for treatment in treatments:
+                    st.write(f"• {treatment}")
+        
+        # Immediate Concerns
+        concerns = analysis.get("immediate_concerns", [])
+        if concerns:
+            st.subheader(t("immediate_concerns", lang))
+            for concern in concerns:
+                st.write(f"• {concern}")
+        
+        # When to See Dentist
+        if ready("when_to_see_dentist"):
+            dentist_timeline = analysis.get("when_to_see_dentist", text["as_soon_as_possible"])
+            st.subheader(t("dentist_timeline", lang))
+            st.write(dentist_timeline)
+    
+    # Prevention and Care
+    if ready("prevention_tips"):
+        st.subheader(t("prevention_tips", lang))
+        prevention = analysis.get("prevention_tips", [])
+        if prevention:
+            for tip in prevention:
+                st.write(f"• {tip}")
+    
+    if ready("home_care_instructions"):
+        st.subheader(t("home_care", lang))
+        home_care = analysis.get("home_care_instructions", [])
+        if home_care:
+            for instruction in home_care:
+                st.write(f"• {instruction}")
+
+    if partial:
+        return
+    
+    # Additional Information
+    with st.expander(t("additional_details", lang)):
+        col3, col4 = st.columns(2)
+        
+        with col3:
+            st.write(f"**{text['estimated_timeline']}:** {analysis.get('estimated_timeline', text['not_specified'])}")
+            st.write(f"**{text['emergency_level']}:** {label('emergency_level', 'none')}")
+            
+        with col4:
+            st.write(f"**{text['cavity_present']}:** {text['yes'] if analysis.get('cavity_present', False) else text['no']}")
+        
+        prognosis = analysis.get("prognosis")
+        if prognosis:
+            st.write(f"**{text['prognosis']}:** {prognosis}")
+        
+        notes = analysis.get("additional_notes", "")
+        if notes:
+            st.write(f"**{text['additional_notes']}:** {notes}")
+
+
+# Formats offered below the per-file downloads, as (artifact, label key)
+DOWNLOAD_EXTRAS = [("zip", "download_bundle"), ("json", "download_json"), ("html", "download_html")]
+
+
+def download_artifact(bundle, name, label):
+    """Download button whose bytes are rendered (once) only when it is clicked"""
+    st.download_button(
+        label=label,
+        data=lambda: bundle.data(name),
+        file_name=bundle.file_name(name),
+        mime=bundle.mime(name),
+        key=f"download_{name}_{bundle.fingerprint}",
+        on_click="ignore",
+    )
+
+
+def render_analysis_outputs(analysis, audio_summary, audio_bytes, lang):
+    """Display analysis results, the audio player and download buttons"""
+    from artifacts import get_artifacts
+
+    # Display Results
+    st.header(t("analysis_results", lang))
+    display_analysis_results(analysis, lang)
+
+    # Multi-image exams also carry one analysis per view
+    per_image = analysis.get("per_image") or []
+    if per_image:
+        st.subheader(t("per_image_results", lang))
+        image = strings(lang, "REPORT")["image"]
+        tab_labels = [item.get("label") or f"{image} {index + 1}" for index, item in enumerate(per_image)]
+        for tab, item in zip(st.tabs(tab_labels), per_image):
+            with tab:
+                display_analysis_results(item, lang)
+    
+    # Audio Section
+    st.markdown(f"""
+    <div class="audio-section">
+        <h3>{t("audio_summary", lang)}</h3>
+        <p>{t("audio_summary_text", lang)}</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Rendered once per analysis and reused by every rerun and every format
+    bundle = get_artifacts(analysis, audio_summary, audio_bytes, lang)
+
+    if audio_bytes:
+        st.audio(audio_bytes, format="audio/mp3")
+        downloads = [("audio", "download_audio"), ("report", "download_report"), ("script", "download_script")]
+    else:
+        st.warning(t("audio_failed", lang))
+        st.text_area(t("audio_script", lang), audio_summary, height=150)
+        downloads = [("script", "download_script"), ("report", "download_report")]
+
+    for row in (downloads, DOWNLOAD_EXTRAS):
+        for column, (name, label) in zip(st.columns(3), row):
+            with column:
+                download_artifact(bundle, name, t(label, lang))
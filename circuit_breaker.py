@@ -0,0 +1,159 @@
+"""Per-upstream circuit breakers so a dead dependency fails fast instead of making every user wait
+
+A breaker is closed while its upstream works. After ``BREAKER_FAILURE_THRESHOLD``
+consecutive failures or timeouts (default 5) it opens and rejects calls at
+once with ``CircuitOpenError``. After ``BREAKER_RESET_SECONDS`` (default 30)
+it lets one probe call through (half-open): success closes it again, failure
+re-opens it with the wait doubled, up to ``BREAKER_MAX_RESET_SECONDS``
+(default 300).
+"""
+import os
+import re
+import threading
+import time
+
+from metrics import register_gauges
+
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Gauge value per state, for alerting on /metrics
+STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+
+class CircuitOpenError(Exception):
+    """The upstream's breaker is open; the call was not attempted"""
+
+    def __init__(self, name, retry_in):
+        super().__init__(f"{name} is unavailable, retrying in {retry_in:.0f}s")
+        self.name = name
+        self.retry_in = retry_in
+
+
+class CircuitBreaker:
+    """Consecutive-failure breaker with a single half-open probe and doubling reset timeout"""
+
+    def __init__(self, name, failure_threshold=5, reset_timeout=30.0, max_reset_timeout=300.0, clock=time.monotonic):
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self.max_reset_timeout = max(reset_timeout, max_reset_timeout)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._wait = reset_timeout
+        self._probing = False
+        self.trips = 0
+        self.rejected = 0
+
+    @property
+    def state(self):
+        with self._lock:
+            return self._state
+
+    def _retry_in(self, now):
+        return max(0.0, self._opened_at + self._wait - now)
+
+    def check(self):
+        """Raise CircuitOpenError if a call would be rejected right now, without claiming the probe"""
+        with self._lock:
+            now = self._clock()
+            if self._state == OPEN and self._retry_in(now) > 0 or self._state == HALF_OPEN and self._probing:
+                self.rejected += 1
+                raise CircuitOpenError(self.name, self._retry_in(now))
+
+    def before_call(self):
+        """Admit a call or raise CircuitOpenError; once the wait is over the first caller is the probe"""
+        with self._lock:
+            now = self._clock()
+            if self._state == OPEN and self._retry_in(now) <= 0:
+                self._state = HALF_OPEN
+                self._probing = False
+            if self._state == OPEN or self._state == HALF_OPEN and self._probing:
+                self.rejected += 1
+                raise CircuitOpenError(self.name, self._retry_in(now))
+            if self._state == HALF_OPEN:
+                self._probing = True
+
+    def record_success(self):
+        with self._lock:
+            self._state = CLOSED
+            self._failures = 0
+            self._probing = False
+            self._wait = self.reset_timeout
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._state == HALF_OPEN:
+                # The probe failed: stay away longer this time
+                self._wait = min(self.max_reset_timeout, self._wait * 2)
+            elif self._failures < self.failure_threshold or self._state == OPEN:
+                return
+            self._state = OPEN
+            self._opened_at = self._clock()
+            self._probing = False
+            self.trips += 1
+
+    def release(self):
+        """Give back a claimed probe that ended without telling anything about the upstream"""
+        with self._lock:
+            self._probing = False
+
+    def stats(self):
+        with self._lock:
+            stats = {
+                "state": self._state,
+                "consecutive_failures": self._failures,
+                "trips": self.trips,
+                "rejected": self.rejected,
+            }
+            if self._state != CLOSED:
+                stats["retry_in_s"] = round(self._retry_in(self._clock()), 1)
+        return stats
+
+
+_breakers = {}
+_breakers_lock = threading.Lock()
+
+
+def get_breaker(name):
+    """Process-wide breaker for one upstream (e.g. a host name), created on first use"""
+    with _breakers_lock:
+        breaker = _breakers.get(name)
+        if breaker is None:
+            breaker = _breakers[name] = CircuitBreaker(
+                name,
+                failure_threshold=int(os.getenv("BREAKER_FAILURE_THRESHOLD", "5")),
+                reset_timeout=float(os.getenv("BREAKER_RESET_SECONDS", "30")),
+                max_reset_timeout=float(os.getenv("BREAKER_MAX_RESET_SECONDS", "300")),
+            )
+        return breaker
+
+
+def breaker_states():
+    """``{name: stats}`` of every breaker created so far"""
+    with _breakers_lock:
+        breakers = list(_breakers.values())
+    return {breaker.name: breaker.stats() for breaker in breakers}
+
+
+def breaker_gauges():
+    """Flat snapshot of every breaker; the metrics endpoint keeps the numeric ``*_state_value`` keys"""
+    with _breakers_lock:
+        breakers = list(_breakers.values())
+    gauges = {}
+    for breaker in breakers:
+        # Host names are not metric-name safe
+        slug = re.sub(r"[^0-9A-Za-z]+", "_", breaker.name).strip("_")
+        for key, value in breaker.stats().items():
+            gauges[f"{slug}_{key}"] = value
+        gauges[f"{slug}_state_value"] = STATE_VALUES[gauges[f"{slug}_state"]]
+    return gauges
+
+
+register_gauges("breakers", breaker_gauges)
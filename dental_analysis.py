@@ -0,0 +1,491 @@
+"""Dental image analysis, narration and report helpers shared by the app and CLI"""
+import base64
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+
+from audio_cache import make_audio_key
+from circuit_breaker import CircuitOpenError
+from image_prep import PreparedImage, prepare_image
+from json_stream import FieldStreamParser
+from locales import strings, value_label
+from metrics import STAGE_ERRORS, count_bytes, log_analysis, observe, register_gauges, timed
+from model_registry import get_model_registry
+from openrouter_client import BadRequestError, OpenRouterError, get_client
+from response_parser import MULTI_IMAGE_RESPONSE_FORMAT, RESPONSE_FORMAT, parse_analysis_response
+from result_cache import make_cache_key
+from scheduler import PRIORITY_NORMAL
+from single_flight import SingleFlight
+from tts import get_synthesizer
+
+
+# Bump whenever the analysis prompt changes so cached results are not reused
+PROMPT_VERSION = "2"
+TTS_TIMEOUT = float(os.getenv("TTS_TIMEOUT", "60"))
+# Ask for schema-constrained JSON; set to 0 for providers that reject response_format
+STRUCTURED_OUTPUT = os.getenv("OPENROUTER_STRUCTURED_OUTPUT", "1") != "0"
+
+audio_logger = logging.getLogger("cavatyai.audio")
+
+# Models that answered a response_format request with 400 in this process
+_structured_output_rejected = set()
+
+# Identical analyses / syntheses already in flight are joined rather than repeated
+analysis_flight = SingleFlight()
+tts_flight = SingleFlight()
+register_gauges("analysis_flight", analysis_flight.stats)
+register_gauges("tts_flight", tts_flight.stats)
+
+
+def encode_image(image, config=None):
+    """Convert PIL image (or an already prepared one) to base64 string"""
+    if not isinstance(image, PreparedImage):
+        image = prepare_image(image, config)
+    img_str = base64.b64encode(image.data).decode()
+    return img_str
+
+
+LANGUAGE_NAMES = {"en": "English", "hi": "Hindi", "es": "Spanish", "ta": "Tamil"}
+
+
+def translate_texts(texts, target_lang, api_key):
+    """Translate a list of strings in a single OpenRouter request
+
+    Returns the translations in the same order, or None when the response
+    cannot be matched up with the input.
+    """
+    if not texts:
+        return []
+
+    prompt = (
+        f"Translate each string in the following JSON array to {LANGUAGE_NAMES.get(target_lang, 'English')}. "
+        "Keep medical meaning, numbers and tooth identifiers intact. "
+        "Reply with only a JSON array of the translated strings, in the same order and of the same length:\n\n"
+        + json.dumps(texts, ensure_ascii=False)
+    )
+
+    registry = get_model_registry()
+    data = {
+        "model": registry.primary,
+        "messages": [{"role": "user", "content": prompt}],
+        "max_tokens": 4000,
+        "temperature": 0.3
+    }
+
+    try:
+        with timed("translate"):
+            result = registry.client_for(registry.primary).chat_completion(data, api_key, read_timeout=30)
+        content = result['choices'][0]['message']['content']
+        translated = json.loads(content[content.find('['):content.rfind(']') + 1])
+    except (OpenRouterError, KeyError, IndexError, TypeError, ValueError):
+        return None
+
+    if not isinstance(translated, list) or len(translated) != len(texts):
+        return None
+    return [str(item) for item in translated]
+
+
+def translate_text(text, target_lang, api_key):
+    """Translate text using OpenRouter API with Gemini"""
+    if target_lang == "en":
+        return text
+
+    translated = translate_texts([text], target_lang, api_key)
+    return translated[0] if translated else text
+
+
+FINDING_STRUCTURE = """{
+        "cavity_stage": "Stage 0-4 (0=No cavity, 1=Early enamel decay, 2=Dentin decay, 3=Pulp involvement, 4=Abscess/severe infection)",
+        "cavity_present": true/false,
+        "affected_teeth": ["list of affected tooth numbers if identifiable"],
+        "severity_level": "None/Mild/Moderate/Severe/Critical",
+        "visible_issues": ["list all visible dental issues"],
+        "possible_causes": ["detailed list of possible causes for the observed condition"],
+        "immediate_concerns": ["urgent issues requiring immediate attention"],
+        "recommended_treatments": ["list of recommended treatments"],
+        "prevention_tips": ["specific prevention advice"],
+        "emergency_level": "None/Low/Medium/High/Critical",
+        "estimated_timeline": "how long this condition likely took to develop",
+        "prognosis": "likely outcome with and without treatment",
+        "home_care_instructions": ["immediate home care steps"],
+        "when_to_see_dentist": "timeline for dental visit",
+        "additional_notes": "any other relevant observations"
+    }"""
+
+
+def analyze_tooth_image(image, api_key, lang, cache=None, prep_config=None, on_field=None,
+                        priority=PRIORITY_NORMAL, on_queue=None):
+    """Analyze tooth image using Gemini API through OpenRouter
+
+    When ``on_field`` is given the response is streamed and
+    ``on_field(key, value)`` is called as each top-level field completes.
+    ``priority`` and ``on_queue`` are passed to the request scheduler.
+    """
+    return analyze_tooth_images([image], api_key, lang, cache=cache, prep_config=prep_config, on_field=on_field,
+                                priority=priority, on_queue=on_queue)
+
+
+def analyze_tooth_images(images, api_key, lang, labels=None, cache=None, prep_config=None, on_field=None,
+                         priority=PRIORITY_NORMAL, on_queue=None):
+    """Analyze several views of one patient in a single OpenRouter request
+
+    Each image is sent after a text part carrying its label. With more than
+    one image the result is an overall analysis plus a ``per_image`` list of
+    per-view analyses, each with its ``label``; a single image gives the
+    plain single-image analysis.
+    """
+    started = time.perf_counter()
+    timings = {}
+    registry = get_model_registry()
+    event = {"event": "analysis", "model": registry.primary, "lang": lang, "images": len(images)}
+
+    # Shrink and convert images to base64
+    images = [image if isinstance(image, PreparedImage) else prepare_image(image, prep_config) for image in images]
+    with timed("encode", timings):
+        encoded = [encode_image(image) for image in images]
+    event["payload_bytes"] = sum(len(data) for data in encoded)
+    count_bytes("encode", event["payload_bytes"])
+    multi = len(images) > 1
+    if multi:
+        labels = list(labels or [])[:len(images)]
+        labels += [f"Image {index + 1}" for index in range(len(labels), len(images))]
+
+    # Identical images + settings were already analyzed: skip the round trip
+    key_source = "\x00".join(encoded + labels) if multi else encoded[0]
+    cache_key = make_cache_key(key_source.encode("utf-8"), lang, ",".join(registry.names), PROMPT_VERSION)
+    if cache is not None:
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return _finish_analysis(event, timings, started, cached, "cache")
+    
+    # Comprehensive prompt for dental analysis
+    lang_instruction = ""
+    if lang != "en":
+        lang_instruction = f"\n\nIMPORTANT: Provide all text fields in {LANGUAGE_NAMES.get(lang, 'English')} language."
+    
+    if multi:
+        prompt = f"""
+    You are an expert dental AI assistant. You are given {len(images)} photos of the same patient's mouth, each preceded by its label. Analyze every image and provide a comprehensive analysis in JSON format with the following structure, where the top-level fields are your overall assessment across all views and "per_image" has one entry per image, in the order given:
+    If you think there is no cavity or dental issues, please indicate uncertainty appropriately.{lang_instruction}
+
+    {FINDING_STRUCTURE[:-1].rstrip()},
+        "per_image": [
+            {{"label": "the image's label exactly as given", ...the same fields as above for that image only}}
+        ]
+    }}
+
+    Analyze the images carefully and provide detailed, accurate information. If you cannot clearly see dental issues, indicate uncertainty appropriately.
+    """
+    else:
+        prompt = f"""
+    You are an expert dental AI assistant. Analyze this tooth/dental image and provide a comprehensive analysis in JSON format with the following structure:
+    If you think there is no cavity or dental issues, please indicate uncertainty appropriately.{lang_instruction}
+
+    {FINDING_STRUCTURE}
+
+    Analyze the image carefully and provide detailed, accurate information. If you cannot clearly see dental issues, indicate uncertainty appropriately.
+    """
+
+    content = [{"type": "text", "text": prompt}]
+    for index, (image, img_base64) in enumerate(zip(images, encoded)):
+        if multi:
+            content.append({"type": "text", "text": f"Image {index + 1}: {labels[index]}"})
+        content.append({"type": "image_url", "image_url": {"url": f"data:{image.mime_type};base64,{img_base64}"}})
+
+    data = {
+        "messages": [
+            {
+                "role": "user",
+                "content": content
+            }
+        ],
+        # Each extra view adds a per-image entry to the answer
+        "max_tokens": 2000 + 1500 * (len(images) - 1),
+        "temperature": 0.3
+    }
+
+    ran = False
+    # "ok" or "repaired" per model; a repaired answer may be cut short, so it is not cached
+    parse_outcomes = {}
+    hedged = registry.hedge and registry.backup is not None
+    # With hedging the first attempt to stream a field owns the live preview
+    preview = []
+    preview_lock = threading.Lock()
+
+    def attempt(model, client, cancelled):
+        request = dict(data, model=model)
+        use_schema = STRUCTURED_OUTPUT and model not in _structured_output_rejected
+        if use_schema:
+            request["response_format"] = MULTI_IMAGE_RESPONSE_FORMAT if multi else RESPONSE_FORMAT
+
+        def hedged_preview(key, value):
+            with preview_lock:
+                if not preview:
+                    preview.append(model)
+            if preview[0] == model and on_field is not None:
+                on_field(key, value)
+
+        # Hedged attempts always stream so the losing one can be cancelled mid-response
+        fields = hedged_preview if hedged else on_field
+
+        # Only the primary reports queue positions; the backup's wait would look like a second request
+        queue_sink = on_queue if model == registry.primary else None
+        try:
+            with timed("model", timings):
+                try:
+                    content = request_analysis_content(request, api_key, fields, priority, queue_sink, client, cancelled)
+                except BadRequestError as e:
+                    if not use_schema or not rejects_structured_output(e):
+                        raise
+                    # The model/provider does not support JSON-schema mode: fall back to the prompt alone
+                    _structured_output_rejected.add(model)
+                    request.pop("response_format")
+                    content = request_analysis_content(request, api_key, fields, priority, queue_sink, client, cancelled)
+        except OpenRouterError as e:
+            return e.to_dict()
+        except (KeyError, IndexError, TypeError) as e:
+            return {"error": "Unexpected response structure from OpenRouter", "error_type": "invalid_response", "details": str(e)}
+        if cancelled.is_set():
+            return None
+        count_bytes("completion", len(content.encode("utf-8")))
+
+        # Tolerates fences, trailing prose and truncated output before giving up
+        try:
+            with timed("parse", timings):
+                analysis, parse_outcomes[model] = parse_analysis_response(content)
+                return analysis
+        except ValueError as e:
+            return {"error": f"Failed to parse JSON response: {e}", "error_type": "invalid_response", "raw_response": content}
+
+    def call_model():
+        nonlocal ran
+        ran = True
+        analysis, model = registry.call(attempt)
+        event["model"] = model
+        if cache is not None and "error" not in analysis and parse_outcomes.get(model) == "ok":
+            cache.set(cache_key, analysis)
+        return analysis
+
+    # Sessions submitting the same images at the same moment share one upstream call;
+    # only the first caller's on_field sees the streamed fields
+    result = analysis_flight.do(cache_key, call_model)
+    return _finish_analysis(event, timings, started, result, "model" if ran else "coalesced")
+
+
+def rejects_structured_output(error):
+    """Whether a 400 is the provider refusing ``response_format`` rather than e.g. an oversized image"""
+    details = (error.details or "").lower()
+    return "response_format" in details or "schema" in details
+
+
+def _finish_analysis(event, timings, started, result, source):
+    """Record the end-to-end timing and emit the per-analysis log line"""
+    total = time.perf_counter() - started
+    observe("analysis", total)
+    if "error" in result:
+        STAGE_ERRORS.inc("analysis")
+    log_analysis({
+        **event,
+        "source": source,
+        "ok": "error" not in result,
+        "error_type": result.get("error_type"),
+        "stages_s": timings,
+        "total_s": round(total, 4),
+    })
+    return result
+
+
+def request_analysis_content(data, api_key, on_field=None, priority=PRIORITY_NORMAL, on_queue=None, client=None,
+                             cancelled=None):
+    """Send the analysis request, streaming when ``on_field`` is given; returns the message text
+
+    A stream stopped through ``cancelled`` returns the text received so far.
+    """
+    client = client or get_client()
+    if on_field is not None:
+        return stream_analysis_content(data, api_key, on_field, priority, on_queue, client, cancelled)
+    result = client.chat_completion(data, api_key, priority=priority, on_queue=on_queue)
+    return result['choices'][0]['message']['content']
+
+
+def stream_analysis_content(data, api_key, on_field, priority=PRIORITY_NORMAL, on_queue=None, client=None,
+                            cancelled=None):
+    """Stream a completion, reporting each finished JSON field; returns the full text"""
+    parser = FieldStreamParser()
+    parts = []
+    stream = (client or get_client()).stream_chat_completion(data, api_key, priority=priority, on_queue=on_queue,
+                                                              cancelled=cancelled)
+    for delta in stream:
+        parts.append(delta)
+        for key, value in parser.feed(delta):
+            on_field(key, value)
+    return "".join(parts)
+
+
+@timed("summary")
+def generate_audio_summary(analysis, lang):
+    """Generate a text summary suitable for audio narration"""
+    text = strings(lang, "SUMMARY")
+    if "error" in analysis:
+        return text["error"]
+
+    def label(item, field):
+        return value_label(lang, field, item[field]) if item.get(field) else text["unknown"]
+
+    emergency = analysis.get("emergency_level", "None")
+
+    parts = [text["title"], text["stage"].format(stage=label(analysis, "cavity_stage"),
+                                                 severity=label(analysis, "severity_level"))]
+
+    if emergency in ["High", "Critical"]:
+        parts.append(text["emergency"].format(emergency=value_label(lang, "emergency_level", emergency)))
+
+    per_image = analysis.get("per_image", [])
+    if per_image:
+        views = text["view_separator"].join(
+            f"{item.get('label', text['image'])}: {label(item, 'cavity_stage')}" for item in per_image
+        )
+        parts.append(text["views"].format(views=views))
+
+    visible_issues = analysis.get("visible_issues", [])
+    if visible_issues:
+        parts.append(text["visible_issues"].format(items=text["list_separator"].join(visible_issues[:3])))
+
+    treatments = analysis.get("recommended_treatments", [])
+    if treatments:
+        parts.append(text["treatments"].format(items=text["list_separator"].join(treatments[:2])))
+
+    home_care = analysis.get("home_care_instructions", [])
+    if home_care:
+        parts.append(text["home_care"].format(items=text["list_separator"].join(home_care[:2])))
+
+    dentist_timeline = analysis.get("when_to_see_dentist", text["as_soon_as_possible"])
+    parts.append(text["dentist"].format(timeline=dentist_timeline))
+
+    return " ".join(parts)
+
+async def generate_edge_tts_audio(text, voice="en-US-AriaNeural", rate="+0%", pitch="+0Hz", connector=None):
+    """Generate MP3 audio bytes in memory using Edge TTS"""
+    import edge_tts
+
+    communicate = edge_tts.Communicate(text, voice, rate=rate, pitch=pitch, connector=connector)
+    audio = bytearray()
+    async for chunk in communicate.stream():
+        if chunk["type"] == "audio":
+            audio.extend(chunk["data"])
+    return bytes(audio)
+
+
+def audio_error_message(error, lang="en"):
+    """User-facing message for a failed Edge TTS synthesis; the exception itself goes to the log"""
+    text = strings(lang, "UI")
+    if isinstance(error, ImportError):
+        return text["audio_not_installed"]
+    if isinstance(error, CircuitOpenError):
+        return text["audio_unavailable"]
+    audio_logger.warning("Audio generation failed: %r", error)
+    if isinstance(error, TimeoutError):
+        return text["audio_timeout"]
+    return text["audio_error"]
+
+
+def generate_audio_bytes(audio_summary, voice, speed, pitch="+0Hz", cache=None):
+    """Synthesize on the shared TTS loop; safe to call from any thread"""
+    if cache is not None:
+        cached = cache.get(audio_summary, voice, speed, pitch)
+        if cached is not None:
+            return cached
+
+    def synthesize():
+        with timed("tts"):
+            audio = get_synthesizer().run(
+                lambda connector: generate_edge_tts_audio(audio_summary, voice, speed, pitch, connector=connector),
+                timeout=TTS_TIMEOUT,
+            )
+        count_bytes("tts", len(audio))
+        if cache is not None:
+            cache.set(audio_summary, voice, speed, pitch, audio)
+        return audio
+
+    return tts_flight.do(make_audio_key(audio_summary, voice, speed, pitch), synthesize)
+
+
+@timed("report")
+def create_downloadable_report(analysis, lang, generated=None):
+    """Create downloadable text report; ``generated`` (a datetime) defaults to now"""
+    text = strings(lang, "REPORT")
+    if "error" in analysis:
+        return text["error"]
+
+    rule = "═" * 55
+
+    def section(title):
+        return f"{rule}\n{title}\n{rule}"
+
+    def bullets(key, default):
+        return chr(10).join(f"• {item}" for item in analysis.get(key, [text[default]]))
+
+    def label(item, field, default="unknown"):
+        return value_label(lang, field, item[field]) if item.get(field) else text[default]
+
+    per_image_section = ""
+    if analysis.get("per_image"):
+        views = []
+        for item in analysis["per_image"]:
+            lines = [
+                f"[{item.get('label', text['image'])}]",
+                f"{text['cavity_stage']}: {label(item, 'cavity_stage')}",
+                f"{text['severity']}: {label(item, 'severity_level')}",
+                f"{text['affected_teeth']}: {', '.join(item.get('affected_teeth', [])) or text['not_specified']}",
+            ]
+            lines += [f"• {issue}" for issue in item.get('visible_issues', [])]
+            views.append(chr(10).join(lines))
+        per_image_section = f"""
+{section(text['per_image'])}
+{(chr(10) * 2).join(views)}
+"""
+
+    report_text = f"""
+{text['title']}
+{text['generated']}: {(generated or datetime.now()).strftime("%Y-%m-%d %H:%M:%S")}
+
+{section(text['summary'])}
+{text['cavity_stage']}: {label(analysis, 'cavity_stage')}
+{text['severity']}: {label(analysis, 'severity_level')}
+{text['emergency_level']}: {label(analysis, 'emergency_level', 'none')}
+{text['cavity_present']}: {text['yes'] if analysis.get('cavity_present', False) else text['no']}
+
+{section(text['visible_issues'])}
+{bullets('visible_issues', 'none_identified')}
+
+{section(text['possible_causes'])}
+{bullets('possible_causes', 'not_specified')}
+
+{section(text['recommended_treatments'])}
+{bullets('recommended_treatments', 'consult_dentist')}
+
+{section(text['immediate_concerns'])}
+{bullets('immediate_concerns', 'none_identified')}
+
+{section(text['prevention_tips'])}
+{bullets('prevention_tips', 'default_prevention')}
+
+{section(text['home_care'])}
+{bullets('home_care_instructions', 'default_home_care')}
+{per_image_section}
+{section(text['additional_information'])}
+{text['when_to_see_dentist']}: {analysis.get('when_to_see_dentist', text['as_soon_as_possible'])}
+{text['estimated_timeline']}: {analysis.get('estimated_timeline', text['not_specified'])}
+{text['prognosis']}: {analysis.get('prognosis', text['default_prognosis'])}
+
+{text['affected_teeth']}: {', '.join(analysis.get('affected_teeth', [])) or text['not_specified']}
+
+{text['additional_notes']}: {analysis.get('additional_notes', text['none'])}
+
+{section(text['disclaimer_title'])}
+{text['disclaimer']}
+    """
+    return report_text.strip()
@@ -0,0 +1,99 @@
+"""Shrink uploaded photos before they are base64-encoded for the model"""
+import io
+import os
+from dataclasses import dataclass, field
+
+from PIL import Image, ImageOps
+
+from metrics import timed
+
+
+SUPPORTED_FORMATS = {"JPEG": "image/jpeg", "WEBP": "image/webp"}
+
+
+@dataclass
+class PrepConfig:
+    """Settings for the upload preparation stage"""
+    max_long_edge: int = 1568
+    format: str = "JPEG"
+    quality: int = 85
+
+    @classmethod
+    def from_env(cls):
+        """Operator settings; out-of-range numbers are clamped, an unknown format is an error"""
+        fmt = os.getenv("IMAGE_FORMAT", cls.format).upper()
+        if fmt not in SUPPORTED_FORMATS:
+            raise ValueError(f"IMAGE_FORMAT must be one of {', '.join(SUPPORTED_FORMATS)}, got {fmt!r}")
+        max_long_edge = int(os.getenv("IMAGE_MAX_LONG_EDGE", cls.max_long_edge))
+        return cls(
+            # 0 keeps the original size; anything else below 256 px leaves too little to analyze
+            max_long_edge=max(256, max_long_edge) if max_long_edge > 0 else 0,
+            format=fmt,
+            quality=min(100, max(1, int(os.getenv("IMAGE_QUALITY", cls.quality)))),
+        )
+
+
+@dataclass
+class PreparedImage:
+    """Encoded image ready to upload, plus before/after size statistics"""
+    data: bytes
+    mime_type: str
+    width: int
+    height: int
+    stats: dict = field(default_factory=dict)
+
+
+def normalize_mode(image):
+    """Convert any PIL mode (RGBA, P, LA, CMYK, I;16...) to RGB"""
+    if image.mode == "RGB":
+        return image
+    if image.mode == "P":
+        image = image.convert("RGBA")
+    if image.mode in ("RGBA", "LA"):
+        # Flatten transparency onto white so the teeth don't end up on black
+        background = Image.new("RGB", image.size, (255, 255, 255))
+        background.paste(image, mask=image.getchannel("A"))
+        return background
+    return image.convert("RGB")
+
+
+@timed("prepare")
+def prepare_image(image, config=None, source_bytes=None):
+    """EXIF-transpose, normalize, downscale and re-encode an image for upload"""
+    config = config or PrepConfig()
+    fmt = config.format.upper()
+    if fmt not in SUPPORTED_FORMATS:
+        raise ValueError(f"Unsupported image format: {config.format}")
+
+    original_width, original_height = image.size
+    # PIL decodes lazily; force it here so decode time is measured on its own
+    with timed("decode"):
+        image.load()
+
+    # Phone photos store rotation in EXIF instead of rotating the pixels
+    prepared = ImageOps.exif_transpose(image) or image
+    prepared = normalize_mode(prepared)
+
+    if config.max_long_edge and max(prepared.size) > config.max_long_edge:
+        prepared = prepared.copy()
+        prepared.thumbnail((config.max_long_edge, config.max_long_edge), Image.LANCZOS)
+
+    buffered = io.BytesIO()
+    prepared.save(buffered, format=fmt, quality=config.quality)
+    data = buffered.getvalue()
+
+    width, height = prepared.size
+    stats = {
+        "original_bytes": len(source_bytes) if source_bytes is not None else None,
+        "original_pixels": original_width * original_height,
+        "original_size": f"{original_width}x{original_height}",
+        "prepared_bytes": len(data),
+        "prepared_pixels": width * height,
+        "prepared_size": f"{width}x{height}",
+        "format": fmt,
+        "quality": config.quality,
+    }
+    if stats["original_bytes"]:
+        stats["byte_reduction"] = round(1 - len(data) / stats["original_bytes"], 3)
+
+    return PreparedImage(data=data, mime_type=SUPPORTED_FORMATS[fmt], width=width, height=height, stats=stats)
@@ -0,0 +1,90 @@
+"""OpenCV views of an uploaded image, memoized by content hash"""
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+
+import cv2
+import numpy as np
+
+from image_prep import normalize_mode
+from metrics import timed
+
+
+def image_fingerprint(data):
+    """Short content hash used to key derived images across reruns"""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+@timed("image_processing")
+def compute_image_processing(image):
+    """Compute the grayscale, Canny edge and CLAHE views plus a 256-bin histogram"""
+    # Convert PIL straight to grayscale; OpenCV's weights match RGB->BGR->GRAY
+    gray = cv2.cvtColor(np.asarray(normalize_mode(image)), cv2.COLOR_RGB2GRAY)
+
+    # Canny edge detection
+    edges = cv2.Canny(gray, 100, 200)
+
+    # CLAHE (Contrast Limited Adaptive Histogram Equalization)
+    clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
+    clahe_img = clahe.apply(gray)
+
+    # Histogram of pixel intensities
+    histogram = cv2.calcHist([gray], [0], None, [256], [0, 256]).ravel().astype(np.int64)
+
+    panel = {"gray": gray, "edges": edges, "clahe": clahe_img, "histogram": histogram}
+    for array in panel.values():
+        # Shared between sessions, so make accidental in-place edits fail loudly
+        array.setflags(write=False)
+    return panel
+
+
+def panel_nbytes(panel):
+    return sum(array.nbytes for array in panel.values())
+
+
+class PanelCache:
+    """Small thread-safe LRU of computed panels keyed by image fingerprint
+
+    Bounded by entry count and by the total size of the cached arrays; the
+    newest panel is always kept, even if it alone is over ``max_bytes``.
+    """
+
+    def __init__(self, max_entries=16, max_bytes=256 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._panels = OrderedDict()
+        self._lock = threading.Lock()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_compute(self, key, image):
+        with self._lock:
+            panel = self._panels.get(key)
+            if panel is not None:
+                self._panels.move_to_end(key)
+                self.hits += 1
+                return panel
+            self.misses += 1
+
+        panel = compute_image_processing(image)
+        with self._lock:
+            previous = self._panels.pop(key, None)
+            if previous is not None:
+                self.bytes -= panel_nbytes(previous)
+            self._panels[key] = panel
+            self.bytes += panel_nbytes(panel)
+            while len(self._panels) > 1 and (len(self._panels) > self.max_entries or self.bytes > self.max_bytes):
+                _, evicted = self._panels.popitem(last=False)
+                self.bytes -= panel_nbytes(evicted)
+        return panel
+
+
+# A 12 MP photo's panel is about 36 MB (three full-size views)
+_panel_cache = PanelCache(max_bytes=int(os.getenv("PANEL_CACHE_MAX_BYTES", str(256 * 1024 * 1024))))
+
+
+def get_processing_panel(image, key):
+    """Panel for ``image`` from the process-wide cache, computing it on first use"""
+    return _panel_cache.get_or_compute(key, image)
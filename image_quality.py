@@ -0,0 +1,170 @@
+"""Fast local checks that reject or flag unusable photos before the model call"""
+import json
+import os
+import sqlite3
+import time
+from dataclasses import dataclass, field
+
+from image_prep import normalize_mode
+from metrics import timed
+from result_cache import DEFAULT_CACHE_DIR
+
+
+# Sharpness is measured at this long edge so scores compare across resolutions
+SHARPNESS_LONG_EDGE = 1024
+
+GATE_MODES = ("off", "warn", "reject")
+
+
+@dataclass
+class QualityConfig:
+    """Thresholds for the pre-analysis quality gate"""
+    mode: str = "warn"
+    min_sharpness: float = 50.0
+    min_brightness: float = 40.0
+    max_brightness: float = 220.0
+    max_clipped_fraction: float = 0.5
+    min_side: int = 320
+
+    @classmethod
+    def from_env(cls):
+        mode = os.getenv("QUALITY_GATE", cls.mode).lower()
+        if mode not in GATE_MODES:
+            raise ValueError(f"QUALITY_GATE must be one of {', '.join(GATE_MODES)}, got {mode!r}")
+        return cls(
+            mode=mode,
+            min_sharpness=float(os.getenv("QUALITY_MIN_SHARPNESS", cls.min_sharpness)),
+            min_brightness=float(os.getenv("QUALITY_MIN_BRIGHTNESS", cls.min_brightness)),
+            max_brightness=float(os.getenv("QUALITY_MAX_BRIGHTNESS", cls.max_brightness)),
+            max_clipped_fraction=float(os.getenv("QUALITY_MAX_CLIPPED", cls.max_clipped_fraction)),
+            min_side=int(os.getenv("QUALITY_MIN_SIDE", cls.min_side)),
+        )
+
+
+@dataclass
+class QualityReport:
+    """Scores of one image and the names of the checks it failed"""
+    scores: dict
+    issues: list = field(default_factory=list)
+
+    @property
+    def passed(self):
+        return not self.issues
+
+
+# cv2 and numpy are imported inside the scoring functions so that reading the
+# gate settings (which the app does on every page load) stays cheap
+
+
+def grayscale(image):
+    import cv2
+    import numpy as np
+
+    return cv2.cvtColor(np.asarray(normalize_mode(image)), cv2.COLOR_RGB2GRAY)
+
+
+def sharpness_score(gray):
+    """Variance of the Laplacian on a downscaled copy; low values mean blur"""
+    import cv2
+
+    height, width = gray.shape
+    scale = SHARPNESS_LONG_EDGE / max(height, width)
+    if scale < 1:
+        gray = cv2.resize(gray, (max(1, round(width * scale)), max(1, round(height * scale))), interpolation=cv2.INTER_AREA)
+    return float(cv2.Laplacian(gray, cv2.CV_64F).var())
+
+
+def exposure_scores(histogram):
+    """Mean brightness and the fractions of near-black and near-white pixels"""
+    import numpy as np
+
+    histogram = np.asarray(histogram, dtype=np.float64)
+    total = histogram.sum() or 1.0
+    return {
+        "brightness": float(np.dot(np.arange(256), histogram) / total),
+        "dark_fraction": float(histogram[:16].sum() / total),
+        "bright_fraction": float(histogram[240:].sum() / total),
+    }
+
+
+@timed("quality_check")
+def assess_gray(gray, config=None, histogram=None):
+    """Score a grayscale image; ``histogram`` is reused when already computed"""
+    import cv2
+
+    config = config or QualityConfig()
+    started = time.perf_counter()
+    if histogram is None:
+        histogram = cv2.calcHist([gray], [0], None, [256], [0, 256]).ravel()
+
+    height, width = gray.shape
+    scores = {"width": width, "height": height, "sharpness": sharpness_score(gray)}
+    scores.update(exposure_scores(histogram))
+
+    issues = []
+    if min(width, height) < config.min_side:
+        issues.append("low_resolution")
+    if scores["sharpness"] < config.min_sharpness:
+        issues.append("blurry")
+    if scores["brightness"] < config.min_brightness or scores["dark_fraction"] > config.max_clipped_fraction:
+        issues.append("underexposed")
+    if scores["brightness"] > config.max_brightness or scores["bright_fraction"] > config.max_clipped_fraction:
+        issues.append("overexposed")
+
+    scores["seconds"] = round(time.perf_counter() - started, 4)
+    return QualityReport(scores=scores, issues=issues)
+
+
+def assess_image(image, config=None):
+    """Score a PIL image (for callers without a processing panel)"""
+    return assess_gray(grayscale(image), config)
+
+
+class QualityLog:
+    """Per-upload quality scores kept in SQLite for threshold tuning"""
+
+    def __init__(self, path=None):
+        self.path = path or os.path.join(DEFAULT_CACHE_DIR, "quality.sqlite3")
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                """CREATE TABLE IF NOT EXISTS quality_scores (
+                    image_key TEXT NOT NULL,
+                    source TEXT NOT NULL,
+                    scores TEXT NOT NULL,
+                    issues TEXT NOT NULL,
+                    passed INTEGER NOT NULL,
+                    created REAL NOT NULL
+                )"""
+            )
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=5)
+
+    def record(self, image_key, report, source="app"):
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT INTO quality_scores (image_key, source, scores, issues, passed, created) VALUES (?, ?, ?, ?, ?, ?)",
+                    (image_key, source, json.dumps(report.scores), ",".join(report.issues), int(report.passed), time.time()),
+                )
+        except sqlite3.Error:
+            # Recording is for tuning only and must never block an upload
+            pass
+
+    def stats(self):
+        try:
+            with self._connect() as conn:
+                total, passed = conn.execute(
+                    "SELECT COUNT(*), COALESCE(SUM(passed), 0) FROM quality_scores"
+                ).fetchone()
+                issues = conn.execute("SELECT issues FROM quality_scores WHERE passed = 0").fetchall()
+        except sqlite3.Error:
+            return {}
+        counts = {}
+        for (names,) in issues:
+            for name in names.split(","):
+                counts[name] = counts.get(name, 0) + 1
+        return {"uploads": total, "passed": passed, "pass_rate": passed / total if total else 1.0, "issues": counts}
@@ -0,0 +1,194 @@
+"""Process-wide queue of background analysis jobs that outlive the Streamlit script run
+
+A job runs on one of a fixed number of worker threads, so a rerun or a
+browser reconnect no longer throws away a request that is already paid for,
+and the worker count caps how many pipelines (model call plus TTS) run at
+once in this server process. Callers keep the job ID, poll ``snapshot()``
+for progress and collect ``result`` once it is done. Finished jobs are kept
+for a while so a reloaded page can still collect them.
+"""
+import heapq
+import itertools
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+from scheduler import PRIORITY_NORMAL
+
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+job_logger = logging.getLogger("cavatyai.jobs")
+
+
+class JobQueueFull(Exception):
+    """Too many jobs are already waiting for a worker"""
+
+
+class Job:
+    """One background run and the progress it has reported so far
+
+    ``on_stage``, ``on_field`` and ``on_queue`` match the callbacks of
+    ``run_analysis_pipeline`` and may be called from any thread.
+    """
+
+    def __init__(self, fn, context=None, priority=PRIORITY_NORMAL):
+        self.id = uuid.uuid4().hex
+        self.fn = fn
+        self.priority = priority
+        # Caller data needed to use the result later (language, voice, ...)
+        self.context = dict(context or {})
+        self.status = QUEUED
+        self.created = time.time()
+        self.started = None
+        self.finished = None
+        self.result = None
+        self.error = None
+        self.done = threading.Event()
+        self._lock = threading.Lock()
+        self._stages = []
+        self._total = None
+        self._fields = {}
+        self._queue_position = None
+
+    def on_stage(self, stage, result, completed, total):
+        with self._lock:
+            self._stages.append(stage)
+            self._total = total
+
+    def on_field(self, key, value):
+        with self._lock:
+            self._fields[key] = value
+
+    def on_queue(self, position):
+        with self._lock:
+            self._queue_position = position or None
+
+    def snapshot(self):
+        """Copy of the job's state that is safe to render"""
+        with self._lock:
+            return {
+                "id": self.id,
+                "status": self.status,
+                "stages": list(self._stages),
+                "total": self._total,
+                "fields": dict(self._fields),
+                "queue_position": self._queue_position,
+                "elapsed_s": round((self.finished or time.time()) - (self.started or self.created), 2),
+            }
+
+
+class JobQueue:
+    """Priority queue of jobs served by ``workers`` daemon threads, started on first use
+
+    Lower ``priority`` values start first, like the request scheduler's, and
+    jobs of equal priority start in submission order. At most ``max_pending`` jobs wait at once; ``submit`` raises
+    JobQueueFull beyond that. Finished jobs are forgotten after
+    ``retention_seconds`` or once more than ``max_finished`` are kept.
+    """
+
+    def __init__(self, workers=4, max_pending=64, retention_seconds=3600, max_finished=256):
+        self.workers = max(1, workers)
+        self.max_pending = max_pending
+        self.retention_seconds = retention_seconds
+        self.max_finished = max_finished
+        self._cond = threading.Condition()
+        # Heap of (priority, sequence, job)
+        self._waiting = []
+        self._sequence = itertools.count()
+        self._jobs = OrderedDict()
+        self._threads = []
+        self.running = 0
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+
+    def submit(self, fn, context=None, priority=PRIORITY_NORMAL):
+        """Queue ``fn(job)`` and return the Job; its progress callbacks live on the job"""
+        job = Job(fn, context, priority)
+        with self._cond:
+            self._prune()
+            if len(self._waiting) >= self.max_pending:
+                self.rejected += 1
+                raise JobQueueFull(f"{len(self._waiting)} analyses are already waiting")
+            self._jobs[job.id] = job
+            heapq.heappush(self._waiting, (priority, next(self._sequence), job))
+            self.submitted += 1
+            while len(self._threads) < self.workers:
+                thread = threading.Thread(target=self._work, name=f"job-worker-{len(self._threads)}", daemon=True)
+                self._threads.append(thread)
+                thread.start()
+            self._cond.notify()
+        return job
+
+    def get(self, job_id):
+        """The job with this ID, or None if it is unknown or expired"""
+        with self._cond:
+            return self._jobs.get(job_id)
+
+    def position(self, job):
+        """1-based place among the jobs waiting for a worker, or 0 once it has started"""
+        with self._cond:
+            entry = next((entry for entry in self._waiting if entry[2] is job), None)
+            if entry is None:
+                return 0
+            return sum(1 for other in self._waiting if other[:2] <= entry[:2])
+
+    def _work(self):
+        while True:
+            with self._cond:
+                while not self._waiting:
+                    self._cond.wait()
+                _, _, job = heapq.heappop(self._waiting)
+                job.status = RUNNING
+                job.started = time.time()
+                self.running += 1
+
+            try:
+                result = job.fn(job)
+            except Exception as e:
+                job_logger.exception("Job %s failed", job.id)
+                job.error = e
+                status = FAILED
+            else:
+                job.result = result
+                status = DONE
+
+            # Drop the closure (and the uploads it holds) as soon as it has run
+            job.fn = None
+            with self._cond:
+                job.status = status
+                job.finished = time.time()
+                self.running -= 1
+                if status == DONE:
+                    self.completed += 1
+                else:
+                    self.failed += 1
+            job.done.set()
+
+    def _prune(self):
+        now = time.time()
+        finished = [job for job in self._jobs.values() if job.finished is not None]
+        expired = [job for job in finished if now - job.finished > self.retention_seconds]
+        kept = [job for job in finished if now - job.finished <= self.retention_seconds]
+        for job in expired + kept[:max(0, len(kept) - self.max_finished)]:
+            self._jobs.pop(job.id, None)
+
+    def stats(self):
+        with self._cond:
+            return {
+                "workers": self.workers,
+                "queued": len(self._waiting),
+                "running": self.running,
+                "kept": len(self._jobs),
+                "submitted": self.submitted,
+                "completed": self.completed,
+                "failed": self.failed,
+                "rejected": self.rejected,
+            }
@@ -0,0 +1,71 @@
+"""Incremental parser that yields top-level JSON fields as they complete"""
+import json
+
+
+class FieldStreamParser:
+    """Feed text chunks of a JSON object; get back each ``(key, value)`` once it is complete
+
+    Anything before the first ``{`` (prose, a ```json fence) is ignored, and
+    only members of the outermost object are reported. The scan is a single
+    pass over the text, so feeding a whole response costs O(n).
+    """
+
+    def __init__(self):
+        self.fields = {}
+        self.done = False
+        self._text = ""
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._member_start = None
+
+    def feed(self, chunk):
+        completed = []
+        if self.done or not chunk:
+            return completed
+        self._text += chunk
+
+        text = self._text
+        while self._pos < len(text):
+            ch = text[self._pos]
+            if self._member_start is None:
+                if ch == "{":
+                    self._depth = 1
+                    self._member_start = self._pos + 1
+            elif self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+            elif ch == '"':
+                self._in_string = True
+            elif ch in "{[":
+                self._depth += 1
+            elif ch in "}]":
+                self._depth -= 1
+                if self._depth == 0:
+                    self._emit(text[self._member_start:self._pos], completed)
+                    self.done = True
+                    self._pos += 1
+                    break
+            elif ch == "," and self._depth == 1:
+                self._emit(text[self._member_start:self._pos], completed)
+                self._member_start = self._pos + 1
+            self._pos += 1
+        return completed
+
+    def _emit(self, member, completed):
+        member = member.strip()
+        if not member:
+            return
+        try:
+            pair = json.loads("{" + member + "}")
+        except json.JSONDecodeError:
+            # Malformed member; the final whole-document parse decides what to do
+            return
+        for key, value in pair.items():
+            self.fields[key] = value
+            completed.append((key, value))
@@ -0,0 +1,86 @@
+"""Per-language string catalogs, each imported the first time its language is used
+
+Every ``locales/<lang>.py`` defines ``UI`` (app labels), ``SUMMARY`` (the
+narrated summary), ``REPORT`` (the downloadable report) and ``VALUES`` (the
+closed-set analysis values). Keys a catalog lacks fall back to English.
+"""
+import importlib
+import re
+from functools import lru_cache
+
+
+LANGUAGES = ("en", "hi", "es", "ta")
+DEFAULT_LANGUAGE = "en"
+
+# Edge TTS voices per language as {label: voice}; the first one is the default
+VOICES = {
+    "en": {
+        "🇺🇸 Aria (Female)": "en-US-AriaNeural",
+        "🇺🇸 Guy (Male)": "en-US-GuyNeural",
+        "🇺🇸 Jenny (Female)": "en-US-JennyNeural",
+        "🇬🇧 Libby (Female)": "en-GB-LibbyNeural",
+        "🇬🇧 Ryan (Male)": "en-GB-RyanNeural"
+    },
+    "hi": {
+        "🇮🇳 Swara (Female)": "hi-IN-SwaraNeural",
+        "🇮🇳 Madhur (Male)": "hi-IN-MadhurNeural"
+    },
+    "es": {
+        "🇪🇸 Elvira (Female)": "es-ES-ElviraNeural",
+        "🇪🇸 Alvaro (Male)": "es-ES-AlvaroNeural",
+        "🇲🇽 Dalia (Female)": "es-MX-DaliaNeural",
+        "🇲🇽 Jorge (Male)": "es-MX-JorgeNeural"
+    },
+    "ta": {
+        "🇮🇳 Pallavi (Female)": "ta-IN-PallaviNeural",
+        "🇮🇳 Valluvar (Male)": "ta-IN-ValluvarNeural"
+    }
+}
+
+
+def voices(lang):
+    """``{label: voice}`` for ``lang``; unknown codes get the English voices"""
+    return VOICES.get(lang, VOICES[DEFAULT_LANGUAGE])
+
+
+def default_voice(lang):
+    return next(iter(voices(lang).values()))
+
+
+@lru_cache(maxsize=None)
+def load_catalog(lang):
+    """The catalog module for ``lang``; unknown codes get English"""
+    if lang not in LANGUAGES:
+        lang = DEFAULT_LANGUAGE
+    return importlib.import_module(f"{__name__}.{lang}")
+
+
+@lru_cache(maxsize=None)
+def strings(lang, section):
+    """One section of a catalog with English filling the gaps (shared; do not mutate)"""
+    merged = dict(getattr(load_catalog(DEFAULT_LANGUAGE), section))
+    merged.update(getattr(load_catalog(lang), section, {}))
+    return merged
+
+
+def stage_number(value):
+    """Stage 0-4 named in a ``cavity_stage`` value such as "Stage 2 - Dentin decay", or None"""
+    match = re.search(r"\d+", value or "")
+    if match is None or int(match.group()) > 4:
+        return None
+    return int(match.group())
+
+
+def value_label(lang, field, value):
+    """Label of a ``cavity_stage``, ``severity_level`` or ``emergency_level`` value in ``lang``
+
+    The schema keeps these in English so the app can branch on them; values
+    the catalog does not know are returned unchanged.
+    """
+    text = strings(lang, "VALUES")
+    if field == "cavity_stage":
+        number = stage_number(value)
+        if number is None:
+            return value
+        return text["cavity_stage"].format(number=number, name=text[f"cavity_stage_{number}"])
+    return text.get(f"{field}_{str(value).strip().lower()}", value)
@@ -0,0 +1,190 @@
+"""English strings: app labels, the narrated summary, the text report and analysis values"""
+
+UI = {
+    "page_title": "🦷 Dental Analysis Portal",
+    "main_header": "🦷 Dental Analysis Portal",
+    "config": "⚙️ Configuration",
+    "api_key_found": "✅ OpenRouter API Key found in environment variables",
+    "api_key_not_found": "⚠️ OpenRouter API Key not found in environment variables",
+    "api_key_label": "OpenRouter API Key",
+    "language_selection": "🌍 Language / भाषा / Idioma",
+    "audio_settings": "🎵 Audio Settings",
+    "voice_selection": "Voice Selection",
+    "speech_speed": "Speech Speed",
+    "instructions": "📋 Instructions",
+    "instructions_text": """
+    1. Enter your OpenRouter API key
+    2. Upload a clear image of the tooth/teeth
+    3. Click 'Analyze Image' for instant analysis
+    4. Get both report and audio summary automatically
+    
+    **Image Tips:**
+    - Use good lighting
+    - Keep the camera steady
+    - Focus on the affected area
+    - Avoid blurry images
+    """,
+    "disclaimer": "⚠️ Disclaimer",
+    "disclaimer_text": "This AI analysis is for educational purposes only and should not replace professional dental consultation. Always consult with a qualified dentist for proper diagnosis and treatment.",
+    "welcome_title": "Welcome to the Dental Analysis Portal",
+    "welcome_text": "This AI-powered tool helps analyze dental images to identify potential cavities and provide comprehensive oral health insights with instant audio summaries.",
+    "enter_api_key": "Please enter your OpenRouter API key in the sidebar to get started.",
+    "upload_image": "📤 Upload Tooth Image",
+    "upload_help": "Upload one or more clear images of the tooth or dental area you want analyzed (e.g. upper, lower and both sides)",
+    "uploaded_image": "Uploaded Image",
+    "image_label": "Label",
+    "per_image_results": "🖼️ Findings by Image",
+    "default_views": ["Upper arch", "Lower arch", "Left side", "Right side"],
+    "quality_blurry": "The photo looks blurry. Hold the camera steady and tap to focus on the teeth.",
+    "quality_underexposed": "The photo is too dark. Use more light or the camera flash.",
+    "quality_overexposed": "The photo is overexposed. Avoid direct glare and reduce the light.",
+    "quality_low_resolution": "The photo resolution is too low. Move closer or use a higher resolution.",
+    "quality_rejected": "Please retake the flagged photos before analysis.",
+    "analyze_button": "🔍 Analyze Image & Generate Audio",
+    "analyzing": "🤖 Analyzing dental image...",
+    "queue_position": "⏳ Waiting for a free analysis slot: position {position} in queue",
+    "job_queued": "⏳ Waiting for a free analysis worker (number {position} in line)...",
+    "job_resumed": "🔄 Your last analysis is still available:",
+    "job_failed": "❌ The analysis could not be completed. Please try again.",
+    "job_queue_full": "⏳ The server is busy with other analyses. Please try again in a minute.",
+    "emergency_reanalysis": "🚨 Emergency Re-analysis",
+    "emergency_help": "Re-run the analysis ahead of queued routine requests",
+    "generating_audio": "🎙️ Generating audio summary...",
+    "creating_audio": "🎵 Creating audio file...",
+    "analysis_complete": "✅ Analysis complete!",
+    "analysis_results": "📊 Analysis Results",
+    "audio_summary": "🎵 Audio Summary",
+    "audio_summary_text": "Listen to your dental analysis summary below:",
+    "download_audio": "💾 Download Audio",
+    "download_report": "📄 Download Report",
+    "download_script": "📝 Download Script",
+    "download_bundle": "📦 Download All (ZIP)",
+    "download_json": "🧾 Download JSON",
+    "download_html": "🌐 Download HTML Report",
+    "audio_failed": "🔊 Audio generation failed, but you can still download the text summary:",
+    "audio_script": "Audio Script",
+    "audio_unavailable": "🔇 The voice service is unavailable right now, so audio is paused. The text script is below.",
+    "audio_timeout": "⏱️ The voice service took too long to respond. The text script is below.",
+    "audio_error": "🔊 Audio could not be generated right now. The text script is below.",
+    "audio_not_installed": "Edge TTS is not installed. Please install it with: pip install edge-tts",
+    "degraded_model": "⚠️ The analysis service is unavailable right now. Image processing and quality checks still work; analysis will be tried again in about {seconds}s.",
+    "degraded_tts": "🔇 The voice service is unavailable right now. Results come with a text script instead of audio until it recovers.",
+    "analysis_failed": "❌ Analysis Failed",
+    "analysis_error": "Analysis Error",
+    "raw_response": "Raw Response",
+    "error_hint_auth": "Check that your OpenRouter API key is valid and has credit.",
+    "error_hint_rate_limited": "OpenRouter is rate limiting requests. Please wait a moment and try again.",
+    "error_hint_upstream": "The model provider is having problems. Please try again shortly.",
+    "error_hint_timeout": "The model took too long to respond. Please try again.",
+    "error_hint_connection": "Could not connect to OpenRouter. Check the server's network connection.",
+    "error_hint_bad_request": "The request was rejected. Try a different image.",
+    "error_hint_invalid_response": "The model returned an unexpected answer. Please try again.",
+    "error_hint_unavailable": "Requests to the model are paused after repeated failures. Image processing and quality checks still work.",
+    "cavity_stages_guide": "📚 Cavity Stages Guide",
+    "stage_0": "No Cavity",
+    "stage_0_desc": "Healthy tooth or very early demineralization",
+    "stage_1": "Early Enamel Decay",
+    "stage_1_desc": "White spots or early enamel damage",
+    "stage_2": "Dentin Decay",
+    "stage_2_desc": "Cavity has reached the dentin layer",
+    "stage_3": "Pulp Involvement",
+    "stage_3_desc": "Infection has reached the tooth's pulp",
+    "stage_4": "Abscess/Severe",
+    "stage_4_desc": "Advanced infection, possible abscess",
+    "visible_issues": "👁️ Visible Issues",
+    "possible_causes": "🔍 Possible Causes",
+    "affected_teeth": "🦷 Affected Teeth",
+    "recommended_treatments": "💉 Recommended Treatments",
+    "immediate_concerns": "🚨 Immediate Concerns",
+    "dentist_timeline": "📅 Dental Visit Timeline",
+    "prevention_tips": "🛡️ Prevention Tips",
+    "home_care": "🏠 Home Care Instructions",
+    "additional_details": "📊 Additional Analysis Details",
+    "severity_banner": "{stage} - {severity} Severity",
+    "emergency_priority": "{emergency} Priority",
+    "emergency_alert": "⚠️ Emergency Alert",
+    "emergency_text": "Immediate dental attention recommended!",
+    "image_processing": "🖼️ Image Processing & Analysis",
+    "grayscale": "Grayscale",
+    "edge_detection": "Canny Edge Detection",
+    "clahe_enhanced": "CLAHE Enhanced",
+    "histogram_title": "Histogram of Pixel Intensities",
+    "pixel_intensity": "Pixel Intensity",
+    "frequency": "Frequency"
+}
+
+SUMMARY = {
+    "error": "An error occurred during the dental analysis. Please try again with a different image.",
+    "title": "Dental Analysis Summary.",
+    "stage": "Cavity stage: {stage}. Severity level: {severity}.",
+    "emergency": "Emergency level: {emergency}. Immediate dental attention is recommended.",
+    "views": "Findings by view: {views}.",
+    "visible_issues": "Visible issues include: {items}.",
+    "treatments": "Recommended treatments: {items}.",
+    "home_care": "Home care instructions: {items}.",
+    "dentist": "When to see dentist: {timeline}.",
+    "unknown": "Unknown",
+    "image": "Image",
+    "as_soon_as_possible": "As soon as possible",
+    "list_separator": ", ",
+    "view_separator": "; ",
+}
+
+REPORT = {
+    "error": "Analysis Error: Unable to generate report",
+    "title": "DENTAL ANALYSIS REPORT",
+    "generated": "Generated",
+    "summary": "SUMMARY",
+    "cavity_stage": "Cavity Stage",
+    "severity": "Severity",
+    "emergency_level": "Emergency Level",
+    "cavity_present": "Cavity Present",
+    "yes": "Yes",
+    "no": "No",
+    "visible_issues": "VISIBLE ISSUES",
+    "possible_causes": "POSSIBLE CAUSES",
+    "recommended_treatments": "RECOMMENDED TREATMENTS",
+    "immediate_concerns": "IMMEDIATE CONCERNS",
+    "prevention_tips": "PREVENTION TIPS",
+    "home_care": "HOME CARE INSTRUCTIONS",
+    "per_image": "PER-IMAGE FINDINGS",
+    "additional_information": "ADDITIONAL INFORMATION",
+    "when_to_see_dentist": "When to See Dentist",
+    "estimated_timeline": "Estimated Timeline",
+    "prognosis": "Prognosis",
+    "affected_teeth": "Affected Teeth",
+    "additional_notes": "Additional Notes",
+    "unknown": "Unknown",
+    "none": "None",
+    "none_identified": "None identified",
+    "not_specified": "Not specified",
+    "consult_dentist": "Consult dentist",
+    "default_prevention": "Maintain good oral hygiene",
+    "default_home_care": "Follow dentist recommendations",
+    "as_soon_as_possible": "As soon as possible",
+    "default_prognosis": "Consult dentist for detailed prognosis",
+    "image": "Image",
+    "disclaimer_title": "DISCLAIMER",
+    "disclaimer": """This AI analysis is for educational purposes only and should not replace 
+professional dental consultation. Always consult with a qualified dentist 
+for proper diagnosis and treatment.""",
+}
+
+VALUES = {
+    "cavity_stage": "Stage {number} - {name}",
+    "cavity_stage_0": "No cavity",
+    "cavity_stage_1": "Early enamel decay",
+    "cavity_stage_2": "Dentin decay",
+    "cavity_stage_3": "Pulp involvement",
+    "cavity_stage_4": "Abscess / severe infection",
+    "severity_level_none": "None",
+    "severity_level_mild": "Mild",
+    "severity_level_moderate": "Moderate",
+    "severity_level_severe": "Severe",
+    "severity_level_critical": "Critical",
+    "emergency_level_none": "None",
+    "emergency_level_low": "Low",
+    "emergency_level_medium": "Medium",
+    "emergency_level_high": "High",
+    "emergency_level_critical": "Critical",
+}
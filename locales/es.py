@@ -0,0 +1,188 @@
+"""Spanish strings: app labels, the narrated summary, the text report and analysis values"""
+
+UI = {
+    "page_title": "🦷 Portal de Análisis Dental",
+    "main_header": "🦷 Portal de Análisis Dental",
+    "config": "⚙️ Configuración",
+    "api_key_found": "✅ Clave API de OpenRouter encontrada en variables de entorno",
+    "api_key_not_found": "⚠️ Clave API de OpenRouter no encontrada en variables de entorno",
+    "api_key_label": "Clave API de OpenRouter",
+    "language_selection": "🌍 Seleccionar Idioma / Language / भाषा",
+    "audio_settings": "🎵 Configuración de Audio",
+    "voice_selection": "Selección de Voz",
+    "speech_speed": "Velocidad del Habla",
+    "instructions": "📋 Instrucciones",
+    "instructions_text": """
+    1. Ingrese su clave API de OpenRouter
+    2. Cargue una imagen clara del diente/dientes
+    3. Haga clic en 'Analizar Imagen' para análisis instantáneo
+    4. Obtenga automáticamente el informe y resumen de audio
+    
+    **Consejos de Imagen:**
+    - Use buena iluminación
+    - Mantenga la cámara estable
+    - Enfoque en el área afectada
+    - Evite imágenes borrosas
+    """,
+    "disclaimer": "⚠️ Descargo de Responsabilidad",
+    "disclaimer_text": "Este análisis de IA es solo para fines educativos y no debe reemplazar la consulta dental profesional. Siempre consulte con un dentista calificado para un diagnóstico y tratamiento adecuados.",
+    "welcome_title": "Bienvenido al Portal de Análisis Dental",
+    "welcome_text": "Esta herramienta impulsada por IA ayuda a analizar imágenes dentales para identificar posibles caries y proporcionar información completa sobre la salud bucal con resúmenes de audio instantáneos.",
+    "enter_api_key": "Por favor, ingrese su clave API de OpenRouter en la barra lateral para comenzar.",
+    "upload_image": "📤 Cargar Imagen Dental",
+    "upload_help": "Cargue una imagen clara del diente o área dental que desea analizar",
+    "uploaded_image": "Imagen Cargada",
+    "image_label": "Etiqueta",
+    "per_image_results": "🖼️ Hallazgos por Imagen",
+    "default_views": ["Arcada superior", "Arcada inferior", "Lado izquierdo", "Lado derecho"],
+    "quality_blurry": "La foto parece borrosa. Mantenga la cámara firme y enfoque los dientes.",
+    "quality_underexposed": "La foto está demasiado oscura. Use más luz o el flash.",
+    "quality_overexposed": "La foto está sobreexpuesta. Evite reflejos directos y reduzca la luz.",
+    "quality_low_resolution": "La resolución de la foto es demasiado baja. Acérquese o use una resolución mayor.",
+    "quality_rejected": "Vuelva a tomar las fotos marcadas antes del análisis.",
+    "analyze_button": "🔍 Analizar Imagen y Generar Audio",
+    "analyzing": "🤖 Analizando imagen dental...",
+    "queue_position": "⏳ Esperando un espacio de análisis: posición {position} en la cola",
+    "job_queued": "⏳ Esperando un trabajador de análisis libre (número {position} en la fila)...",
+    "job_resumed": "🔄 Su último análisis sigue disponible:",
+    "job_failed": "❌ No se pudo completar el análisis. Por favor, inténtelo de nuevo.",
+    "job_queue_full": "⏳ El servidor está ocupado con otros análisis. Por favor, inténtelo de nuevo en un minuto.",
+    "emergency_reanalysis": "🚨 Reanálisis de Emergencia",
+    "emergency_help": "Vuelve a ejecutar el análisis antes que las solicitudes rutinarias en cola",
+    "generating_audio": "🎙️ Generando resumen de audio...",
+    "creating_audio": "🎵 Creando archivo de audio...",
+    "analysis_complete": "✅ ¡Análisis completo!",
+    "analysis_results": "📊 Resultados del Análisis",
+    "audio_summary": "🎵 Resumen de Audio",
+    "audio_summary_text": "Escuche su resumen de análisis dental a continuación:",
+    "download_audio": "💾 Descargar Audio",
+    "download_report": "📄 Descargar Informe",
+    "download_script": "📝 Descargar Guión",
+    "download_bundle": "📦 Descargar Todo (ZIP)",
+    "download_json": "🧾 Descargar JSON",
+    "download_html": "🌐 Descargar Informe HTML",
+    "audio_failed": "🔊 La generación de audio falló, pero aún puede descargar el resumen de texto:",
+    "audio_script": "Guión de Audio",
+    "audio_unavailable": "🔇 El servicio de voz no está disponible en este momento, por lo que el audio está en pausa. El guión de texto está abajo.",
+    "audio_timeout": "⏱️ El servicio de voz tardó demasiado en responder. El guión de texto está abajo.",
+    "audio_error": "🔊 No se pudo generar el audio en este momento. El guión de texto está abajo.",
+    "audio_not_installed": "Edge TTS no está instalado. Instálelo con: pip install edge-tts",
+    "degraded_model": "⚠️ El servicio de análisis no está disponible en este momento. El procesamiento de imágenes y los controles de calidad siguen funcionando; el análisis se volverá a intentar en unos {seconds}s.",
+    "degraded_tts": "🔇 El servicio de voz no está disponible en este momento. Los resultados incluyen un guión de texto en lugar de audio hasta que se recupere.",
+    "analysis_failed": "❌ Análisis Fallido",
+    "analysis_error": "Error de Análisis",
+    "raw_response": "Respuesta sin Procesar",
+    "error_hint_auth": "Compruebe que su clave de API de OpenRouter sea válida y tenga crédito.",
+    "error_hint_rate_limited": "OpenRouter está limitando las solicitudes. Espere un momento e inténtelo de nuevo.",
+    "error_hint_upstream": "El proveedor del modelo tiene problemas. Inténtelo de nuevo en breve.",
+    "error_hint_timeout": "El modelo tardó demasiado en responder. Inténtelo de nuevo.",
+    "error_hint_connection": "No se pudo conectar con OpenRouter. Compruebe la conexión de red del servidor.",
+    "error_hint_bad_request": "La solicitud fue rechazada. Pruebe con otra imagen.",
+    "error_hint_invalid_response": "El modelo devolvió una respuesta inesperada. Inténtelo de nuevo.",
+    "error_hint_unavailable": "Las solicitudes al modelo están en pausa tras fallos repetidos. El procesamiento de imágenes y los controles de calidad siguen funcionando.",
+    "cavity_stages_guide": "📚 Guía de Etapas de Caries",
+    "stage_0": "Sin Caries",
+    "stage_0_desc": "Diente sano o desmineralización muy temprana",
+    "stage_1": "Caries Temprana del Esmalte",
+    "stage_1_desc": "Manchas blancas o daño temprano del esmalte",
+    "stage_2": "Caries de Dentina",
+    "stage_2_desc": "La caries ha alcanzado la capa de dentina",
+    "stage_3": "Afectación Pulpar",
+    "stage_3_desc": "La infección ha alcanzado la pulpa del diente",
+    "stage_4": "Absceso/Grave",
+    "stage_4_desc": "Infección avanzada, posible absceso",
+    "visible_issues": "👁️ Problemas Visibles",
+    "possible_causes": "🔍 Causas Posibles",
+    "affected_teeth": "🦷 Dientes Afectados",
+    "recommended_treatments": "💉 Tratamientos Recomendados",
+    "immediate_concerns": "🚨 Preocupaciones Inmediatas",
+    "dentist_timeline": "📅 Cronograma de Visita al Dentista",
+    "prevention_tips": "🛡️ Consejos de Prevención",
+    "home_care": "🏠 Instrucciones de Cuidado en Casa",
+    "additional_details": "📊 Detalles Adicionales del Análisis",
+    "severity_banner": "{stage} - Gravedad: {severity}",
+    "emergency_priority": "Prioridad: {emergency}",
+    "emergency_alert": "⚠️ Alerta de Emergencia",
+    "emergency_text": "¡Se recomienda atención dental inmediata!",
+    "image_processing": "🖼️ Procesamiento y Análisis de Imagen",
+    "grayscale": "Escala de Grises",
+    "edge_detection": "Detección de Bordes Canny",
+    "clahe_enhanced": "Mejorado CLAHE",
+    "histogram_title": "Histograma de Intensidades de Píxeles",
+    "pixel_intensity": "Intensidad de Píxel",
+    "frequency": "Frecuencia"
+}
+
+SUMMARY = {
+    "error": "Se produjo un error durante el análisis dental. Inténtelo de nuevo con otra imagen.",
+    "title": "Resumen del Análisis Dental.",
+    "stage": "Etapa de caries: {stage}. Nivel de gravedad: {severity}.",
+    "emergency": "Nivel de emergencia: {emergency}. Se recomienda atención dental inmediata.",
+    "views": "Hallazgos por imagen: {views}.",
+    "visible_issues": "Problemas visibles: {items}.",
+    "treatments": "Tratamientos recomendados: {items}.",
+    "home_care": "Instrucciones de cuidado en casa: {items}.",
+    "dentist": "Cuándo ver al dentista: {timeline}.",
+    "unknown": "Desconocido",
+    "image": "Imagen",
+    "as_soon_as_possible": "Lo antes posible",
+}
+
+REPORT = {
+    "error": "Error de Análisis: No se pudo generar el informe",
+    "title": "INFORME DE ANÁLISIS DENTAL",
+    "generated": "Generado",
+    "summary": "RESUMEN",
+    "cavity_stage": "Etapa de Caries",
+    "severity": "Gravedad",
+    "emergency_level": "Nivel de Emergencia",
+    "cavity_present": "Caries Presente",
+    "yes": "Sí",
+    "no": "No",
+    "visible_issues": "PROBLEMAS VISIBLES",
+    "possible_causes": "CAUSAS POSIBLES",
+    "recommended_treatments": "TRATAMIENTOS RECOMENDADOS",
+    "immediate_concerns": "PREOCUPACIONES INMEDIATAS",
+    "prevention_tips": "CONSEJOS DE PREVENCIÓN",
+    "home_care": "INSTRUCCIONES DE CUIDADO EN CASA",
+    "per_image": "HALLAZGOS POR IMAGEN",
+    "additional_information": "INFORMACIÓN ADICIONAL",
+    "when_to_see_dentist": "Cuándo Ver al Dentista",
+    "estimated_timeline": "Cronología Estimada",
+    "prognosis": "Pronóstico",
+    "affected_teeth": "Dientes Afectados",
+    "additional_notes": "Notas Adicionales",
+    "unknown": "Desconocido",
+    "none": "Ninguno",
+    "none_identified": "Ninguno identificado",
+    "not_specified": "No especificado",
+    "consult_dentist": "Consulte a su dentista",
+    "default_prevention": "Mantenga una buena higiene bucal",
+    "default_home_care": "Siga las recomendaciones de su dentista",
+    "as_soon_as_possible": "Lo antes posible",
+    "default_prognosis": "Consulte a su dentista para un pronóstico detallado",
+    "image": "Imagen",
+    "disclaimer_title": "AVISO",
+    "disclaimer": """Este análisis de IA es solo para fines educativos y no debe reemplazar la
+consulta dental profesional. Siempre consulte con un dentista calificado para
+un diagnóstico y tratamiento adecuados.""",
+}
+
+VALUES = {
+    "cavity_stage": "Etapa {number} - {name}",
+    "cavity_stage_0": "Sin caries",
+    "cavity_stage_1": "Caries temprana del esmalte",
+    "cavity_stage_2": "Caries de dentina",
+    "cavity_stage_3": "Afectación pulpar",
+    "cavity_stage_4": "Absceso / infección grave",
+    "severity_level_none": "Ninguna",
+    "severity_level_mild": "Leve",
+    "severity_level_moderate": "Moderada",
+    "severity_level_severe": "Grave",
+    "severity_level_critical": "Crítica",
+    "emergency_level_none": "Ninguno",
+    "emergency_level_low": "Bajo",
+    "emergency_level_medium": "Medio",
+    "emergency_level_high": "Alto",
+    "emergency_level_critical": "Crítico",
+}
@@ -0,0 +1,188 @@
+"""Hindi strings: app labels, the narrated summary, the text report and analysis values"""
+
+UI = {
+    "page_title": "🦷 दंत विश्लेषण पोर्टल",
+    "main_header": "🦷 दंत विश्लेषण पोर्टल",
+    "config": "⚙️ कॉन्फ़िगरेशन",
+    "api_key_found": "✅ OpenRouter API कुंजी पर्यावरण चर में मिली",
+    "api_key_not_found": "⚠️ OpenRouter API कुंजी पर्यावरण चर में नहीं मिली",
+    "api_key_label": "OpenRouter API कुंजी",
+    "language_selection": "🌍 भाषा चुनें / Language / Idioma",
+    "audio_settings": "🎵 ऑडियो सेटिंग्स",
+    "voice_selection": "आवाज़ चयन",
+    "speech_speed": "बोलने की गति",
+    "instructions": "📋 निर्देश",
+    "instructions_text": """
+    1. अपनी OpenRouter API कुंजी दर्ज करें
+    2. दांत/दांतों की स्पष्ट तस्वीर अपलोड करें
+    3. त्वरित विश्लेषण के लिए 'छवि विश्लेषण करें' पर क्लिक करें
+    4. स्वचालित रूप से रिपोर्ट और ऑडियो सारांश प्राप्त करें
+    
+    **छवि सुझाव:**
+    - अच्छी रोशनी का उपयोग करें
+    - कैमरा स्थिर रखें
+    - प्रभावित क्षेत्र पर फोकस करें
+    - धुंधली छवियों से बचें
+    """,
+    "disclaimer": "⚠️ अस्वीकरण",
+    "disclaimer_text": "यह AI विश्लेषण केवल शैक्षिक उद्देश्यों के लिए है और पेशेवर दंत परामर्श का स्थान नहीं ले सकता। उचित निदान और उपचार के लिए हमेशा योग्य दंत चिकित्सक से परामर्श करें।",
+    "welcome_title": "दंत विश्लेषण पोर्टल में आपका स्वागत है",
+    "welcome_text": "यह AI-संचालित उपकरण दंत छवियों का विश्लेषण करने में मदद करता है ताकि संभावित कैविटी की पहचान की जा सके और तत्काल ऑडियो सारांश के साथ व्यापक मौखिक स्वास्थ्य जानकारी प्रदान की जा सके।",
+    "enter_api_key": "शुरू करने के लिए कृपया साइडबार में अपनी OpenRouter API कुंजी दर्ज करें।",
+    "upload_image": "📤 दांत की छवि अपलोड करें",
+    "upload_help": "विश्लेषण के लिए दांत या दंत क्षेत्र की स्पष्ट छवि अपलोड करें",
+    "uploaded_image": "अपलोड की गई छवि",
+    "image_label": "लेबल",
+    "per_image_results": "🖼️ छवि अनुसार निष्कर्ष",
+    "default_views": ["ऊपरी जबड़ा", "निचला जबड़ा", "बायां भाग", "दायां भाग"],
+    "quality_blurry": "फोटो धुंधली लग रही है। कैमरा स्थिर रखें और दांतों पर फोकस करें।",
+    "quality_underexposed": "फोटो बहुत अंधेरी है। अधिक रोशनी या फ्लैश का उपयोग करें।",
+    "quality_overexposed": "फोटो में बहुत अधिक रोशनी है। सीधी चमक से बचें।",
+    "quality_low_resolution": "फोटो का रिज़ॉल्यूशन बहुत कम है। पास जाएं या उच्च रिज़ॉल्यूशन का उपयोग करें।",
+    "quality_rejected": "विश्लेषण से पहले चिह्नित फोटो फिर से लें।",
+    "analyze_button": "🔍 छवि विश्लेषण करें और ऑडियो बनाएं",
+    "analyzing": "🤖 दंत छवि का विश्लेषण कर रहे हैं...",
+    "queue_position": "⏳ विश्लेषण स्लॉट की प्रतीक्षा: कतार में स्थान {position}",
+    "job_queued": "⏳ विश्लेषण वर्कर के खाली होने की प्रतीक्षा (कतार में संख्या {position})...",
+    "job_resumed": "🔄 आपका पिछला विश्लेषण अभी भी उपलब्ध है:",
+    "job_failed": "❌ विश्लेषण पूरा नहीं हो सका। कृपया फिर से प्रयास करें।",
+    "job_queue_full": "⏳ सर्वर अन्य विश्लेषणों में व्यस्त है। कृपया एक मिनट बाद फिर से प्रयास करें।",
+    "emergency_reanalysis": "🚨 आपातकालीन पुनः विश्लेषण",
+    "emergency_help": "कतार में लगे सामान्य अनुरोधों से पहले विश्लेषण दोबारा चलाएं",
+    "generating_audio": "🎙️ ऑडियो सारांश बना रहे हैं...",
+    "creating_audio": "🎵 ऑडियो फ़ाइल बना रहे हैं...",
+    "analysis_complete": "✅ विश्लेषण पूर्ण!",
+    "analysis_results": "📊 विश्लेषण परिणाम",
+    "audio_summary": "🎵 ऑडियो सारांश",
+    "audio_summary_text": "नीचे अपने दंत विश्लेषण सारांश को सुनें:",
+    "download_audio": "💾 ऑडियो डाउनलोड करें",
+    "download_report": "📄 रिपोर्ट डाउनलोड करें",
+    "download_script": "📝 स्क्रिप्ट डाउनलोड करें",
+    "download_bundle": "📦 सब कुछ डाउनलोड करें (ZIP)",
+    "download_json": "🧾 JSON डाउनलोड करें",
+    "download_html": "🌐 HTML रिपोर्ट डाउनलोड करें",
+    "audio_failed": "🔊 ऑडियो जेनरेशन विफल रहा, लेकिन आप अभी भी टेक्स्ट सारांश डाउनलोड कर सकते हैं:",
+    "audio_script": "ऑडियो स्क्रिप्ट",
+    "audio_unavailable": "🔇 वॉइस सेवा अभी उपलब्ध नहीं है, इसलिए ऑडियो रोका गया है। टेक्स्ट स्क्रिप्ट नीचे है।",
+    "audio_timeout": "⏱️ वॉइस सेवा ने जवाब देने में बहुत देर लगाई। टेक्स्ट स्क्रिप्ट नीचे है।",
+    "audio_error": "🔊 अभी ऑडियो नहीं बन सका। टेक्स्ट स्क्रिप्ट नीचे है।",
+    "audio_not_installed": "Edge TTS इंस्टॉल नहीं है। कृपया इसे इंस्टॉल करें: pip install edge-tts",
+    "degraded_model": "⚠️ विश्लेषण सेवा अभी उपलब्ध नहीं है। इमेज प्रोसेसिंग और गुणवत्ता जांच अभी भी काम करती हैं; लगभग {seconds} सेकंड में विश्लेषण फिर से आज़माया जाएगा।",
+    "degraded_tts": "🔇 वॉइस सेवा अभी उपलब्ध नहीं है। इसके ठीक होने तक परिणाम ऑडियो के बजाय टेक्स्ट स्क्रिप्ट के साथ आएंगे।",
+    "analysis_failed": "❌ विश्लेषण विफल",
+    "analysis_error": "विश्लेषण त्रुटि",
+    "raw_response": "मूल उत्तर",
+    "error_hint_auth": "जांचें कि आपकी OpenRouter API कुंजी मान्य है और उसमें क्रेडिट है।",
+    "error_hint_rate_limited": "OpenRouter अनुरोधों को सीमित कर रहा है। कृपया थोड़ा रुककर फिर से प्रयास करें।",
+    "error_hint_upstream": "मॉडल प्रदाता को समस्या हो रही है। कृपया थोड़ी देर में फिर से प्रयास करें।",
+    "error_hint_timeout": "मॉडल ने जवाब देने में बहुत समय लिया। कृपया फिर से प्रयास करें।",
+    "error_hint_connection": "OpenRouter से कनेक्ट नहीं हो सका। सर्वर का नेटवर्क कनेक्शन जांचें।",
+    "error_hint_bad_request": "अनुरोध अस्वीकार कर दिया गया। कोई दूसरी छवि आज़माएं।",
+    "error_hint_invalid_response": "मॉडल ने अप्रत्याशित उत्तर दिया। कृपया फिर से प्रयास करें।",
+    "error_hint_unavailable": "बार-बार विफलताओं के बाद मॉडल को भेजे जाने वाले अनुरोध रोक दिए गए हैं। छवि प्रसंस्करण और गुणवत्ता जांच अभी भी काम करती हैं।",
+    "cavity_stages_guide": "📚 कैविटी चरण गाइड",
+    "stage_0": "कोई कैविटी नहीं",
+    "stage_0_desc": "स्वस्थ दांत या बहुत प्रारंभिक डीमिनरलाइजेशन",
+    "stage_1": "प्रारंभिक इनेमल क्षय",
+    "stage_1_desc": "सफेद धब्बे या प्रारंभिक इनेमल क्षति",
+    "stage_2": "डेंटिन क्षय",
+    "stage_2_desc": "कैविटी डेंटिन परत तक पहुंच गई है",
+    "stage_3": "पल्प संलग्नता",
+    "stage_3_desc": "संक्रमण दांत के पल्प तक पहुंच गया है",
+    "stage_4": "फोड़ा/गंभीर",
+    "stage_4_desc": "उन्नत संक्रमण, संभावित फोड़ा",
+    "visible_issues": "👁️ दिखाई देने वाली समस्याएं",
+    "possible_causes": "🔍 संभावित कारण",
+    "affected_teeth": "🦷 प्रभावित दांत",
+    "recommended_treatments": "💉 अनुशंसित उपचार",
+    "immediate_concerns": "🚨 तत्काल चिंताएं",
+    "dentist_timeline": "📅 दंत चिकित्सक की यात्रा समयरेखा",
+    "prevention_tips": "🛡️ रोकथाम युक्तियाँ",
+    "home_care": "🏠 घरेलू देखभाल निर्देश",
+    "additional_details": "📊 अतिरिक्त विश्लेषण विवरण",
+    "severity_banner": "{stage} - गंभीरता: {severity}",
+    "emergency_priority": "{emergency} प्राथमिकता",
+    "emergency_alert": "⚠️ आपातकालीन चेतावनी",
+    "emergency_text": "तत्काल दंत चिकित्सा ध्यान अनुशंसित!",
+    "image_processing": "🖼️ छवि प्रसंस्करण और विश्लेषण",
+    "grayscale": "ग्रेस्केल",
+    "edge_detection": "कैनी एज डिटेक्शन",
+    "clahe_enhanced": "CLAHE एन्हांस्ड",
+    "histogram_title": "पिक्सेल तीव्रता का हिस्टोग्राम",
+    "pixel_intensity": "पिक्सेल तीव्रता",
+    "frequency": "आवृत्ति"
+}
+
+SUMMARY = {
+    "error": "दंत विश्लेषण के दौरान एक त्रुटि हुई। कृपया किसी दूसरी छवि के साथ फिर से प्रयास करें।",
+    "title": "दंत विश्लेषण सारांश।",
+    "stage": "कैविटी चरण: {stage}। गंभीरता स्तर: {severity}।",
+    "emergency": "आपातकालीन स्तर: {emergency}। तुरंत दंत चिकित्सा की सलाह दी जाती है।",
+    "views": "छवि अनुसार निष्कर्ष: {views}।",
+    "visible_issues": "दिखाई देने वाली समस्याएं: {items}।",
+    "treatments": "अनुशंसित उपचार: {items}।",
+    "home_care": "घरेलू देखभाल निर्देश: {items}।",
+    "dentist": "दंत चिकित्सक से कब मिलें: {timeline}।",
+    "unknown": "अज्ञात",
+    "image": "छवि",
+    "as_soon_as_possible": "जितनी जल्दी हो सके",
+}
+
+REPORT = {
+    "error": "विश्लेषण त्रुटि: रिपोर्ट नहीं बनाई जा सकी",
+    "title": "दंत विश्लेषण रिपोर्ट",
+    "generated": "तैयार किया गया",
+    "summary": "सारांश",
+    "cavity_stage": "कैविटी चरण",
+    "severity": "गंभीरता",
+    "emergency_level": "आपातकालीन स्तर",
+    "cavity_present": "कैविटी मौजूद",
+    "yes": "हाँ",
+    "no": "नहीं",
+    "visible_issues": "दिखाई देने वाली समस्याएं",
+    "possible_causes": "संभावित कारण",
+    "recommended_treatments": "अनुशंसित उपचार",
+    "immediate_concerns": "तत्काल चिंताएं",
+    "prevention_tips": "रोकथाम युक्तियाँ",
+    "home_care": "घरेलू देखभाल निर्देश",
+    "per_image": "छवि अनुसार निष्कर्ष",
+    "additional_information": "अतिरिक्त जानकारी",
+    "when_to_see_dentist": "दंत चिकित्सक से कब मिलें",
+    "estimated_timeline": "अनुमानित समयरेखा",
+    "prognosis": "पूर्वानुमान",
+    "affected_teeth": "प्रभावित दांत",
+    "additional_notes": "अतिरिक्त टिप्पणियां",
+    "unknown": "अज्ञात",
+    "none": "कोई नहीं",
+    "none_identified": "कोई पहचानी नहीं गई",
+    "not_specified": "निर्दिष्ट नहीं",
+    "consult_dentist": "दंत चिकित्सक से परामर्श करें",
+    "default_prevention": "मुंह की अच्छी स्वच्छता बनाए रखें",
+    "default_home_care": "दंत चिकित्सक की सलाह का पालन करें",
+    "as_soon_as_possible": "जितनी जल्दी हो सके",
+    "default_prognosis": "विस्तृत पूर्वानुमान के लिए दंत चिकित्सक से परामर्श करें",
+    "image": "छवि",
+    "disclaimer_title": "अस्वीकरण",
+    "disclaimer": """यह AI विश्लेषण केवल शैक्षिक उद्देश्यों के लिए है और पेशेवर दंत परामर्श का
+स्थान नहीं ले सकता। उचित निदान और उपचार के लिए हमेशा योग्य दंत चिकित्सक
+से परामर्श करें।""",
+}
+
+VALUES = {
+    "cavity_stage": "चरण {number} - {name}",
+    "cavity_stage_0": "कोई कैविटी नहीं",
+    "cavity_stage_1": "प्रारंभिक इनेमल क्षय",
+    "cavity_stage_2": "डेंटिन क्षय",
+    "cavity_stage_3": "पल्प संलग्नता",
+    "cavity_stage_4": "फोड़ा / गंभीर संक्रमण",
+    "severity_level_none": "कोई नहीं",
+    "severity_level_mild": "हल्का",
+    "severity_level_moderate": "मध्यम",
+    "severity_level_severe": "गंभीर",
+    "severity_level_critical": "अत्यंत गंभीर",
+    "emergency_level_none": "कोई नहीं",
+    "emergency_level_low": "कम",
+    "emergency_level_medium": "मध्यम",
+    "emergency_level_high": "उच्च",
+    "emergency_level_critical": "अत्यंत गंभीर",
+}
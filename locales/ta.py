@@ -0,0 +1,188 @@
+"""Tamil strings: app labels, the narrated summary, the text report and analysis values"""
+
+UI = {
+    "page_title": "🦷 பல் பகுப்பாய்வு போர்டல்",
+    "main_header": "🦷 பல் பகுப்பாய்வு போர்டல்",
+    "config": "⚙️ உள்ளமைவு",
+    "api_key_found": "✅ OpenRouter API விசை சூழல் மாறிகளில் கண்டறியப்பட்டது",
+    "api_key_not_found": "⚠️ OpenRouter API விசை சூழல் மாறிகளில் காணப்படவில்லை",
+    "api_key_label": "OpenRouter API விசை",
+    "language_selection": "🌍 மொழியைத் தேர்ந்தெடுக்கவும் / Language / भाषा",
+    "audio_settings": "🎵 ஆடியோ அமைப்புகள்",
+    "voice_selection": "குரல் தேர்வு",
+    "speech_speed": "பேச்சு வேகம்",
+    "instructions": "📋 வழிமுறைகள்",
+    "instructions_text": """
+    1. உங்கள் OpenRouter API விசையை உள்ளிடவும்
+    2. பல்/பற்களின் தெளிவான படத்தை பதிவேற்றவும்
+    3. உடனடி பகுப்பாய்வுக்கு 'படத்தை பகுப்பாய்வு செய்' என்பதைக் கிளிக் செய்யவும்
+    4. தானாகவே அறிக்கை மற்றும் ஆடியோ சுருக்கத்தைப் பெறவும்
+    
+    **படம் குறிப்புகள்:**
+    - நல்ல வெளிச்சத்தைப் பயன்படுத்தவும்
+    - கேமராவை நிலையாக வைக்கவும்
+    - பாதிக்கப்பட்ட பகுதியில் கவனம் செலுத்தவும்
+    - மங்கலான படங்களைத் தவிர்க்கவும்
+    """,
+    "disclaimer": "⚠️ மறுப்பு",
+    "disclaimer_text": "இந்த AI பகுப்பாய்வு கல்வி நோக்கங்களுக்காக மட்டுமே மற்றும் தொழில்முறை பல் ஆலோசனையை மாற்றக்கூடாது. சரியான நோய் கண்டறிதல் மற்றும் சிகிச்சைக்கு எப்போதும் தகுதிவாய்ந்த பல் மருத்துவரை அணுகவும்.",
+    "welcome_title": "பல் பகுப்பாய்வு போர்டலுக்கு வரவேற்கிறோம்",
+    "welcome_text": "இந்த AI-இயங்கும் கருவி பல் படங்களை பகுப்பாய்வு செய்து சாத்தியமான குழிகளை அடையாளம் காணவும் உடனடி ஆடியோ சுருக்கங்களுடன் விரிவான வாய் சுகாதார நுண்ணறிவுகளை வழங்கவும் உதவுகிறது.",
+    "enter_api_key": "தொடங்க பக்கப்பட்டையில் உங்கள் OpenRouter API விசையை உள்ளிடவும்.",
+    "upload_image": "📤 பல் படத்தை பதிவேற்றவும்",
+    "upload_help": "நீங்கள் பகுப்பாய்வு செய்ய விரும்பும் பல் அல்லது பல் பகுதியின் தெளிவான படத்தை பதிவேற்றவும்",
+    "uploaded_image": "பதிவேற்றப்பட்ட படம்",
+    "image_label": "லேபிள்",
+    "per_image_results": "🖼️ படம் வாரியான கண்டுபிடிப்புகள்",
+    "default_views": ["மேல் தாடை", "கீழ் தாடை", "இடது பக்கம்", "வலது பக்கம்"],
+    "quality_blurry": "புகைப்படம் மங்கலாக உள்ளது. கேமராவை நிலையாக பிடித்து பற்களில் கவனம் செலுத்தவும்.",
+    "quality_underexposed": "புகைப்படம் மிகவும் இருட்டாக உள்ளது. அதிக வெளிச்சம் அல்லது ஃபிளாஷ் பயன்படுத்தவும்.",
+    "quality_overexposed": "புகைப்படத்தில் அதிக வெளிச்சம் உள்ளது. நேரடி ஒளிர்வைத் தவிர்க்கவும்.",
+    "quality_low_resolution": "புகைப்படத் தெளிவுத்திறன் மிகக் குறைவு. அருகில் செல்லவும் அல்லது அதிக தெளிவுத்திறனைப் பயன்படுத்தவும்.",
+    "quality_rejected": "பகுப்பாய்வுக்கு முன் குறிக்கப்பட்ட புகைப்படங்களை மீண்டும் எடுக்கவும்.",
+    "analyze_button": "🔍 படத்தை பகுப்பாய்வு செய்து ஆடியோவை உருவாக்கவும்",
+    "analyzing": "🤖 பல் படத்தை பகுப்பாய்வு செய்கிறது...",
+    "queue_position": "⏳ பகுப்பாய்வு இடத்திற்காக காத்திருக்கிறது: வரிசையில் இடம் {position}",
+    "job_queued": "⏳ பகுப்பாய்வு பணியாளர் கிடைக்கக் காத்திருக்கிறது (வரிசையில் எண் {position})...",
+    "job_resumed": "🔄 உங்கள் கடைசி பகுப்பாய்வு இன்னும் கிடைக்கிறது:",
+    "job_failed": "❌ பகுப்பாய்வை முடிக்க முடியவில்லை. மீண்டும் முயற்சிக்கவும்.",
+    "job_queue_full": "⏳ சேவையகம் பிற பகுப்பாய்வுகளில் பிஸியாக உள்ளது. ஒரு நிமிடத்தில் மீண்டும் முயற்சிக்கவும்.",
+    "emergency_reanalysis": "🚨 அவசர மறு பகுப்பாய்வு",
+    "emergency_help": "வரிசையில் உள்ள வழக்கமான கோரிக்கைகளுக்கு முன் பகுப்பாய்வை மீண்டும் இயக்கவும்",
+    "generating_audio": "🎙️ ஆடியோ சுருக்கத்தை உருவாக்குகிறது...",
+    "creating_audio": "🎵 ஆடியோ கோப்பை உருவாக்குகிறது...",
+    "analysis_complete": "✅ பகுப்பாய்வு முடிந்தது!",
+    "analysis_results": "📊 பகுப்பாய்வு முடிவுகள்",
+    "audio_summary": "🎵 ஆடியோ சுருக்கம்",
+    "audio_summary_text": "கீழே உங்கள் பல் பகுப்பாய்வு சுருக்கத்தைக் கேளுங்கள்:",
+    "download_audio": "💾 ஆடியோவை பதிவிறக்கவும்",
+    "download_report": "📄 அறிக்கையை பதிவிறக்கவும்",
+    "download_script": "📝 ஸ்கிரிப்டை பதிவிறக்கவும்",
+    "download_bundle": "📦 அனைத்தையும் பதிவிறக்கவும் (ZIP)",
+    "download_json": "🧾 JSON ஐ பதிவிறக்கவும்",
+    "download_html": "🌐 HTML அறிக்கையை பதிவிறக்கவும்",
+    "audio_failed": "🔊 ஆடியோ உருவாக்கம் தோல்வியுற்றது, ஆனால் நீங்கள் இன்னும் உரை சுருக்கத்தை பதிவிறக்கலாம்:",
+    "audio_script": "ஆடியோ ஸ்கிரிப்ட்",
+    "audio_unavailable": "🔇 குரல் சேவை இப்போது கிடைக்கவில்லை, எனவே ஆடியோ நிறுத்தப்பட்டுள்ளது. உரை ஸ்கிரிப்ட் கீழே உள்ளது.",
+    "audio_timeout": "⏱️ குரல் சேவை பதிலளிக்க அதிக நேரம் எடுத்தது. உரை ஸ்கிரிப்ட் கீழே உள்ளது.",
+    "audio_error": "🔊 இப்போது ஆடியோவை உருவாக்க முடியவில்லை. உரை ஸ்கிரிப்ட் கீழே உள்ளது.",
+    "audio_not_installed": "Edge TTS நிறுவப்படவில்லை. இதை நிறுவவும்: pip install edge-tts",
+    "degraded_model": "⚠️ பகுப்பாய்வு சேவை இப்போது கிடைக்கவில்லை. பட செயலாக்கம் மற்றும் தர சோதனைகள் இன்னும் வேலை செய்கின்றன; சுமார் {seconds} விநாடிகளில் பகுப்பாய்வு மீண்டும் முயற்சிக்கப்படும்.",
+    "degraded_tts": "🔇 குரல் சேவை இப்போது கிடைக்கவில்லை. அது சரியாகும் வரை முடிவுகள் ஆடியோவிற்குப் பதிலாக உரை ஸ்கிரிப்டுடன் வரும்.",
+    "analysis_failed": "❌ பகுப்பாய்வு தோல்வியடைந்தது",
+    "analysis_error": "பகுப்பாய்வு பிழை",
+    "raw_response": "மூல பதில்",
+    "error_hint_auth": "உங்கள் OpenRouter API சாவி செல்லுபடியானதா, அதில் கிரெடிட் உள்ளதா என்பதைச் சரிபார்க்கவும்.",
+    "error_hint_rate_limited": "OpenRouter கோரிக்கைகளைக் கட்டுப்படுத்துகிறது. சிறிது நேரம் காத்திருந்து மீண்டும் முயற்சிக்கவும்.",
+    "error_hint_upstream": "மாதிரி வழங்குநருக்குச் சிக்கல்கள் உள்ளன. சிறிது நேரத்தில் மீண்டும் முயற்சிக்கவும்.",
+    "error_hint_timeout": "மாதிரி பதிலளிக்க அதிக நேரம் எடுத்தது. மீண்டும் முயற்சிக்கவும்.",
+    "error_hint_connection": "OpenRouter உடன் இணைக்க முடியவில்லை. சேவையகத்தின் பிணைய இணைப்பைச் சரிபார்க்கவும்.",
+    "error_hint_bad_request": "கோரிக்கை நிராகரிக்கப்பட்டது. வேறு படத்தை முயற்சிக்கவும்.",
+    "error_hint_invalid_response": "மாதிரி எதிர்பாராத பதிலை அளித்தது. மீண்டும் முயற்சிக்கவும்.",
+    "error_hint_unavailable": "தொடர்ச்சியான தோல்விகளுக்குப் பிறகு மாதிரிக்கான கோரிக்கைகள் நிறுத்தப்பட்டுள்ளன. பட செயலாக்கமும் தரச் சோதனைகளும் இன்னும் செயல்படுகின்றன.",
+    "cavity_stages_guide": "📚 குழி நிலைகள் வழிகாட்டி",
+    "stage_0": "குழி இல்லை",
+    "stage_0_desc": "ஆரோக்கியமான பல் அல்லது மிக ஆரம்ப நீர்மின்மாற்றம்",
+    "stage_1": "ஆரம்ப பற்சிப்பி சிதைவு",
+    "stage_1_desc": "வெள்ளை புள்ளிகள் அல்லது ஆரம்ப பற்சிப்பி சேதம்",
+    "stage_2": "டென்டின் சிதைவு",
+    "stage_2_desc": "குழி டென்டின் அடுக்கை அடைந்துள்ளது",
+    "stage_3": "கூழ் சம்பந்தப்படுதல்",
+    "stage_3_desc": "தொற்று பல்லின் கூழை அடைந்துள்ளது",
+    "stage_4": "புண்/கடுமையான",
+    "stage_4_desc": "மேம்பட்ட தொற்று, சாத்தியமான புண்",
+    "visible_issues": "👁️ தெரியும் பிரச்சினைகள்",
+    "possible_causes": "🔍 சாத்தியமான காரணங்கள்",
+    "affected_teeth": "🦷 பாதிக்கப்பட்ட பற்கள்",
+    "recommended_treatments": "💉 பரிந்துரைக்கப்பட்ட சிகிச்சைகள்",
+    "immediate_concerns": "🚨 உடனடி கவலைகள்",
+    "dentist_timeline": "📅 பல் மருத்துவர் வருகை காலவரிசை",
+    "prevention_tips": "🛡️ தடுப்பு குறிப்புகள்",
+    "home_care": "🏠 வீட்டு பராமரிப்பு வழிமுறைகள்",
+    "additional_details": "📊 கூடுதல் பகுப்பாய்வு விவரங்கள்",
+    "severity_banner": "{stage} - தீவிரம்: {severity}",
+    "emergency_priority": "முன்னுரிமை: {emergency}",
+    "emergency_alert": "⚠️ அவசர எச்சரிக்கை",
+    "emergency_text": "உடனடி பல் சிகிச்சை பரிந்துரைக்கப்படுகிறது!",
+    "image_processing": "🖼️ படம் செயலாக்கம் மற்றும் பகுப்பாய்வு",
+    "grayscale": "சாம்பல் அளவு",
+    "edge_detection": "கேனி விளிம்பு கண்டறிதல்",
+    "clahe_enhanced": "CLAHE மேம்படுத்தப்பட்டது",
+    "histogram_title": "பிக்சல் தீவிரத்தின் வரலாற்று வரைபடம்",
+    "pixel_intensity": "பிக்சல் தீவிரம்",
+    "frequency": "அதிர்வெண்"
+}
+
+SUMMARY = {
+    "error": "பல் பகுப்பாய்வின் போது பிழை ஏற்பட்டது. வேறு படத்துடன் மீண்டும் முயற்சிக்கவும்.",
+    "title": "பல் பகுப்பாய்வு சுருக்கம்.",
+    "stage": "பல் சொத்தை நிலை: {stage}. தீவிர நிலை: {severity}.",
+    "emergency": "அவசர நிலை: {emergency}. உடனடி பல் மருத்துவ கவனிப்பு பரிந்துரைக்கப்படுகிறது.",
+    "views": "படம் வாரியான கண்டுபிடிப்புகள்: {views}.",
+    "visible_issues": "தெரியும் பிரச்சினைகள்: {items}.",
+    "treatments": "பரிந்துரைக்கப்பட்ட சிகிச்சைகள்: {items}.",
+    "home_care": "வீட்டு பராமரிப்பு வழிமுறைகள்: {items}.",
+    "dentist": "பல் மருத்துவரை எப்போது பார்க்க வேண்டும்: {timeline}.",
+    "unknown": "தெரியவில்லை",
+    "image": "படம்",
+    "as_soon_as_possible": "கூடிய விரைவில்",
+}
+
+REPORT = {
+    "error": "பகுப்பாய்வு பிழை: அறிக்கையை உருவாக்க முடியவில்லை",
+    "title": "பல் பகுப்பாய்வு அறிக்கை",
+    "generated": "உருவாக்கப்பட்டது",
+    "summary": "சுருக்கம்",
+    "cavity_stage": "பல் சொத்தை நிலை",
+    "severity": "தீவிரம்",
+    "emergency_level": "அவசர நிலை",
+    "cavity_present": "பல் சொத்தை உள்ளது",
+    "yes": "ஆம்",
+    "no": "இல்லை",
+    "visible_issues": "தெரியும் பிரச்சினைகள்",
+    "possible_causes": "சாத்தியமான காரணங்கள்",
+    "recommended_treatments": "பரிந்துரைக்கப்பட்ட சிகிச்சைகள்",
+    "immediate_concerns": "உடனடி கவலைகள்",
+    "prevention_tips": "தடுப்பு குறிப்புகள்",
+    "home_care": "வீட்டு பராமரிப்பு வழிமுறைகள்",
+    "per_image": "படம் வாரியான கண்டுபிடிப்புகள்",
+    "additional_information": "கூடுதல் தகவல்",
+    "when_to_see_dentist": "பல் மருத்துவரை எப்போது பார்க்க வேண்டும்",
+    "estimated_timeline": "மதிப்பிடப்பட்ட காலவரிசை",
+    "prognosis": "முன்கணிப்பு",
+    "affected_teeth": "பாதிக்கப்பட்ட பற்கள்",
+    "additional_notes": "கூடுதல் குறிப்புகள்",
+    "unknown": "தெரியவில்லை",
+    "none": "இல்லை",
+    "none_identified": "எதுவும் கண்டறியப்படவில்லை",
+    "not_specified": "குறிப்பிடப்படவில்லை",
+    "consult_dentist": "பல் மருத்துவரை அணுகவும்",
+    "default_prevention": "நல்ல வாய் சுகாதாரத்தைப் பேணுங்கள்",
+    "default_home_care": "பல் மருத்துவரின் பரிந்துரைகளைப் பின்பற்றவும்",
+    "as_soon_as_possible": "கூடிய விரைவில்",
+    "default_prognosis": "விரிவான முன்கணிப்புக்கு பல் மருத்துவரை அணுகவும்",
+    "image": "படம்",
+    "disclaimer_title": "பொறுப்புத் துறப்பு",
+    "disclaimer": """இந்த AI பகுப்பாய்வு கல்வி நோக்கங்களுக்காக மட்டுமே மற்றும் தொழில்முறை பல்
+ஆலோசனையை மாற்றக்கூடாது. சரியான நோய் கண்டறிதல் மற்றும் சிகிச்சைக்கு
+எப்போதும் தகுதிவாய்ந்த பல் மருத்துவரை அணுகவும்.""",
+}
+
+VALUES = {
+    "cavity_stage": "நிலை {number} - {name}",
+    "cavity_stage_0": "குழி இல்லை",
+    "cavity_stage_1": "ஆரம்ப பற்சிப்பி சிதைவு",
+    "cavity_stage_2": "டென்டின் சிதைவு",
+    "cavity_stage_3": "கூழ் சம்பந்தப்படுதல்",
+    "cavity_stage_4": "புண் / கடுமையான தொற்று",
+    "severity_level_none": "இல்லை",
+    "severity_level_mild": "லேசானது",
+    "severity_level_moderate": "மிதமானது",
+    "severity_level_severe": "கடுமையானது",
+    "severity_level_critical": "மிகக் கடுமையானது",
+    "emergency_level_none": "இல்லை",
+    "emergency_level_low": "குறைவு",
+    "emergency_level_medium": "நடுத்தரம்",
+    "emergency_level_high": "அதிகம்",
+    "emergency_level_critical": "மிக அவசரம்",
+}
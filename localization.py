@@ -0,0 +1,108 @@
+"""Translate an existing analysis into another language without re-analyzing the image"""
+import hashlib
+import os
+
+from dental_analysis import translate_texts
+from result_cache import DEFAULT_CACHE_DIR, ResultCache
+
+
+# Free-text fields written by the model. Enumerations (cavity_stage,
+# severity_level, emergency_level), booleans and tooth numbers stay as-is
+# because the UI and the summary branch on their English values; they are
+# shown through the VALUES catalogs (locales.value_label) instead.
+LOCALIZABLE_LIST_FIELDS = (
+    "visible_issues",
+    "possible_causes",
+    "immediate_concerns",
+    "recommended_treatments",
+    "prevention_tips",
+    "home_care_instructions",
+)
+LOCALIZABLE_TEXT_FIELDS = (
+    "estimated_timeline",
+    "prognosis",
+    "when_to_see_dentist",
+    "additional_notes",
+)
+
+
+def make_translation_key(text, target_lang):
+    return hashlib.sha256(f"{target_lang}\x00{text}".encode("utf-8")).hexdigest()
+
+
+class TranslationCache(ResultCache):
+    """Translated strings keyed by (source text, target language)"""
+
+    def __init__(self, path=None, **kwargs):
+        kwargs.setdefault("max_memory_items", 4096)
+        kwargs.setdefault("ttl_seconds", 30 * 24 * 3600)
+        super().__init__(path or os.path.join(DEFAULT_CACHE_DIR, "translations.sqlite3"), table="translations", **kwargs)
+
+
+def collect_texts(analysis):
+    """Unique non-empty strings of the localizable fields, in a stable order
+
+    Entries of a multi-image ``per_image`` list are included after the
+    overall fields.
+    """
+    texts = []
+    seen = set()
+    for section in [analysis] + list(analysis.get("per_image") or []):
+        for field in LOCALIZABLE_LIST_FIELDS:
+            for item in section.get(field) or []:
+                if isinstance(item, str) and item.strip() and item not in seen:
+                    seen.add(item)
+                    texts.append(item)
+        for field in LOCALIZABLE_TEXT_FIELDS:
+            value = section.get(field)
+            if isinstance(value, str) and value.strip() and value not in seen:
+                seen.add(value)
+                texts.append(value)
+    return texts
+
+
+def apply_translations(analysis, translations):
+    """Copy of ``analysis`` (and its per-image entries) with known strings replaced"""
+    localized = dict(analysis)
+    for field in LOCALIZABLE_LIST_FIELDS:
+        if isinstance(analysis.get(field), list):
+            localized[field] = [translations.get(item, item) if isinstance(item, str) else item for item in analysis[field]]
+    for field in LOCALIZABLE_TEXT_FIELDS:
+        value = analysis.get(field)
+        if isinstance(value, str):
+            localized[field] = translations.get(value, value)
+    if isinstance(analysis.get("per_image"), list):
+        localized["per_image"] = [apply_translations(item, translations) for item in analysis["per_image"]]
+    return localized
+
+
+def localize_analysis(analysis, source_lang, target_lang, api_key, cache=None):
+    """Return a copy of ``analysis`` with its free-text fields in ``target_lang``
+
+    Strings already translated before are served from ``cache``; all the
+    others go out together in one text-only request. If that request fails
+    the untranslated analysis is returned rather than an error.
+    """
+    if "error" in analysis or source_lang == target_lang:
+        return analysis
+
+    texts = collect_texts(analysis)
+    translations = {}
+    missing = []
+    for text in texts:
+        cached = cache.get(make_translation_key(text, target_lang)) if cache is not None else None
+        if cached is None:
+            missing.append(text)
+        else:
+            translations[text] = cached
+
+    if missing:
+        translated = translate_texts(missing, target_lang, api_key)
+        if translated is None:
+            return analysis
+        for text, result in zip(missing, translated):
+            translations[text] = result
+            if cache is not None:
+                cache.set(make_translation_key(text, target_lang), result)
+
+    return apply_translations(analysis, translations)
@@ -0,0 +1,247 @@
+"""In-process stage timers, byte and error counters with a Prometheus text endpoint
+
+Usage:
+    with timed("encode"):
+        ...
+    count_bytes("upload", len(body))
+
+``render_prometheus()`` returns the exposition text; ``start_metrics_server``
+serves it on ``/metrics``. Set ``ANALYSIS_LOG_JSON=1`` to also log one JSON
+line per analysis through the ``cavatyai.analysis`` logger.
+"""
+import bisect
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+# Upper bounds in seconds, from sub-millisecond local work to slow model calls
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 40, 80)
+
+ANALYSIS_LOG_JSON = os.getenv("ANALYSIS_LOG_JSON") == "1"
+
+analysis_logger = logging.getLogger("cavatyai.analysis")
+if ANALYSIS_LOG_JSON and not analysis_logger.handlers:
+    # One bare JSON object per line on stderr, ready for a log shipper
+    _handler = logging.StreamHandler()
+    _handler.setFormatter(logging.Formatter("%(message)s"))
+    analysis_logger.addHandler(_handler)
+    analysis_logger.setLevel(logging.INFO)
+    analysis_logger.propagate = False
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names, values, extra=None):
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class Counter:
+    """Monotonic counter with optional labels"""
+    kind = "counter"
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *labels, amount=1):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def value(self, *labels):
+        with self._lock:
+            return self._values.get(labels, 0)
+
+    def samples(self):
+        with self._lock:
+            return [(self.name, _labels(self.labelnames, key), value) for key, value in sorted(self._values.items())]
+
+
+class Histogram:
+    """Cumulative-bucket histogram with sum and count, per label set"""
+    kind = "histogram"
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value, *labels):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = {"counts": [0] * (len(self.buckets) + 1), "sum": 0.0, "count": 0}
+            series["counts"][index] += 1
+            series["sum"] += value
+            series["count"] += 1
+
+    def quantile(self, q, *labels):
+        """Estimate a quantile by linear interpolation inside its bucket (as PromQL does)"""
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None or not series["count"]:
+                return None
+            counts = list(series["counts"])
+            total = series["count"]
+        rank = q * total
+        cumulative = 0
+        for index, count in enumerate(counts):
+            if cumulative + count >= rank and count:
+                if index == len(self.buckets):
+                    return self.buckets[-1]
+                lower = self.buckets[index - 1] if index else 0.0
+                return lower + (self.buckets[index] - lower) * (rank - cumulative) / count
+            cumulative += count
+        return self.buckets[-1]
+
+    def summary(self):
+        """Count, mean and p50/p95/p99 for every label set"""
+        with self._lock:
+            keys = sorted(self._series)
+            totals = {key: (self._series[key]["count"], self._series[key]["sum"]) for key in keys}
+        summary = {}
+        for key in keys:
+            count, total = totals[key]
+            summary["/".join(key) or self.name] = {
+                "count": count,
+                "mean_s": round(total / count, 4) if count else None,
+                **{f"p{int(q * 100)}_s": round(self.quantile(q, *key), 4) for q in (0.5, 0.95, 0.99)},
+            }
+        return summary
+
+    def samples(self):
+        with self._lock:
+            series = {key: (list(value["counts"]), value["sum"], value["count"]) for key, value in sorted(self._series.items())}
+        samples = []
+        for key, (counts, total, count) in series.items():
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += bucket_count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                samples.append((f"{self.name}_bucket", _labels(self.labelnames, key, f'le="{le}"'), cumulative))
+            samples.append((f"{self.name}_sum", _labels(self.labelnames, key), total))
+            samples.append((f"{self.name}_count", _labels(self.labelnames, key), count))
+        return samples
+
+
+STAGE_SECONDS = Histogram("cavatyai_stage_seconds", "Time spent in each pipeline stage", ["stage"])
+STAGE_ERRORS = Counter("cavatyai_stage_errors_total", "Pipeline stage failures", ["stage"])
+STAGE_BYTES = Counter("cavatyai_stage_bytes_total", "Bytes produced or transferred by a stage", ["stage"])
+
+_metrics = [STAGE_SECONDS, STAGE_ERRORS, STAGE_BYTES]
+_gauges = {}
+_gauges_lock = threading.Lock()
+
+
+def register_gauges(prefix, collect):
+    """Expose the numeric values of ``collect()`` (a dict) as gauges ``cavatyai_<prefix>_<key>``"""
+    with _gauges_lock:
+        _gauges[prefix] = collect
+
+
+def gauge_snapshot(prefix):
+    """Current values of a registered gauge group, or {} before its owner has loaded"""
+    with _gauges_lock:
+        collect = _gauges.get(prefix)
+    return collect() if collect is not None else {}
+
+
+def observe(stage, seconds, record=None):
+    STAGE_SECONDS.observe(seconds, stage)
+    if record is not None:
+        record[stage] = round(record.get(stage, 0) + seconds, 4)
+
+
+def count_bytes(stage, amount):
+    STAGE_BYTES.inc(stage, amount=amount)
+
+
+@contextmanager
+def timed(stage, record=None):
+    """Time the block into the stage histogram; exceptions count as stage errors
+
+    When ``record`` (a dict) is given the duration is also added to it, for
+    the per-analysis log line.
+    """
+    started = time.perf_counter()
+    try:
+        yield
+    except BaseException:
+        STAGE_ERRORS.inc(stage)
+        raise
+    finally:
+        observe(stage, time.perf_counter() - started, record)
+
+
+def stage_summary():
+    return STAGE_SECONDS.summary()
+
+
+def render_prometheus():
+    """Current metrics in the Prometheus text exposition format"""
+    lines = []
+    for metric in _metrics:
+        lines.append(f"# HELP {metric.name} {metric.documentation}")
+        lines.append(f"# TYPE {metric.name} {metric.kind}")
+        lines.extend(f"{name}{labels} {value}" for name, labels, value in metric.samples())
+
+    with _gauges_lock:
+        gauges = list(_gauges.items())
+    for prefix, collect in gauges:
+        try:
+            values = collect()
+        except Exception:
+            continue
+        for key, value in sorted(values.items()):
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                continue
+            name = f"cavatyai_{prefix}_{key}"
+            lines.append(f"# TYPE {name} gauge")
+            lines.append(f"{name} {value}")
+    return "\n".join(lines) + "\n"
+
+
+def log_analysis(event):
+    """Emit one structured JSON line describing an analysis (when enabled)"""
+    if ANALYSIS_LOG_JSON:
+        analysis_logger.info(json.dumps(event, ensure_ascii=False, sort_keys=True))
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = render_prometheus().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_metrics_server(port, host="127.0.0.1"):
+    """Serve ``/metrics`` from a daemon thread; returns the server"""
+    server = ThreadingHTTPServer((host, port), _MetricsHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="metrics-server", daemon=True).start()
+    return server
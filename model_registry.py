@@ -0,0 +1,255 @@
+"""Analysis models with rolling latency stats and an opt-in hedging policy
+
+``ANALYSIS_MODELS`` lists the models in order of preference (comma
+separated; the first is the primary). An entry may end in ``@<base URL>`` to
+send that model to another OpenAI-compatible endpoint, e.g. a local stub:
+
+    ANALYSIS_MODELS=google/gemini-2.5-flash,openai/gpt-4.1-mini@http://127.0.0.1:8766/api/v1
+
+With ``ANALYSIS_HEDGE=1`` and a second model configured, a request the
+primary has not answered within its rolling p90 latency is also sent to the
+backup; the first valid answer wins and the other request is cancelled.
+Until the primary has ``ANALYSIS_HEDGE_MIN_SAMPLES`` successful calls the
+backup starts after ``ANALYSIS_HEDGE_DELAY`` seconds instead. A primary that
+fails before its hedge delay hands over to the backup at once.
+"""
+import os
+import queue
+import threading
+import time
+from collections import deque
+
+from metrics import register_gauges
+from openrouter_client import OpenRouterClient, get_client
+
+
+DEFAULT_MODEL = "google/gemini-2.5-flash"
+
+
+def parse_models(value):
+    """``[(model, base_url or None)]`` from an ``ANALYSIS_MODELS`` value"""
+    models = []
+    for entry in (value or "").split(","):
+        name, _, base_url = entry.strip().partition("@")
+        if name:
+            models.append((name, base_url or None))
+    return models or [(DEFAULT_MODEL, None)]
+
+
+class ModelStats:
+    """Latencies of a model's recent successful calls plus outcome counters"""
+
+    def __init__(self, window=200):
+        self._latencies = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.errors = 0
+        self.cancelled = 0
+        self.wins = 0
+
+    def record_cancelled(self):
+        with self._lock:
+            self.cancelled += 1
+
+    def record(self, seconds, ok):
+        with self._lock:
+            self.calls += 1
+            if ok:
+                self._latencies.append(seconds)
+            else:
+                self.errors += 1
+
+    def quantile(self, q):
+        """Nearest-rank quantile of the window, or None before the first success"""
+        with self._lock:
+            ordered = sorted(self._latencies)
+        if not ordered:
+            return None
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    def samples(self):
+        with self._lock:
+            return len(self._latencies)
+
+    def snapshot(self):
+        snapshot = {
+            "samples": self.samples(),
+            "calls": self.calls,
+            "errors": self.errors,
+            "cancelled": self.cancelled,
+            "wins": self.wins,
+        }
+        for q in (0.5, 0.9, 0.99):
+            value = self.quantile(q)
+            if value is not None:
+                snapshot[f"p{int(q * 100)}_s"] = round(value, 4)
+        return snapshot
+
+
+class ModelRegistry:
+    """Configured analysis models, their latency stats and the hedged call
+
+    Cancelled attempts are not recorded as latencies: their true duration is
+    unknown, only that it exceeded the winner's.
+    """
+
+    def __init__(self, models=None, hedge=False, hedge_delay=10.0, min_samples=20, min_delay=0.25, window=200):
+        self.models = list(models or [(DEFAULT_MODEL, None)])
+        self.hedge = hedge
+        self.hedge_delay_default = hedge_delay
+        self.min_samples = min_samples
+        self.min_delay = min_delay
+        self._stats = {name: ModelStats(window) for name, _ in self.models}
+        self._base_urls = dict(self.models)
+        self._clients = {}
+        self._lock = threading.Lock()
+        self.hedged = 0
+        self.failovers = 0
+
+    @property
+    def primary(self):
+        return self.models[0][0]
+
+    @property
+    def backup(self):
+        return self.models[1][0] if len(self.models) > 1 else None
+
+    @property
+    def names(self):
+        return [name for name, _ in self.models]
+
+    def client_for(self, model):
+        """Client for the model's endpoint; extra endpoints share the default client's scheduler"""
+        base_url = self._base_urls.get(model)
+        if base_url is None:
+            return get_client()
+        with self._lock:
+            client = self._clients.get(base_url)
+            if client is None:
+                default = get_client()
+                client = self._clients[base_url] = OpenRouterClient(
+                    base_url=base_url,
+                    connect_timeout=default.connect_timeout,
+                    read_timeout=default.read_timeout,
+                    max_retries=default.max_retries,
+                    scheduler=default.scheduler,
+                    queue_timeout=default.queue_timeout,
+                )
+            return client
+
+    def hedge_delay(self):
+        """Seconds to wait on the primary before the backup request starts"""
+        stats = self._stats[self.primary]
+        if stats.samples() < self.min_samples:
+            return self.hedge_delay_default
+        return max(self.min_delay, stats.quantile(0.9))
+
+    def call(self, attempt):
+        """Run ``attempt(model, client, cancelled)`` and return ``(result, model)``
+
+        ``attempt`` returns an analysis dict, one with an ``"error"`` key on
+        failure, or None when it stopped because ``cancelled`` (an Event)
+        was set. Without hedging only the primary is called.
+        """
+        if not self.hedge or self.backup is None:
+            result = self._run(self.primary, attempt, threading.Event())
+            if "error" not in result:
+                self._win(self.primary, result, {})
+            return result, self.primary
+
+        outcomes = queue.Queue()
+        cancels = {}
+
+        def run(model):
+            try:
+                result = self._run(model, attempt, cancels[model])
+            except Exception as e:
+                # Never leave the caller waiting on a thread that died
+                result = {"error": f"Analysis request failed: {e}", "error_type": "unknown"}
+            outcomes.put((model, result))
+
+        def start(model):
+            cancels[model] = threading.Event()
+            threading.Thread(target=run, args=(model,), name=f"hedge-{model}", daemon=True).start()
+
+        start(self.primary)
+        try:
+            model, result = outcomes.get(timeout=self.hedge_delay())
+        except queue.Empty:
+            with self._lock:
+                self.hedged += 1
+            start(self.backup)
+        else:
+            if "error" not in result:
+                return self._win(model, result, cancels)
+            # Failed before its hedge delay: the backup is the only chance left
+            with self._lock:
+                self.failovers += 1
+            first_error = result
+            start(self.backup)
+            model, result = outcomes.get()
+            if "error" not in result:
+                return self._win(model, result, cancels)
+            return first_error, self.primary
+
+        errors = {}
+        for _ in cancels:
+            model, result = outcomes.get()
+            if "error" not in result:
+                return self._win(model, result, cancels)
+            errors[model] = result
+        # Both failed: report the primary's error, which the UI knows how to explain
+        return errors[self.primary], self.primary
+
+    def _run(self, model, attempt, cancelled):
+        started = time.perf_counter()
+        result = attempt(model, self.client_for(model), cancelled)
+        stats = self._stats[model]
+        if result is None:
+            stats.record_cancelled()
+            return {"error": "Request cancelled", "error_type": "cancelled"}
+        stats.record(time.perf_counter() - started, "error" not in result)
+        return result
+
+    def _win(self, model, result, cancels):
+        for other, cancelled in cancels.items():
+            if other != model:
+                cancelled.set()
+        with self._lock:
+            self._stats[model].wins += 1
+        return result, model
+
+    def stats(self):
+        """Snapshot for the sidebar and the metrics endpoint (which skips the model names)"""
+        with self._lock:
+            stats = {"hedge_enabled": int(self.hedge and self.backup is not None), "hedged": self.hedged,
+                     "failovers": self.failovers}
+        if stats["hedge_enabled"]:
+            stats["hedge_delay_s"] = round(self.hedge_delay(), 4)
+        for index, (name, _) in enumerate(self.models):
+            # Model names are not metric-name safe; the role prefix keeps keys stable
+            role = "primary" if index == 0 else "backup" if index == 1 else f"model{index}"
+            stats[f"{role}_model"] = name
+            for key, value in self._stats[name].snapshot().items():
+                stats[f"{role}_{key}"] = value
+        return stats
+
+
+_registry = None
+_registry_lock = threading.Lock()
+
+
+def get_model_registry():
+    """Process-wide registry configured from the environment"""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = ModelRegistry(
+                parse_models(os.getenv("ANALYSIS_MODELS")),
+                hedge=os.getenv("ANALYSIS_HEDGE") == "1",
+                hedge_delay=float(os.getenv("ANALYSIS_HEDGE_DELAY", "10")),
+                min_samples=int(os.getenv("ANALYSIS_HEDGE_MIN_SAMPLES", "20")),
+                min_delay=float(os.getenv("ANALYSIS_HEDGE_MIN_DELAY", "0.25")),
+            )
+            register_gauges("models", _registry.stats)
+        return _registry
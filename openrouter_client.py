@@ -0,0 +1,305 @@
+"""Shared, pooled and retrying HTTP client for the OpenRouter API"""
+import email.utils
+import json
+import os
+import random
+import threading
+import time
+from contextlib import contextmanager
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from circuit_breaker import OPEN, CircuitOpenError, get_breaker
+from metrics import count_bytes, observe, register_gauges
+from scheduler import PRIORITY_NORMAL, QueueTimeout, RequestScheduler
+
+
+OPENROUTER_BASE_URL = os.getenv("OPENROUTER_BASE_URL", "https://openrouter.ai/api/v1")
+
+
+class OpenRouterError(Exception):
+    """Base class for all OpenRouter failures surfaced to the UI"""
+    kind = "unknown"
+    retryable = False
+    # Counts towards opening the upstream's circuit breaker
+    upstream_failure = False
+
+    def __init__(self, message, status=None, details=None):
+        super().__init__(message)
+        self.status = status
+        self.details = details
+
+    def to_dict(self):
+        """Shape used by the app for analysis errors"""
+        error = {"error": str(self), "error_type": self.kind}
+        if self.details:
+            error["details"] = self.details
+        return error
+
+
+class AuthenticationError(OpenRouterError):
+    kind = "auth"
+
+
+class BadRequestError(OpenRouterError):
+    kind = "bad_request"
+
+
+class RateLimitError(OpenRouterError):
+    kind = "rate_limited"
+    retryable = True
+
+
+class UpstreamError(OpenRouterError):
+    kind = "upstream"
+    retryable = True
+    upstream_failure = True
+
+
+class RequestTimeoutError(OpenRouterError):
+    kind = "timeout"
+    retryable = True
+    upstream_failure = True
+
+
+class ConnectionFailedError(OpenRouterError):
+    kind = "connection"
+    retryable = True
+    upstream_failure = True
+
+
+class UpstreamUnavailableError(OpenRouterError):
+    """The circuit breaker is open, so the request was not sent"""
+    kind = "unavailable"
+
+
+class InvalidResponseError(OpenRouterError):
+    kind = "invalid_response"
+
+
+def parse_retry_after(value):
+    """Return the Retry-After header as seconds (it may be a delay or an HTTP date)"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+def error_for_response(response):
+    """Map a non-200 response to the error taxonomy"""
+    status = response.status_code
+    details = response.text[:2000]
+    if status in (401, 403):
+        return AuthenticationError(f"API key rejected (status {status})", status, details)
+    if status == 429:
+        return RateLimitError("Rate limited by OpenRouter (status 429)", status, details)
+    if status >= 500:
+        return UpstreamError(f"OpenRouter upstream error (status {status})", status, details)
+    return BadRequestError(f"API request failed with status {status}", status, details)
+
+
+class OpenRouterClient:
+    """requests.Session wrapper with keep-alive pooling, timeouts and backoff"""
+
+    def __init__(self, base_url=None, pool_size=10, connect_timeout=5.0, read_timeout=60.0,
+                 max_retries=3, backoff_base=0.5, backoff_max=8.0, scheduler=None, queue_timeout=None, breaker=None):
+        self.base_url = (base_url or OPENROUTER_BASE_URL).rstrip("/")
+        # Clients of the same host share a breaker
+        self.breaker = breaker or get_breaker(f"model:{urlparse(self.base_url).netloc}")
+        # Admission control shared by every caller of this client (unlimited by default)
+        self.scheduler = scheduler or RequestScheduler()
+        self.queue_timeout = queue_timeout
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+        self.session = requests.Session()
+        # Retries are handled below so that Retry-After and jitter apply uniformly
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def backoff_delay(self, attempt, retry_after=None):
+        """Exponential backoff with full jitter, never shorter than Retry-After"""
+        delay = random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.backoff_max * 4))
+        return delay
+
+    def post(self, path, payload, api_key, connect_timeout=None, read_timeout=None, stream=False, cancelled=None):
+        """POST JSON with retries; returns the response or raises OpenRouterError
+
+        Retries only happen before a 200 arrives; a streamed body that fails
+        midway is reported to the caller instead of being replayed. Nothing
+        is retried once ``cancelled`` (an Event) is set. The outcome, after
+        retries, is reported to the host's circuit breaker; while it is open
+        UpstreamUnavailableError is raised without sending anything.
+        """
+        try:
+            self.breaker.before_call()
+        except CircuitOpenError as e:
+            raise UpstreamUnavailableError(f"OpenRouter keeps failing; requests are paused for {e.retry_in:.0f}s")
+        try:
+            response = self._post(path, payload, api_key, connect_timeout, read_timeout, stream, cancelled)
+        except OpenRouterError as e:
+            if e.upstream_failure:
+                self.breaker.record_failure()
+            else:
+                # Rejected, but the upstream answered
+                self.breaker.record_success()
+            raise
+        except BaseException:
+            self.breaker.release()
+            raise
+        self.breaker.record_success()
+        return response
+
+    def _post(self, path, payload, api_key, connect_timeout, read_timeout, stream, cancelled):
+        url = f"{self.base_url}/{path.lstrip('/')}"
+        headers = {
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json"
+        }
+        timeout = (connect_timeout or self.connect_timeout, read_timeout or self.read_timeout)
+        body = json.dumps(payload).encode("utf-8")
+
+        attempt = 0
+        while True:
+            retry_after = None
+            try:
+                count_bytes("upload", len(body))
+                response = self.session.post(url, headers=headers, data=body, timeout=timeout, stream=stream)
+            except requests.exceptions.ConnectTimeout as e:
+                error = RequestTimeoutError(f"Timed out connecting to OpenRouter: {e}")
+            except requests.exceptions.ReadTimeout:
+                error = RequestTimeoutError(f"OpenRouter did not respond within {timeout[1]:g}s")
+            except requests.exceptions.ConnectionError as e:
+                error = ConnectionFailedError(f"Could not reach OpenRouter: {e}")
+            else:
+                # Upload plus the model's time to the first response byte
+                observe("upstream_response", response.elapsed.total_seconds())
+                if response.status_code == 200:
+                    if not stream:
+                        count_bytes("download", len(response.content))
+                    return response
+                error = error_for_response(response)
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                response.close()
+
+            if not error.retryable or attempt >= self.max_retries or (cancelled is not None and cancelled.is_set()):
+                raise error
+            # Other requests have meanwhile found the upstream down
+            if self.breaker.state == OPEN:
+                raise error
+            time.sleep(self.backoff_delay(attempt, retry_after))
+            attempt += 1
+
+    @contextmanager
+    def _slot(self, priority, on_queue):
+        # Fail before queueing behind other sessions for an upstream that is down
+        try:
+            self.breaker.check()
+        except CircuitOpenError as e:
+            raise UpstreamUnavailableError(f"OpenRouter keeps failing; requests are paused for {e.retry_in:.0f}s")
+        started = time.perf_counter()
+        try:
+            with self.scheduler.slot(priority, on_queue, self.queue_timeout):
+                observe("queue_wait", time.perf_counter() - started)
+                yield
+        except QueueTimeout as e:
+            raise RateLimitError(f"Too many requests are queued for OpenRouter: {e}")
+
+    def chat_completion(self, payload, api_key, priority=PRIORITY_NORMAL, on_queue=None, **timeouts):
+        """Call /chat/completions and return the decoded JSON body
+
+        The call waits for a scheduler slot first; ``on_queue(position)``
+        reports the caller's place in the queue while it waits.
+        """
+        with self._slot(priority, on_queue):
+            response = self.post("chat/completions", payload, api_key, **timeouts)
+        try:
+            return response.json()
+        except ValueError:
+            raise InvalidResponseError("OpenRouter returned a non-JSON body", response.status_code, response.text[:2000])
+
+    def stream_chat_completion(self, payload, api_key, priority=PRIORITY_NORMAL, on_queue=None, cancelled=None,
+                               **timeouts):
+        """Call /chat/completions with ``stream: true`` and yield content deltas from the SSE body
+
+        The scheduler slot is held until the stream ends. Once ``cancelled``
+        (an Event) is set the stream stops at the next line, keep-alive
+        comments included, and the connection is closed.
+        """
+        payload = dict(payload, stream=True)
+        with self._slot(priority, on_queue):
+            if cancelled is not None and cancelled.is_set():
+                return
+            response = self.post("chat/completions", payload, api_key, stream=True, cancelled=cancelled, **timeouts)
+            yield from self._stream_events(response, cancelled)
+
+    def _stream_events(self, response, cancelled=None):
+        # SSE is always UTF-8; without a charset requests would assume ISO-8859-1
+        response.encoding = "utf-8"
+        with response:
+            try:
+                for line in response.iter_lines(decode_unicode=True):
+                    if cancelled is not None and cancelled.is_set():
+                        return
+                    # Blank lines separate events; ':' lines are keep-alive comments
+                    if not line or line.startswith(":") or not line.startswith("data:"):
+                        continue
+                    data = line[len("data:"):].strip()
+                    if data == "[DONE]":
+                        return
+                    try:
+                        event = json.loads(data)
+                    except ValueError:
+                        raise InvalidResponseError("OpenRouter sent a malformed stream event", 200, data[:2000])
+                    if "error" in event:
+                        error = event["error"]
+                        message = error.get("message", error) if isinstance(error, dict) else error
+                        raise UpstreamError(f"OpenRouter stream error: {message}", 200, data[:2000])
+                    for choice in event.get("choices", []):
+                        content = (choice.get("delta") or {}).get("content")
+                        if content:
+                            yield content
+            except (requests.exceptions.ConnectionError, requests.exceptions.ChunkedEncodingError) as e:
+                # Stalled reads and dropped connections mid-body both land here
+                self.breaker.record_failure()
+                raise ConnectionFailedError(f"OpenRouter stream was interrupted: {e}")
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_client():
+    """Process-wide client so every call reuses the same connection pool"""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = OpenRouterClient(
+                pool_size=int(os.getenv("OPENROUTER_POOL_SIZE", "10")),
+                connect_timeout=float(os.getenv("OPENROUTER_CONNECT_TIMEOUT", "5")),
+                read_timeout=float(os.getenv("OPENROUTER_READ_TIMEOUT", "60")),
+                max_retries=int(os.getenv("OPENROUTER_MAX_RETRIES", "3")),
+                scheduler=RequestScheduler(
+                    rate=float(os.getenv("OPENROUTER_RATE", "4")),
+                    burst=int(os.getenv("OPENROUTER_BURST", "8")),
+                    max_in_flight=int(os.getenv("OPENROUTER_MAX_IN_FLIGHT", "8")),
+                ),
+                queue_timeout=float(os.getenv("OPENROUTER_QUEUE_TIMEOUT", "120")) or None,
+            )
+            register_gauges("scheduler", _client.scheduler.stats)
+        return _client
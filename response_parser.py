@@ -0,0 +1,238 @@
+"""Schema, tolerant parsing and validation of the model's analysis JSON"""
+import json
+import re
+import threading
+
+from metrics import register_gauges
+
+
+LIST_FIELDS = (
+    "affected_teeth",
+    "visible_issues",
+    "possible_causes",
+    "immediate_concerns",
+    "recommended_treatments",
+    "prevention_tips",
+    "home_care_instructions",
+)
+TEXT_FIELDS = (
+    "cavity_stage",
+    "severity_level",
+    "emergency_level",
+    "estimated_timeline",
+    "prognosis",
+    "when_to_see_dentist",
+    "additional_notes",
+)
+BOOL_FIELDS = ("cavity_present",)
+
+FINDING_PROPERTIES = {
+    "cavity_stage": {"type": "string", "description": "Stage 0-4, e.g. 'Stage 2 - Dentin decay'"},
+    "cavity_present": {"type": "boolean"},
+    "affected_teeth": {"type": "array", "items": {"type": "string"}},
+    "severity_level": {"type": "string", "enum": ["None", "Mild", "Moderate", "Severe", "Critical"]},
+    "visible_issues": {"type": "array", "items": {"type": "string"}},
+    "possible_causes": {"type": "array", "items": {"type": "string"}},
+    "immediate_concerns": {"type": "array", "items": {"type": "string"}},
+    "recommended_treatments": {"type": "array", "items": {"type": "string"}},
+    "prevention_tips": {"type": "array", "items": {"type": "string"}},
+    "emergency_level": {"type": "string", "enum": ["None", "Low", "Medium", "High", "Critical"]},
+    "estimated_timeline": {"type": "string"},
+    "prognosis": {"type": "string"},
+    "home_care_instructions": {"type": "array", "items": {"type": "string"}},
+    "when_to_see_dentist": {"type": "string"},
+    "additional_notes": {"type": "string"},
+}
+
+ANALYSIS_SCHEMA = {
+    "type": "object",
+    "properties": FINDING_PROPERTIES,
+    "required": list(FINDING_PROPERTIES),
+    "additionalProperties": False,
+}
+
+# Several views of one patient: an overall assessment plus one entry per image
+PER_IMAGE_SCHEMA = {
+    "type": "object",
+    "properties": {"label": {"type": "string"}, **FINDING_PROPERTIES},
+    "required": ["label", *FINDING_PROPERTIES],
+    "additionalProperties": False,
+}
+MULTI_IMAGE_SCHEMA = {
+    "type": "object",
+    "properties": {**FINDING_PROPERTIES, "per_image": {"type": "array", "items": PER_IMAGE_SCHEMA}},
+    "required": [*FINDING_PROPERTIES, "per_image"],
+    "additionalProperties": False,
+}
+
+RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {"name": "dental_analysis", "strict": True, "schema": ANALYSIS_SCHEMA},
+}
+MULTI_IMAGE_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {"name": "dental_exam", "strict": True, "schema": MULTI_IMAGE_SCHEMA},
+}
+
+MAX_REPAIRS = 8
+
+_FENCE = re.compile(r"```(?:json|JSON)?")
+_TRAILING_COMMA = re.compile(r",(\s*[}\]])")
+_decoder = json.JSONDecoder()
+
+
+# A parse missing any of these is a cut-off answer, not an analysis
+REQUIRED_FIELDS = ("cavity_stage", "severity_level", "visible_issues", "recommended_treatments")
+
+
+def validate_analysis(raw):
+    """Normalize a decoded analysis object, keeping only the known fields
+
+    Entries of a multi-image result keep their ``label``. Raises ValueError
+    when any of ``REQUIRED_FIELDS`` is missing or empty; a ``per_image``
+    entry missing one is dropped rather than failing the whole exam.
+    """
+    if not isinstance(raw, dict):
+        raise ValueError(f"Expected a JSON object, got {type(raw).__name__}")
+
+    analysis = {}
+    for name in LIST_FIELDS:
+        value = raw.get(name)
+        if value is None:
+            continue
+        if not isinstance(value, list):
+            value = [value]
+        analysis[name] = [str(item) for item in value if item is not None and str(item).strip()]
+    for name in TEXT_FIELDS:
+        value = raw.get(name)
+        if value is not None:
+            analysis[name] = value if isinstance(value, str) else str(value)
+    for name in BOOL_FIELDS:
+        value = raw.get(name)
+        if isinstance(value, str):
+            value = value.strip().lower() in ("true", "yes", "1")
+        if value is not None:
+            analysis[name] = bool(value)
+
+    missing = [name for name in REQUIRED_FIELDS if name not in analysis or analysis[name] == ""]
+    if missing:
+        raise ValueError(f"Analysis is missing {', '.join(missing)}")
+
+    if raw.get("label") is not None:
+        analysis["label"] = str(raw["label"])
+    if isinstance(raw.get("per_image"), list):
+        analysis["per_image"] = []
+        for item in raw["per_image"]:
+            try:
+                analysis["per_image"].append(validate_analysis(item))
+            except ValueError:
+                continue
+    return analysis
+
+
+class ParseStats:
+    """Counts of first-try parses, repaired parses and failures"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counts = {"ok": 0, "repaired": 0, "failed": 0}
+
+    def record(self, outcome):
+        with self._lock:
+            self.counts[outcome] += 1
+
+    def snapshot(self):
+        with self._lock:
+            counts = dict(self.counts)
+        total = sum(counts.values())
+        counts["success_rate"] = (counts["ok"] + counts["repaired"]) / total if total else 1.0
+        return counts
+
+
+parse_stats = ParseStats()
+register_gauges("parse", parse_stats.snapshot)
+
+
+def strip_fences(text):
+    return _FENCE.sub("", text)
+
+
+def _scan(text):
+    """Open brackets, whether we end inside a string, and comma positions outside strings"""
+    stack = []
+    commas = []
+    in_string = False
+    escape = False
+    for index, ch in enumerate(text):
+        if in_string:
+            if escape:
+                escape = False
+            elif ch == "\\":
+                escape = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch in "{[":
+            stack.append(ch)
+        elif ch in "}]":
+            if stack:
+                stack.pop()
+        elif ch == ",":
+            commas.append(index)
+    return stack, in_string, escape, commas
+
+
+def repair_json(text, max_repairs=MAX_REPAIRS):
+    """Parse JSON that may be truncated, closing open strings/arrays/objects
+
+    Each failed attempt drops the last (incomplete) member and tries again,
+    at most ``max_repairs`` times. Raises ValueError if nothing parses.
+    """
+    candidate = text.strip()
+    for _ in range(max_repairs):
+        stack, in_string, escape, commas = _scan(candidate)
+        fixed = candidate
+        if in_string:
+            fixed = (fixed[:-1] if escape else fixed) + '"'
+        fixed = fixed.rstrip().rstrip(",")
+        fixed += "".join("}" if opener == "{" else "]" for opener in reversed(stack))
+        fixed = _TRAILING_COMMA.sub(r"\1", fixed)
+        try:
+            return json.loads(fixed)
+        except json.JSONDecodeError:
+            if not commas:
+                break
+            candidate = candidate[:commas[-1]]
+    raise ValueError("Could not repair JSON response")
+
+
+def parse_analysis_text(content):
+    """Extract the analysis object from model output; returns (dict, 'ok' | 'repaired')"""
+    text = strip_fences(content)
+    start = text.find("{")
+    if start == -1:
+        raise ValueError("No JSON object found in response")
+
+    # raw_decode stops at the end of the object, so trailing prose is ignored
+    try:
+        return _decoder.raw_decode(text, start)[0], "ok"
+    except json.JSONDecodeError:
+        pass
+    return repair_json(text[start:]), "repaired"
+
+
+def parse_analysis_response(content):
+    """Parse, repair if needed and validate model output; returns (analysis, 'ok' | 'repaired')
+
+    Raises ValueError when the output cannot be turned into an analysis; the
+    outcome is recorded in ``parse_stats`` either way.
+    """
+    try:
+        raw, outcome = parse_analysis_text(content)
+        analysis = validate_analysis(raw)
+    except ValueError:
+        parse_stats.record("failed")
+        raise
+    parse_stats.record(outcome)
+    return analysis, outcome
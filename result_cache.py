@@ -0,0 +1,207 @@
+"""Two-tier (memory LRU + SQLite) cache for dental analysis results"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+
+DEFAULT_CACHE_DIR = os.getenv("CAVATYAI_CACHE_DIR", os.path.join(os.getcwd(), ".cavatyai_cache"))
+
+
+def make_cache_key(image_bytes, lang, model, prompt_version):
+    """Build a content-addressed key from normalized image bytes and request settings"""
+    digest = hashlib.sha256()
+    digest.update(image_bytes)
+    for part in (lang, model, prompt_version):
+        digest.update(b"\x00")
+        digest.update(str(part).encode("utf-8"))
+    return digest.hexdigest()
+
+
+class SQLiteStore:
+    """Key/value blob store on disk with TTL and size-based LRU eviction"""
+
+    def __init__(self, path, table="entries", ttl_seconds=None, max_bytes=None):
+        self.path = path
+        self.table = table
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                f"""CREATE TABLE IF NOT EXISTS {self.table} (
+                    key TEXT PRIMARY KEY,
+                    value BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    created REAL NOT NULL,
+                    accessed REAL NOT NULL
+                )"""
+            )
+            conn.execute(f"CREATE INDEX IF NOT EXISTS {self.table}_accessed ON {self.table} (accessed)")
+
+    def _connect(self):
+        # A short-lived connection per operation keeps the store safe to share
+        # between Streamlit script threads and between server processes.
+        return sqlite3.connect(self.path, timeout=5)
+
+    def get(self, key):
+        """``(value, created)`` for a live entry, else None"""
+        now = time.time()
+        with self._lock, self._connect() as conn:
+            row = conn.execute(
+                f"SELECT value, created FROM {self.table} WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            value, created = row
+            if self.ttl_seconds is not None and now - created > self.ttl_seconds:
+                conn.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+                return None
+            conn.execute(f"UPDATE {self.table} SET accessed = ? WHERE key = ?", (now, key))
+            return bytes(value), created
+
+    def set(self, key, value):
+        now = time.time()
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                f"INSERT OR REPLACE INTO {self.table} (key, value, size, created, accessed) VALUES (?, ?, ?, ?, ?)",
+                (key, sqlite3.Binary(value), len(value), now, now),
+            )
+            self._evict(conn, now)
+
+    def delete(self, key):
+        with self._lock, self._connect() as conn:
+            conn.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+
+    def _evict(self, conn, now):
+        if self.ttl_seconds is not None:
+            conn.execute(f"DELETE FROM {self.table} WHERE created < ?", (now - self.ttl_seconds,))
+        if self.max_bytes is None:
+            return
+        total = conn.execute(f"SELECT COALESCE(SUM(size), 0) FROM {self.table}").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        # Drop least recently used rows until we are back under the cap
+        for key, size in conn.execute(f"SELECT key, size FROM {self.table} ORDER BY accessed ASC").fetchall():
+            conn.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+    def stats(self):
+        with self._lock, self._connect() as conn:
+            count, total = conn.execute(
+                f"SELECT COUNT(*), COALESCE(SUM(size), 0) FROM {self.table}"
+            ).fetchone()
+        return {"entries": count, "bytes": total}
+
+
+class ResultCache:
+    """In-process LRU in front of a SQLite store, holding JSON-serializable results"""
+
+    def __init__(self, path=None, max_memory_items=128, ttl_seconds=7 * 24 * 3600, max_disk_bytes=256 * 1024 * 1024,
+                 table="analysis_results"):
+        self.max_memory_items = max_memory_items
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk = SQLiteStore(
+            path or os.path.join(DEFAULT_CACHE_DIR, "analysis.sqlite3"),
+            table=table,
+            ttl_seconds=ttl_seconds,
+            max_bytes=max_disk_bytes,
+        )
+        self.ttl_seconds = ttl_seconds
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.corrupt = 0
+
+    def get(self, key):
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                stored_at, value = entry
+                if self.ttl_seconds is None or now - stored_at <= self.ttl_seconds:
+                    self._memory.move_to_end(key)
+                    self.memory_hits += 1
+                    return json.loads(value)
+                del self._memory[key]
+
+        try:
+            entry = self._disk.get(key)
+        except sqlite3.Error:
+            entry = None
+
+        value = result = None
+        corrupt = False
+        if entry is not None:
+            raw, created = entry
+            try:
+                value = raw.decode("utf-8")
+                result = json.loads(value)
+            except ValueError:
+                # A torn write or a foreign row is a miss, not a failed analysis
+                value = None
+                corrupt = True
+                try:
+                    self._disk.delete(key)
+                except sqlite3.Error:
+                    pass
+
+        with self._lock:
+            if value is None:
+                self.misses += 1
+                if corrupt:
+                    self.corrupt += 1
+                return None
+            self.disk_hits += 1
+            # The memory copy expires with the disk row, not a full TTL after this read
+            self._remember(key, value, created)
+        return result
+
+    def set(self, key, result):
+        value = json.dumps(result, ensure_ascii=False)
+        with self._lock:
+            self._remember(key, value, time.time())
+        try:
+            self._disk.set(key, value.encode("utf-8"))
+        except sqlite3.Error:
+            # The memory tier still serves this process if the disk is unavailable
+            pass
+
+    def _remember(self, key, value, stored_at):
+        # Values are kept serialized so callers can never mutate a cached result
+        self._memory[key] = (stored_at, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_items:
+            self._memory.popitem(last=False)
+
+    def stats(self):
+        with self._lock:
+            hits = self.memory_hits + self.disk_hits
+            lookups = hits + self.misses
+            stats = {
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "corrupt": self.corrupt,
+                "hit_rate": hits / lookups if lookups else 0.0,
+                "memory_entries": len(self._memory),
+            }
+        try:
+            disk = self._disk.stats()
+            stats["disk_entries"] = disk["entries"]
+            stats["disk_bytes"] = disk["bytes"]
+        except sqlite3.Error:
+            pass
+        return stats
@@ -0,0 +1,148 @@
+"""Process-wide admission control for upstream model requests
+
+Every Streamlit session shares one server process, so without coordination a
+clinic opening many tabs fires all of its requests at once and they fail with
+429s together. The scheduler admits requests through a token bucket (rate and
+burst) and a cap on requests in flight, in priority order, so an emergency
+re-analysis overtakes routine work waiting in the queue.
+"""
+import heapq
+import itertools
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+
+PRIORITY_EMERGENCY = 0
+PRIORITY_NORMAL = 10
+
+
+class QueueTimeout(Exception):
+    """A request waited longer than its timeout for a slot"""
+
+
+class RequestScheduler:
+    """Token bucket plus max-in-flight cap with a priority wait queue
+
+    ``rate`` is requests started per second (None for unlimited), ``burst``
+    the bucket size and ``max_in_flight`` the number of requests allowed to
+    run at once (None for unlimited). Waiters of equal priority are served
+    first come, first served. ``clock`` drives the token refill and the
+    queue timeout.
+    """
+
+    def __init__(self, rate=None, burst=1, max_in_flight=None, history=500, clock=time.monotonic):
+        self.rate = rate or None
+        self.burst = max(1, burst)
+        self.max_in_flight = max_in_flight or None
+        self._clock = clock
+        self._cond = threading.Condition()
+        self._waiting = []
+        self._sequence = itertools.count()
+        self._tokens = float(self.burst)
+        self._refilled = self._clock()
+        self._waits = deque(maxlen=history)
+        self.in_flight = 0
+        self.admitted = 0
+        self.timeouts = 0
+
+    def configure(self, rate=None, burst=1, max_in_flight=None):
+        """Replace the limits in place (same meaning as the constructor); waiters are re-checked at once"""
+        with self._cond:
+            self._refill(self._clock())
+            self.rate = rate or None
+            self.burst = max(1, burst)
+            self._tokens = min(self._tokens, float(self.burst))
+            self.max_in_flight = max_in_flight or None
+            self._cond.notify_all()
+
+    def _refill(self, now):
+        if self.rate is not None:
+            self._tokens = min(self.burst, self._tokens + (now - self._refilled) * self.rate)
+        self._refilled = now
+
+    def _position(self, entry):
+        return 1 + sum(1 for other in self._waiting if other < entry)
+
+    def acquire(self, priority=PRIORITY_NORMAL, on_queue=None, timeout=None):
+        """Block until the request may start
+
+        ``on_queue(position)`` is called whenever the caller's 1-based place
+        in the queue changes while waiting, and with 0 once it is admitted.
+        Raises QueueTimeout after ``timeout`` seconds without a slot.
+        """
+        entry = (priority, next(self._sequence))
+        started = self._clock()
+        reported = None
+        with self._cond:
+            heapq.heappush(self._waiting, entry)
+            while True:
+                now = self._clock()
+                self._refill(now)
+                delay = None
+                if self._waiting[0] == entry and (self.max_in_flight is None or self.in_flight < self.max_in_flight):
+                    if self.rate is None or self._tokens >= 1:
+                        break
+                    # Head of the queue with a free slot: sleep until the next token
+                    delay = (1 - self._tokens) / self.rate
+
+                position = self._position(entry)
+                if on_queue is not None and position != reported:
+                    on_queue(position)
+                    reported = position
+
+                if timeout is not None:
+                    remaining = timeout - (now - started)
+                    if remaining <= 0:
+                        self._waiting.remove(entry)
+                        heapq.heapify(self._waiting)
+                        self.timeouts += 1
+                        self._cond.notify_all()
+                        raise QueueTimeout(f"No request slot within {timeout:g}s")
+                    delay = remaining if delay is None else min(delay, remaining)
+                self._cond.wait(delay)
+
+            heapq.heappop(self._waiting)
+            if self.rate is not None:
+                self._tokens -= 1
+            self.in_flight += 1
+            self.admitted += 1
+            self._waits.append(self._clock() - started)
+            # The next waiter is now at the head and may be admissible too
+            self._cond.notify_all()
+
+        if on_queue is not None and reported is not None:
+            on_queue(0)
+
+    def release(self):
+        with self._cond:
+            self.in_flight -= 1
+            self._cond.notify_all()
+
+    @contextmanager
+    def slot(self, priority=PRIORITY_NORMAL, on_queue=None, timeout=None):
+        """Hold a request slot for the duration of the ``with`` block"""
+        self.acquire(priority, on_queue, timeout)
+        try:
+            yield
+        finally:
+            self.release()
+
+    def stats(self):
+        with self._cond:
+            waits = sorted(self._waits)
+            stats = {
+                "queue_depth": len(self._waiting),
+                "in_flight": self.in_flight,
+                "admitted": self.admitted,
+                "timeouts": self.timeouts,
+                "rate_per_s": self.rate,
+                "burst": self.burst,
+                "max_in_flight": self.max_in_flight,
+            }
+        if waits:
+            stats["wait_mean_s"] = round(sum(waits) / len(waits), 4)
+            stats["wait_p95_s"] = round(waits[min(len(waits) - 1, int(0.95 * len(waits)))], 4)
+            stats["wait_max_s"] = round(waits[-1], 4)
+        return stats
@@ -0,0 +1,96 @@
+"""Memoized pipeline stages that only recompute when their inputs change
+
+The app's stages form a small dependency graph::
+
+    image ──► prepared payload
+    image ──► source analysis (model call, only on button press)
+    source analysis + lang ──► analysis (localized)
+    analysis + lang ──► summary
+    summary + voice + rate ──► audio
+
+Each stage's output is stored in session state together with a fingerprint
+of its inputs. Downstream stages take the upstream *output* fingerprint as an
+input, so changing the voice re-runs only TTS and changing the speech rate
+never reaches the model.
+"""
+import dataclasses
+import hashlib
+import json
+
+
+def _update(digest, part):
+    if isinstance(part, (bytes, bytearray)):
+        digest.update(b"b")
+        digest.update(part)
+    elif dataclasses.is_dataclass(part):
+        for field in dataclasses.fields(part):
+            _update(digest, getattr(part, field.name))
+    else:
+        digest.update(b"j")
+        digest.update(json.dumps(part, sort_keys=True, ensure_ascii=False, default=repr).encode("utf-8"))
+    digest.update(b"\x00")
+
+
+def fingerprint(*parts):
+    """Stable digest of stage inputs (str, numbers, bytes, dicts, lists, dataclasses)"""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        _update(digest, part)
+    return digest.hexdigest()
+
+
+class StageGraph:
+    """Per-session memo of stage outputs keyed by input fingerprints"""
+
+    def __init__(self, store, namespace="_stage_graph"):
+        if namespace not in store:
+            store[namespace] = {}
+        self._memo = store[namespace]
+
+    def get(self, name, inputs):
+        """Stored output of ``name`` if it was produced from the same inputs, else None"""
+        entry = self._memo.get(name)
+        if entry is not None and entry["inputs"] == fingerprint(*inputs):
+            return entry["value"]
+        return None
+
+    def put(self, name, inputs, value, error=None):
+        """Record an output produced elsewhere (e.g. by the concurrent pipeline)
+
+        With ``error`` the stage is recorded as failed for these inputs; see
+        ``run(remember_errors=True)``.
+        """
+        self._memo[name] = {"inputs": fingerprint(*inputs), "value": value, "output": fingerprint(value),
+                            "error": error}
+        return value
+
+    def run(self, name, inputs, compute, remember_errors=False):
+        """Return the memoized output of ``name`` or compute and store it
+
+        Exceptions from ``compute`` propagate and nothing is stored, so a
+        failed stage is retried on the next rerun. With ``remember_errors``
+        the exception is stored instead and raised again for the same
+        inputs, so a slow failure is only retried once an input changes.
+        """
+        entry = self._memo.get(name)
+        key = fingerprint(*inputs)
+        if entry is not None and entry["inputs"] == key:
+            if entry.get("error") is not None:
+                raise entry["error"].with_traceback(None)
+            return entry["value"]
+        try:
+            value = compute()
+        except Exception as e:
+            if remember_errors:
+                self.put(name, inputs, None, error=e)
+            raise
+        self._memo[name] = {"inputs": key, "value": value, "output": fingerprint(value)}
+        return value
+
+    def output(self, name):
+        """Fingerprint of the current output of ``name``, for use as a downstream input"""
+        entry = self._memo.get(name)
+        return entry["output"] if entry is not None else None
+
+    def discard(self, name):
+        self._memo.pop(name, None)
@@ -0,0 +1,65 @@
+import sqlite3
+
+from audio_cache import AudioCache, make_audio_key
+from mock_servers import fake_mp3
+
+
+AUDIO = fake_mp3(2000)
+
+
+def corrupt(cache, key):
+    with sqlite3.connect(cache.path) as conn:
+        conn.execute("UPDATE audio SET value = ? WHERE key = ?", (b"\0" * 32 + AUDIO, key))
+
+
+def request_keys(cache):
+    with sqlite3.connect(cache.path) as conn:
+        return {key for key, in conn.execute("SELECT key FROM audio_requests")}
+
+
+def test_round_trip_and_normalized_text(tmp_path):
+    cache = AudioCache(path=str(tmp_path / "audio.sqlite3"))
+    assert cache.get("Hello  world", "voice", "+0%") is None
+    cache.set("Hello world", "voice", "+0%", "+0Hz", AUDIO)
+    assert cache.get(" Hello world ", "voice", "+0%") == AUDIO
+    assert cache.get("Hello world", "other-voice", "+0%") is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 2
+
+
+def test_corrupt_entry_is_a_miss_and_dropped(tmp_path):
+    cache = AudioCache(path=str(tmp_path / "audio.sqlite3"))
+    cache.set("text", "voice", "+0%", "+0Hz", AUDIO)
+    corrupt(cache, make_audio_key("text", "voice", "+0%", "+0Hz"))
+    assert cache.get("text", "voice", "+0%") is None
+    assert cache.stats()["corrupt"] == 1
+    assert cache.stats()["disk_entries"] == 0
+
+
+def test_disk_error_while_dropping_is_a_miss(tmp_path, monkeypatch):
+    cache = AudioCache(path=str(tmp_path / "audio.sqlite3"))
+    cache.set("text", "voice", "+0%", "+0Hz", AUDIO)
+    corrupt(cache, make_audio_key("text", "voice", "+0%", "+0Hz"))
+
+    def locked(key):
+        raise sqlite3.OperationalError("database is locked")
+
+    monkeypatch.setattr(cache._store, "delete", locked)
+    assert cache.get("text", "voice", "+0%") is None
+    assert cache.stats()["misses"] == 1
+
+
+def test_request_log_is_pruned_with_the_audio(tmp_path):
+    # Room for two entries, and for one script whose audio was evicted
+    cache = AudioCache(path=str(tmp_path / "audio.sqlite3"), max_bytes=2 * (len(AUDIO) + 32), max_requests=1)
+    for index in range(5):
+        text = f"script {index}"
+        for _ in range(index + 1):
+            cache.get(text, "voice", "+0%")
+        cache.set(text, "voice", "+0%", "+0Hz", AUDIO)
+
+    cached = {make_audio_key(f"script {index}", "voice", "+0%", "+0Hz") for index in (3, 4)}
+    most_requested_evicted = make_audio_key("script 2", "voice", "+0%", "+0Hz")
+    assert cache.stats()["disk_entries"] == 2
+    assert request_keys(cache) == cached | {most_requested_evicted}
+    assert [text for text, *_ in cache.popular_scripts()] == ["script 4", "script 3", "script 2"]
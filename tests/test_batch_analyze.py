@@ -0,0 +1,103 @@
+import itertools
+import json
+
+import pytest
+from PIL import Image
+
+import batch_analyze
+import model_registry
+import openrouter_client
+from circuit_breaker import CircuitBreaker
+from mock_servers import MockConfig, MockServers
+
+
+ITEMS = 8
+
+
+@pytest.fixture
+def servers(monkeypatch):
+    servers = MockServers(MockConfig(model_latency=0.02)).start()
+    # batch_analyze talks to the process-wide client and model registry
+    monkeypatch.setattr(openrouter_client, "_client", openrouter_client.OpenRouterClient(
+        base_url=servers.base_url, max_retries=0, breaker=CircuitBreaker("batch-test", failure_threshold=100)))
+    monkeypatch.setattr(model_registry, "_registry", None)
+    monkeypatch.delenv("ANALYSIS_MODELS", raising=False)
+    monkeypatch.delenv("ANALYSIS_HEDGE", raising=False)
+    yield servers
+    servers.stop()
+
+
+@pytest.fixture
+def photos(tmp_path):
+    directory = tmp_path / "photos"
+    directory.mkdir()
+    for index in range(ITEMS):
+        Image.new("RGB", (64, 48), (index * 30, 80, 120)).save(directory / f"tooth{index}.png")
+    return directory
+
+
+def read_records(path):
+    records = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        try:
+            records.append(json.loads(line))
+        except json.JSONDecodeError:
+            pass
+    return records
+
+
+def test_interrupted_run_resumes_without_duplicates(servers, photos, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    output = tmp_path / "results.jsonl"
+    argv = [str(photos), "--output", str(output), "--concurrency", "2", "--api-key", "test",
+            "--no-cache", "--quality-gate", "off"]
+
+    process_item = batch_analyze.process_item
+    calls = itertools.count(1)
+
+    def interrupted(*args, **kwargs):
+        # Ctrl+C while the fourth item is being analyzed
+        if next(calls) == 4:
+            raise KeyboardInterrupt
+        return process_item(*args, **kwargs)
+
+    monkeypatch.setattr(batch_analyze, "process_item", interrupted)
+    batch_analyze.main(argv)
+    first = read_records(output)
+    assert 0 < len(first) < ITEMS
+    assert all(record["status"] == "ok" for record in first)
+
+    # The process died mid-write as well
+    with open(output, "a", encoding="utf-8") as partial:
+        partial.write('{"id": "tooth0.png", "status": "o')
+
+    monkeypatch.setattr(batch_analyze, "process_item", process_item)
+    assert batch_analyze.main(argv) == 0
+    records = read_records(output)
+    ids = [record["id"] for record in records]
+    assert len(ids) == len(set(ids))
+    assert sorted(ids) == sorted(f"tooth{index}.png" for index in range(ITEMS))
+    assert all(record["status"] == "ok" for record in records)
+    assert records[:len(first)] == first
+
+    # Nothing left to do
+    chats = servers.requests["chat"]
+    assert batch_analyze.main(argv) == 0
+    assert read_records(output) == records
+    assert servers.requests["chat"] == chats
+
+
+def test_failed_items_are_retried(servers, photos, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    output = tmp_path / "results.jsonl"
+    argv = [str(photos), "--output", str(output), "--concurrency", "4", "--api-key", "test",
+            "--no-cache", "--quality-gate", "off"]
+
+    servers.config.model_error_rate = 1.0
+    assert batch_analyze.main(argv) == 1
+    assert {record["status"] for record in read_records(output)} == {"error"}
+
+    servers.config.model_error_rate = 0.0
+    assert batch_analyze.main(argv) == 0
+    ok = [record["id"] for record in read_records(output) if record["status"] == "ok"]
+    assert sorted(ok) == sorted(f"tooth{index}.png" for index in range(ITEMS))
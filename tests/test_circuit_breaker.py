@@ -0,0 +1,113 @@
+import pytest
+
+from circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitOpenError
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def make_breaker(clock, **kwargs):
+    kwargs.setdefault("failure_threshold", 3)
+    kwargs.setdefault("reset_timeout", 10)
+    kwargs.setdefault("max_reset_timeout", 35)
+    return CircuitBreaker("upstream", clock=clock, **kwargs)
+
+
+def fail(breaker, times=1):
+    for _ in range(times):
+        breaker.before_call()
+        breaker.record_failure()
+
+
+def test_opens_after_consecutive_failures(clock):
+    breaker = make_breaker(clock)
+    fail(breaker, 2)
+    breaker.before_call()
+    breaker.record_success()
+    fail(breaker, 2)
+    assert breaker.state == CLOSED
+    fail(breaker)
+    assert breaker.state == OPEN
+    assert breaker.trips == 1
+
+    with pytest.raises(CircuitOpenError) as raised:
+        breaker.check()
+    assert raised.value.retry_in == 10
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    assert breaker.stats()["rejected"] == 2
+
+
+def test_half_open_admits_a_single_probe(clock):
+    breaker = make_breaker(clock)
+    fail(breaker, 3)
+    clock.advance(9.9)
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    clock.advance(0.1)
+    breaker.check()
+    breaker.before_call()
+    assert breaker.state == HALF_OPEN
+    # Everyone else waits for the probe's outcome
+    with pytest.raises(CircuitOpenError):
+        breaker.check()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    breaker.record_success()
+    assert breaker.state == CLOSED
+    assert breaker.stats() == {"state": CLOSED, "consecutive_failures": 0, "trips": 1, "rejected": 3}
+
+
+def test_failed_probes_double_the_wait_up_to_the_max(clock):
+    breaker = make_breaker(clock)
+    fail(breaker, 3)
+    for wait in (20, 35, 35):
+        clock.advance(breaker.stats()["retry_in_s"])
+        fail(breaker)
+        assert breaker.state == OPEN
+        assert breaker.stats()["retry_in_s"] == wait
+        clock.advance(wait - 1)
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+        clock.advance(1)
+    assert breaker.trips == 4
+
+    # Success resets the wait to the base timeout
+    breaker.before_call()
+    breaker.record_success()
+    fail(breaker, 3)
+    assert breaker.stats()["retry_in_s"] == 10
+
+
+def test_released_probe_lets_the_next_caller_probe(clock):
+    breaker = make_breaker(clock)
+    fail(breaker, 3)
+    clock.advance(10)
+    breaker.before_call()
+    # e.g. the caller was cancelled before the upstream answered
+    breaker.release()
+    assert breaker.state == HALF_OPEN
+    breaker.before_call()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+
+def test_threshold_is_at_least_one(clock):
+    breaker = make_breaker(clock, failure_threshold=0)
+    fail(breaker)
+    assert breaker.state == OPEN
@@ -0,0 +1,84 @@
+import threading
+import time
+
+import pytest
+
+from job_queue import DONE, FAILED, JobQueue, JobQueueFull
+from scheduler import PRIORITY_EMERGENCY, PRIORITY_NORMAL
+
+
+def blocked_queue(**kwargs):
+    """A one-worker queue whose worker is busy until the returned event is set"""
+    jobs = JobQueue(workers=1, **kwargs)
+    release = threading.Event()
+    started = threading.Event()
+
+    def block(job):
+        started.set()
+        release.wait(2)
+
+    jobs.submit(block)
+    assert started.wait(2)
+    return jobs, release
+
+
+def test_jobs_run_by_priority_then_submission_order():
+    jobs, release = blocked_queue()
+    order = []
+    submitted = [
+        jobs.submit(lambda job: order.append("routine 1")),
+        jobs.submit(lambda job: order.append("routine 2")),
+        jobs.submit(lambda job: order.append("emergency 1"), priority=PRIORITY_EMERGENCY),
+        jobs.submit(lambda job: order.append("routine 3"), priority=PRIORITY_NORMAL),
+        jobs.submit(lambda job: order.append("emergency 2"), priority=PRIORITY_EMERGENCY),
+    ]
+    assert [jobs.position(job) for job in submitted] == [3, 4, 1, 5, 2]
+
+    release.set()
+    for job in submitted:
+        assert job.done.wait(2)
+    assert order == ["emergency 1", "emergency 2", "routine 1", "routine 2", "routine 3"]
+    assert [jobs.position(job) for job in submitted] == [0] * 5
+
+
+def test_result_error_and_counters():
+    jobs = JobQueue(workers=2)
+    ok = jobs.submit(lambda job: {"answer": job.context["n"]}, context={"n": 1})
+    broken = jobs.submit(lambda job: 1 / 0)
+    assert ok.done.wait(2) and broken.done.wait(2)
+    assert (ok.status, ok.result) == (DONE, {"answer": 1})
+    assert broken.status == FAILED
+    assert isinstance(broken.error, ZeroDivisionError)
+    assert jobs.get(ok.id) is ok
+    stats = jobs.stats()
+    assert (stats["submitted"], stats["completed"], stats["failed"], stats["running"]) == (2, 1, 1, 0)
+
+
+def test_max_pending():
+    jobs, release = blocked_queue(max_pending=2)
+    jobs.submit(lambda job: None)
+    jobs.submit(lambda job: None)
+    with pytest.raises(JobQueueFull):
+        jobs.submit(lambda job: None, priority=PRIORITY_EMERGENCY)
+    assert jobs.stats()["rejected"] == 1
+    assert jobs.stats()["queued"] == 2
+    release.set()
+
+
+def test_finished_jobs_are_pruned_by_age_and_count():
+    jobs = JobQueue(workers=1, retention_seconds=60, max_finished=2)
+    finished = [jobs.submit(lambda job: None) for _ in range(3)]
+    for job in finished:
+        assert job.done.wait(2)
+    # The oldest finished job has expired
+    finished[0].finished = time.time() - 61
+
+    jobs.submit(lambda job: None).done.wait(2)
+    assert jobs.get(finished[0].id) is None
+    assert jobs.get(finished[1].id) is finished[1]
+    assert jobs.get(finished[2].id) is finished[2]
+
+    # Over max_finished: the oldest are dropped first
+    jobs.submit(lambda job: None)
+    assert jobs.get(finished[1].id) is None
+    assert jobs.get(finished[2].id) is finished[2]
@@ -0,0 +1,90 @@
+import json
+import random
+
+import pytest
+
+from json_stream import FieldStreamParser
+from mock_servers import mock_analysis
+
+
+TRICKY = {
+    "braces": "a } and { and ] and [ inside a string",
+    "quotes": 'she said "stage 2", then \\ left',
+    "commas": "one, two, three",
+    "nested": {"list": [1, [2, 3], {"x": "}"}], "empty": {}, "none": None},
+    "list": [{"a": 1}, {"b": [True, False]}, []],
+    "unicode": "नमूना – ñ  ",
+    "number": -1.5e3,
+}
+DOCUMENTS = [
+    json.dumps(TRICKY),
+    json.dumps(TRICKY, indent=2, ensure_ascii=False),
+    json.dumps(mock_analysis(list_items=4, per_image_labels=["Upper", "Lower"]), ensure_ascii=False),
+]
+
+
+def feed_all(chunks):
+    parser = FieldStreamParser()
+    emitted = []
+    for chunk in chunks:
+        emitted.extend(parser.feed(chunk))
+    return parser, emitted
+
+
+def random_chunks(text, rng):
+    chunks = []
+    while text:
+        size = rng.randint(1, 12)
+        chunks.append(text[:size])
+        text = text[size:]
+    return chunks
+
+
+@pytest.mark.parametrize("document", DOCUMENTS)
+def test_one_character_at_a_time(document):
+    parser, emitted = feed_all(document)
+    assert emitted == list(json.loads(document).items())
+    assert parser.fields == json.loads(document)
+    assert parser.done
+
+
+@pytest.mark.parametrize("seed", range(20))
+@pytest.mark.parametrize("document", DOCUMENTS)
+def test_random_chunks(document, seed):
+    parser, emitted = feed_all(random_chunks(document, random.Random(seed)))
+    assert emitted == list(json.loads(document).items())
+
+
+@pytest.mark.parametrize("document", DOCUMENTS)
+def test_whole_document_in_one_chunk(document):
+    assert feed_all([document])[1] == list(json.loads(document).items())
+
+
+def test_fields_are_emitted_as_soon_as_they_complete():
+    parser = FieldStreamParser()
+    assert parser.feed('{"a": [1, 2') == []
+    assert parser.feed('], "b": "x, y"') == [("a", [1, 2])]
+    assert parser.feed(', "c"') == [("b", "x, y")]
+    assert parser.feed(": {}}") == [("c", {})]
+    assert parser.done
+
+
+def test_fence_and_prose_around_the_object_are_ignored():
+    document = json.dumps(TRICKY)
+    content = f"Here you go:\n```json\n{document}\n```\nAnything after the object, even {{ this }}."
+    parser, emitted = feed_all(random_chunks(content, random.Random(0)))
+    assert emitted == list(TRICKY.items())
+    assert parser.feed('{"late": 1}') == []
+
+
+def test_malformed_member_is_skipped():
+    parser, emitted = feed_all('{"a": 1, "b": tru, "c": [1, "]"], oops, "d": null}')
+    assert emitted == [("a", 1), ("c", [1, "]"]), ("d", None)]
+    assert parser.done
+
+
+def test_truncated_stream_keeps_the_completed_fields():
+    document = json.dumps(TRICKY)
+    parser, emitted = feed_all(document[:document.index('"list": [{')])
+    assert [key for key, _ in emitted] == ["braces", "quotes", "commas", "nested"]
+    assert not parser.done
@@ -0,0 +1,159 @@
+import time
+
+import pytest
+
+from model_registry import ModelRegistry, ModelStats, parse_models
+
+
+def fake_attempt(plan, started=None):
+    """Attempt that answers ``plan[model] = (seconds, result)`` unless cancelled first"""
+    def attempt(model, client, cancelled):
+        if started is not None:
+            started.append(model)
+        seconds, result = plan[model]
+        if cancelled.wait(seconds):
+            return None
+        return dict(result)
+    return attempt
+
+
+def registry(**kwargs):
+    kwargs.setdefault("hedge", True)
+    kwargs.setdefault("hedge_delay", 0.2)
+    return ModelRegistry([("primary", None), ("backup", None)], **kwargs)
+
+
+def wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.005)
+    return True
+
+
+def test_parse_models():
+    assert parse_models("a, b@http://127.0.0.1:1/api/v1,") == [("a", None), ("b", "http://127.0.0.1:1/api/v1")]
+    assert parse_models("") == [("google/gemini-2.5-flash", None)]
+
+
+def test_fast_primary_wins_without_hedging():
+    models = registry()
+    started = []
+    result, model = models.call(fake_attempt({"primary": (0.01, {"answer": 1}), "backup": (0.01, {"answer": 2})}, started))
+    assert (result, model) == ({"answer": 1}, "primary")
+    assert started == ["primary"]
+    assert models.hedged == 0
+    assert models.stats()["primary_wins"] == 1
+
+
+def test_slow_primary_is_hedged_and_the_loser_cancelled():
+    models = registry()
+    started = []
+    t0 = time.monotonic()
+    result, model = models.call(fake_attempt({"primary": (5, {"answer": 1}), "backup": (0.01, {"answer": 2})}, started))
+    assert (result, model) == ({"answer": 2}, "backup")
+    assert time.monotonic() - t0 < 1
+    assert started == ["primary", "backup"]
+    assert models.hedged == 1
+    assert wait_for(lambda: models._stats["primary"].cancelled == 1)
+    stats = models.stats()
+    assert stats["backup_wins"] == 1
+    assert stats["primary_wins"] == 0
+    # A cancelled call says nothing about the primary's latency
+    assert stats["primary_samples"] == 0
+    assert stats["primary_calls"] == 0
+
+
+def test_backup_is_cancelled_when_the_primary_answers_first():
+    models = registry(hedge_delay=0.05)
+    result, model = models.call(fake_attempt({"primary": (0.2, {"answer": 1}), "backup": (5, {"answer": 2})}))
+    assert model == "primary"
+    assert models.hedged == 1
+    assert wait_for(lambda: models._stats["backup"].cancelled == 1)
+
+
+def test_primary_failing_early_hands_over_at_once():
+    models = registry(hedge_delay=5)
+    error = {"error": "boom", "error_type": "upstream"}
+    t0 = time.monotonic()
+    result, model = models.call(fake_attempt({"primary": (0.01, error), "backup": (0.01, {"answer": 2})}))
+    assert (result, model) == ({"answer": 2}, "backup")
+    assert time.monotonic() - t0 < 1
+    assert models.failovers == 1
+    assert models.hedged == 0
+    assert models._stats["primary"].errors == 1
+
+
+def test_both_failing_reports_the_primary_error():
+    models = registry(hedge_delay=0.05)
+    plan = {
+        "primary": (0.1, {"error": "primary failed", "error_type": "upstream"}),
+        "backup": (0.01, {"error": "backup failed", "error_type": "timeout"}),
+    }
+    result, model = models.call(fake_attempt(plan))
+    assert (result["error"], model) == ("primary failed", "primary")
+
+
+def test_attempt_that_raises_does_not_hang_the_caller():
+    def attempt(model, client, cancelled):
+        if model == "primary":
+            raise RuntimeError("bug")
+        return {"answer": 2}
+
+    result, model = registry(hedge_delay=5).call(attempt)
+    assert (result, model) == ({"answer": 2}, "backup")
+
+
+def test_without_hedging_only_the_primary_is_called():
+    models = registry(hedge=False)
+    started = []
+    result, model = models.call(fake_attempt({"primary": (0.01, {"error": "x"}), "backup": (0, {})}, started))
+    assert model == "primary"
+    assert started == ["primary"]
+    assert models.stats()["hedge_enabled"] == 0
+
+
+def test_hedge_delay_follows_the_primary_p90_once_warm():
+    models = registry(hedge_delay=10, min_samples=3, min_delay=0.01)
+    assert models.hedge_delay() == 10
+    stats = models._stats["primary"]
+    for seconds in (0.1, 0.2, 0.3):
+        stats.record(seconds, True)
+    assert models.hedge_delay() == 0.3
+    models.min_delay = 1
+    assert models.hedge_delay() == 1
+
+
+def test_model_stats_bookkeeping():
+    stats = ModelStats(window=4)
+    assert stats.quantile(0.5) is None
+    for seconds in (0.5, 0.1, 0.4, 0.2, 0.3):
+        stats.record(seconds, True)
+    stats.record(9.0, False)
+    stats.record_cancelled()
+    # The window keeps the last four successes only
+    assert stats.samples() == 4
+    assert stats.quantile(0.0) == 0.1
+    assert stats.quantile(0.5) == 0.3
+    assert stats.quantile(0.99) == 0.4
+    assert stats.snapshot() == {
+        "samples": 4, "calls": 6, "errors": 1, "cancelled": 1, "wins": 0,
+        "p50_s": 0.3, "p90_s": 0.4, "p99_s": 0.4,
+    }
+
+
+@pytest.mark.parametrize("outcomes", [[True, True, False], [False]])
+def test_calls_count_every_finished_attempt(outcomes):
+    models = registry(hedge=False)
+    results = iter(outcomes)
+
+    def attempt(model, client, cancelled):
+        return {"answer": 1} if next(results) else {"error": "x"}
+
+    for _ in outcomes:
+        models.call(attempt)
+    stats = models.stats()
+    assert stats["primary_calls"] == len(outcomes)
+    assert stats["primary_errors"] == outcomes.count(False)
+    assert stats["primary_wins"] == outcomes.count(True)
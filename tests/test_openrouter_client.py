@@ -0,0 +1,155 @@
+import email.utils
+import json
+import socket
+import time
+
+import pytest
+
+from circuit_breaker import CircuitBreaker
+from mock_servers import MockConfig, MockServers, mock_analysis
+from openrouter_client import (
+    AuthenticationError, BadRequestError, ConnectionFailedError, InvalidResponseError, OpenRouterClient,
+    RateLimitError, RequestTimeoutError, UpstreamError, UpstreamUnavailableError, parse_retry_after,
+)
+
+
+PAYLOAD = {"model": "mock", "messages": [{"role": "user", "content": [{"type": "text", "text": "prompt"}]}]}
+
+
+@pytest.fixture
+def servers():
+    servers = MockServers(MockConfig(model_latency=0)).start()
+    yield servers
+    servers.stop()
+
+
+def make_client(base_url, **kwargs):
+    kwargs.setdefault("max_retries", 2)
+    kwargs.setdefault("backoff_base", 0.01)
+    kwargs.setdefault("backoff_max", 0.05)
+    kwargs.setdefault("read_timeout", 5)
+    # A breaker of its own so failures here never leak into other tests
+    kwargs.setdefault("breaker", CircuitBreaker("test", failure_threshold=100))
+    return OpenRouterClient(base_url=base_url, **kwargs)
+
+
+def content(body):
+    return json.loads(body["choices"][0]["message"]["content"])
+
+
+def test_parse_retry_after():
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("2.5") == 2.5
+    assert parse_retry_after("-1") == 0.0
+    assert parse_retry_after("soon") is None
+    later = email.utils.formatdate(time.time() + 60, usegmt=True)
+    assert 55 < parse_retry_after(later) <= 60
+
+
+def test_rate_limit_waits_for_retry_after(servers):
+    servers.respond(429, headers={"Retry-After": "0.3"})
+    client = make_client(servers.base_url, backoff_max=1)
+    started = time.monotonic()
+    body = client.chat_completion(PAYLOAD, "key")
+    assert time.monotonic() - started >= 0.3
+    assert content(body)["cavity_stage"] == mock_analysis()["cavity_stage"]
+    assert servers.requests["chat"] == 2
+
+
+def test_rate_limit_retries_exhausted(servers):
+    for _ in range(3):
+        servers.respond(429, headers={"Retry-After": "0"})
+    client = make_client(servers.base_url)
+    with pytest.raises(RateLimitError) as raised:
+        client.chat_completion(PAYLOAD, "key")
+    assert raised.value.to_dict()["error_type"] == "rate_limited"
+    assert servers.requests["chat"] == 3
+    # A 429 means the upstream is alive
+    assert client.breaker.stats()["consecutive_failures"] == 0
+
+
+def test_upstream_error_is_retried(servers):
+    servers.respond(502).respond(503)
+    body = make_client(servers.base_url).chat_completion(PAYLOAD, "key")
+    assert "choices" in body
+    assert servers.requests["chat"] == 3
+
+
+def test_upstream_error_retries_exhausted(servers):
+    servers.config.model_error_rate = 1.0
+    client = make_client(servers.base_url, max_retries=3)
+    with pytest.raises(UpstreamError) as raised:
+        client.chat_completion(PAYLOAD, "key")
+    error = raised.value.to_dict()
+    assert error["error_type"] == "upstream"
+    assert "mock upstream failure" in error["details"]
+    assert servers.requests["chat"] == 4
+    # One failure per call, not per attempt
+    assert client.breaker.stats()["consecutive_failures"] == 1
+
+
+def test_read_timeout(servers):
+    servers.config.model_latency = 1.0
+    client = make_client(servers.base_url, max_retries=1, read_timeout=0.2)
+    started = time.monotonic()
+    with pytest.raises(RequestTimeoutError) as raised:
+        client.chat_completion(PAYLOAD, "key")
+    assert time.monotonic() - started < 1.5
+    assert raised.value.to_dict()["error_type"] == "timeout"
+    assert servers.requests["chat"] == 2
+
+
+@pytest.mark.parametrize("status, error_class, error_type", [
+    (400, BadRequestError, "bad_request"),
+    (401, AuthenticationError, "auth"),
+    (403, AuthenticationError, "auth"),
+    (404, BadRequestError, "bad_request"),
+])
+def test_client_errors_are_not_retried(servers, status, error_class, error_type):
+    servers.respond(status, body="rejected by mock")
+    with pytest.raises(error_class) as raised:
+        make_client(servers.base_url).chat_completion(PAYLOAD, "key")
+    assert raised.value.status == status
+    assert raised.value.to_dict() == {"error": str(raised.value), "error_type": error_type,
+                                      "details": "rejected by mock"}
+    assert servers.requests["chat"] == 1
+
+
+def test_non_json_body(servers):
+    servers.respond(200, body="<html>not json</html>")
+    with pytest.raises(InvalidResponseError) as raised:
+        make_client(servers.base_url).chat_completion(PAYLOAD, "key")
+    assert raised.value.to_dict()["error_type"] == "invalid_response"
+
+
+def test_connection_refused():
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    client = make_client(f"http://127.0.0.1:{port}/api/v1", max_retries=1)
+    with pytest.raises(ConnectionFailedError) as raised:
+        client.chat_completion(PAYLOAD, "key")
+    assert raised.value.to_dict()["error_type"] == "connection"
+
+
+def test_open_breaker_rejects_without_sending(servers):
+    servers.config.model_error_rate = 1.0
+    client = make_client(servers.base_url, max_retries=0, breaker=CircuitBreaker("test", failure_threshold=1))
+    with pytest.raises(UpstreamError):
+        client.chat_completion(PAYLOAD, "key")
+    with pytest.raises(UpstreamUnavailableError) as raised:
+        client.chat_completion(PAYLOAD, "key")
+    assert raised.value.to_dict()["error_type"] == "unavailable"
+    assert servers.requests["chat"] == 1
+
+
+def test_stream_is_decoded_as_utf8(servers):
+    chunks = list(make_client(servers.base_url).stream_chat_completion(PAYLOAD, "key"))
+    assert len(chunks) > 1
+    assert json.loads("".join(chunks)) == mock_analysis()
+
+
+def test_stream_error_event(servers):
+    servers.respond(200, body='data: {"error": "overloaded"}\n\n', headers={"Content-Type": "text/event-stream"})
+    with pytest.raises(UpstreamError, match="overloaded"):
+        list(make_client(servers.base_url).stream_chat_completion(PAYLOAD, "key"))
@@ -0,0 +1,139 @@
+import json
+
+import pytest
+
+from response_parser import MAX_REPAIRS, parse_analysis_response, parse_stats, repair_json
+
+
+ANALYSIS = {
+    "cavity_stage": "Stage 2 - Dentin decay",
+    "severity_level": "Moderate",
+    "visible_issues": ["Dark spot on 14"],
+    "recommended_treatments": ["Filling", "Fluoride varnish"],
+    "cavity_present": True,
+    "affected_teeth": ["14"],
+    "prevention_tips": ["Floss daily", "Less sugar"],
+    "additional_notes": "Re-check the \"dark\" spot {in} 6 months",
+}
+DOCUMENT = json.dumps(ANALYSIS)
+
+
+def cut_after(marker, extra=0):
+    """DOCUMENT up to and including ``marker`` plus ``extra`` characters"""
+    return DOCUMENT[:DOCUMENT.index(marker) + len(marker) + extra]
+
+
+def parse_counts():
+    return {key: value for key, value in parse_stats.snapshot().items() if key != "success_rate"}
+
+
+@pytest.mark.parametrize("content", [
+    DOCUMENT,
+    f"```json\n{DOCUMENT}\n```",
+    f"Here is the analysis:\n```\n{DOCUMENT}\n```\nLet me know if you need anything else {{or not}}.",
+    f"{DOCUMENT}\n\nNote: this is not a diagnosis.",
+])
+def test_complete_answers_parse_first_try(content):
+    analysis, outcome = parse_analysis_response(content)
+    assert outcome == "ok"
+    assert analysis == ANALYSIS
+
+
+def test_truncated_inside_a_string():
+    analysis, outcome = parse_analysis_response(cut_after('"additional_notes": "Re-check the \\"da'))
+    assert outcome == "repaired"
+    assert analysis["additional_notes"] == 'Re-check the "da'
+    assert analysis["prevention_tips"] == ANALYSIS["prevention_tips"]
+
+
+def test_truncated_after_an_escape():
+    analysis, outcome = parse_analysis_response(cut_after('"additional_notes": "Re-check the \\'))
+    assert outcome == "repaired"
+    assert analysis["additional_notes"] == "Re-check the "
+
+
+def test_truncated_inside_an_array():
+    analysis, outcome = parse_analysis_response(cut_after('"prevention_tips": ["Floss daily", "Le'))
+    assert outcome == "repaired"
+    assert analysis["prevention_tips"] == ["Floss daily", "Le"]
+    assert "additional_notes" not in analysis
+
+    analysis, _ = parse_analysis_response(cut_after('"prevention_tips": ["Floss daily",'))
+    assert analysis["prevention_tips"] == ["Floss daily"]
+
+
+def test_truncated_inside_an_object():
+    exam = dict(ANALYSIS, per_image=[{"label": "Upper", **ANALYSIS}, {"label": "Lower", **ANALYSIS}])
+    document = json.dumps(exam)
+    cut = document[:document.rindex('"label": "Lower"') + len('"label": "Lo')]
+    analysis, outcome = parse_analysis_response(cut)
+    assert outcome == "repaired"
+    assert analysis["cavity_stage"] == ANALYSIS["cavity_stage"]
+    # The second view was cut off before its required fields
+    assert [item["label"] for item in analysis["per_image"]] == ["Upper"]
+
+
+def test_truncated_member_is_dropped():
+    assert repair_json('{"a": 1, "b": tr') == {"a": 1}
+    assert repair_json('{"a": [1, 2], "b": {"c": ') == {"a": [1, 2]}
+    assert repair_json('{"a": {"b": [1, {"c": "d"') == {"a": {"b": [1, {"c": "d"}]}}
+    assert repair_json('{"a": [1, 2,') == {"a": [1, 2]}
+
+
+def test_repair_gives_up_after_max_repairs():
+    def broken(members):
+        # Each bad member costs one repair attempt before the valid prefix parses
+        return '{"a": 1, ' + ", ".join(f'"k{index}": @' for index in range(members))
+
+    assert repair_json(broken(MAX_REPAIRS - 1)) == {"a": 1}
+    with pytest.raises(ValueError):
+        repair_json(broken(MAX_REPAIRS))
+    assert repair_json(broken(3), max_repairs=4) == {"a": 1}
+    with pytest.raises(ValueError):
+        repair_json(broken(3), max_repairs=3)
+
+
+@pytest.mark.parametrize("missing", ["cavity_stage", "recommended_treatments"])
+def test_cut_off_answer_missing_a_required_field_is_rejected(missing):
+    # The required field is the last one the model wrote before being cut off
+    ordered = {key: value for key, value in ANALYSIS.items() if key != missing}
+    ordered[missing] = ANALYSIS[missing]
+    document = json.dumps(ordered)
+    cut = document[:document.index(f'"{missing}"') + 3]
+    with pytest.raises(ValueError, match=missing):
+        parse_analysis_response(cut)
+
+
+@pytest.mark.parametrize("field", ["cavity_stage", "severity_level"])
+def test_empty_required_text_is_rejected(field):
+    with pytest.raises(ValueError, match=field):
+        parse_analysis_response(json.dumps(dict(ANALYSIS, **{field: ""})))
+
+
+def test_invalid_per_image_entries_are_dropped():
+    incomplete = {key: value for key, value in ANALYSIS.items() if key != "severity_level"}
+    exam = dict(ANALYSIS, per_image=[dict(ANALYSIS, label="Upper"), dict(incomplete, label="Lower"), "not an object"])
+    analysis, outcome = parse_analysis_response(json.dumps(exam))
+    assert outcome == "ok"
+    assert [item["label"] for item in analysis["per_image"]] == ["Upper"]
+
+
+def test_values_are_normalized():
+    raw = dict(ANALYSIS, visible_issues="Single issue", affected_teeth=[14, None, " "], cavity_present="yes",
+               unknown_field="dropped")
+    analysis, _ = parse_analysis_response(json.dumps(raw))
+    assert analysis["visible_issues"] == ["Single issue"]
+    assert analysis["affected_teeth"] == ["14"]
+    assert analysis["cavity_present"] is True
+    assert "unknown_field" not in analysis
+
+
+def test_parse_stats_count_each_outcome():
+    before = parse_counts()
+    parse_analysis_response(DOCUMENT)
+    parse_analysis_response(cut_after('"prevention_tips": ["Floss'))
+    for content in ("no json here", "[1, 2]", cut_after('"cavity_stage": "Sta')):
+        with pytest.raises(ValueError):
+            parse_analysis_response(content)
+    after = parse_counts()
+    assert {key: after[key] - before[key] for key in after} == {"ok": 1, "repaired": 1, "failed": 3}
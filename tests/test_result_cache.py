@@ -0,0 +1,130 @@
+import sqlite3
+
+import pytest
+
+import result_cache
+from result_cache import ResultCache, SQLiteStore, make_cache_key
+
+
+class FakeTime:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeTime()
+    monkeypatch.setattr(result_cache, "time", clock)
+    return clock
+
+
+def make_cache(tmp_path, **kwargs):
+    return ResultCache(path=str(tmp_path / "analysis.sqlite3"), **kwargs)
+
+
+def write_row(cache, key, value):
+    with sqlite3.connect(cache._disk.path) as conn:
+        conn.execute(f"UPDATE {cache._disk.table} SET value = ? WHERE key = ?", (value, key))
+
+
+def test_cache_key_depends_on_every_part():
+    key = make_cache_key(b"image", "en", "model", "v1")
+    assert key == make_cache_key(b"image", "en", "model", "v1")
+    assert len({key, make_cache_key(b"image2", "en", "model", "v1"), make_cache_key(b"image", "es", "model", "v1"),
+                make_cache_key(b"image", "en", "other", "v1"), make_cache_key(b"image", "en", "model", "v2")}) == 5
+
+
+def test_hits_and_misses_are_counted_per_tier(tmp_path, clock):
+    cache = make_cache(tmp_path)
+    assert cache.get("key") is None
+    cache.set("key", {"stage": "2", "items": ["a"]})
+    assert cache.get("key") == {"stage": "2", "items": ["a"]}
+
+    # Another process (or a restart) only has the disk tier
+    other = make_cache(tmp_path)
+    assert other.get("key") == {"stage": "2", "items": ["a"]}
+    assert other.get("key") == {"stage": "2", "items": ["a"]}
+
+    assert {k: cache.stats()[k] for k in ("memory_hits", "disk_hits", "misses")} == {
+        "memory_hits": 1, "disk_hits": 0, "misses": 1}
+    stats = other.stats()
+    assert {k: stats[k] for k in ("memory_hits", "disk_hits", "misses")} == {"memory_hits": 1, "disk_hits": 1, "misses": 0}
+    assert stats["hit_rate"] == 1.0
+    assert stats["disk_entries"] == 1
+
+
+def test_results_cannot_be_mutated_through_the_cache(tmp_path, clock):
+    cache = make_cache(tmp_path)
+    result = {"items": ["a"]}
+    cache.set("key", result)
+    result["items"].append("b")
+    cache.get("key")["items"].append("c")
+    assert cache.get("key") == {"items": ["a"]}
+
+
+def test_entries_expire_after_the_ttl(tmp_path, clock):
+    cache = make_cache(tmp_path, ttl_seconds=100)
+    cache.set("key", {"answer": 1})
+    clock.now += 100
+    assert cache.get("key") == {"answer": 1}
+    clock.now += 1
+    assert cache.get("key") is None
+    assert make_cache(tmp_path, ttl_seconds=100).get("key") is None
+
+
+def test_memory_copy_expires_with_the_disk_row(tmp_path, clock):
+    make_cache(tmp_path, ttl_seconds=100).set("key", {"answer": 1})
+    cache = make_cache(tmp_path, ttl_seconds=100)
+    clock.now += 90
+    # Read from disk late in the row's life...
+    assert cache.get("key") == {"answer": 1}
+    clock.now += 20
+    # ...does not give the memory copy a fresh TTL
+    assert cache.get("key") is None
+
+
+def test_memory_tier_is_lru_bounded(tmp_path, clock):
+    cache = make_cache(tmp_path, max_memory_items=2)
+    for key in ("a", "b", "c"):
+        cache.set(key, key)
+    assert cache.stats()["memory_entries"] == 2
+    assert cache.get("a") == "a"
+    assert cache.stats()["disk_hits"] == 1
+
+
+def test_disk_is_evicted_least_recently_used_first(tmp_path, clock):
+    store = SQLiteStore(str(tmp_path / "store.sqlite3"), max_bytes=300)
+    for key in ("a", "b", "c"):
+        clock.now += 1
+        store.set(key, bytes(100))
+    clock.now += 1
+    assert store.get("a") is not None
+    clock.now += 1
+    store.set("d", bytes(100))
+    assert store.get("b") is None
+    assert [store.get(key) is not None for key in ("a", "c", "d")] == [True, True, True]
+    assert store.stats() == {"entries": 3, "bytes": 300}
+
+
+def test_store_returns_the_creation_time(tmp_path, clock):
+    store = SQLiteStore(str(tmp_path / "store.sqlite3"))
+    store.set("key", b"value")
+    clock.now += 5
+    assert store.get("key") == (b"value", clock.now - 5)
+
+
+@pytest.mark.parametrize("raw", [b"{not json", b"\xff\xfe\x00"])
+def test_corrupt_row_is_a_miss_and_dropped(tmp_path, clock, raw):
+    make_cache(tmp_path).set("key", {"answer": 1})
+    cache = make_cache(tmp_path)
+    write_row(cache, "key", raw)
+    assert cache.get("key") is None
+    assert cache.get("key") is None
+    stats = cache.stats()
+    assert (stats["misses"], stats["corrupt"], stats["memory_entries"], stats["disk_entries"]) == (2, 1, 0, 0)
+
+    cache.set("key", {"answer": 2})
+    assert cache.get("key") == {"answer": 2}
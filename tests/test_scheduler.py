@@ -0,0 +1,133 @@
+import threading
+import time
+
+import pytest
+
+from scheduler import PRIORITY_EMERGENCY, PRIORITY_NORMAL, QueueTimeout, RequestScheduler
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+def admitted(scheduler):
+    """True if a slot is free right now (a zero timeout never waits)"""
+    try:
+        scheduler.acquire(timeout=0)
+    except QueueTimeout:
+        return False
+    scheduler.release()
+    return True
+
+
+def wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.005)
+    return True
+
+
+def test_token_bucket_refills_with_the_clock():
+    clock = FakeClock()
+    scheduler = RequestScheduler(rate=2, burst=3, clock=clock)
+    assert [admitted(scheduler) for _ in range(4)] == [True, True, True, False]
+    clock.advance(0.4)
+    assert not admitted(scheduler)
+    clock.advance(0.1)
+    assert admitted(scheduler)
+    # The bucket never holds more than the burst
+    clock.advance(60)
+    assert [admitted(scheduler) for _ in range(4)] == [True, True, True, False]
+    assert scheduler.stats()["timeouts"] == 3
+
+
+def test_max_in_flight():
+    scheduler = RequestScheduler(max_in_flight=2)
+    scheduler.acquire()
+    scheduler.acquire()
+    assert not admitted(scheduler)
+    scheduler.release()
+    assert admitted(scheduler)
+    assert scheduler.stats()["in_flight"] == 1
+
+
+def test_configure_replaces_the_limits():
+    clock = FakeClock()
+    scheduler = RequestScheduler(rate=1, burst=1, max_in_flight=1, clock=clock)
+    scheduler.acquire()
+    scheduler.release()
+    assert not admitted(scheduler)
+    scheduler.configure(rate=None, max_in_flight=4)
+    assert admitted(scheduler)
+    stats = scheduler.stats()
+    assert (stats["rate_per_s"], stats["burst"], stats["max_in_flight"]) == (None, 1, 4)
+
+
+def test_configure_wakes_waiters():
+    scheduler = RequestScheduler(max_in_flight=1)
+    scheduler.acquire()
+    waiter = threading.Thread(target=scheduler.acquire)
+    waiter.start()
+    assert wait_for(lambda: scheduler.stats()["queue_depth"] == 1)
+    scheduler.configure(max_in_flight=2)
+    waiter.join(1)
+    assert not waiter.is_alive()
+    assert scheduler.stats()["in_flight"] == 2
+
+
+def test_waiters_are_admitted_by_priority_then_arrival():
+    scheduler = RequestScheduler(max_in_flight=1)
+    scheduler.acquire()
+    order = []
+
+    def request(name, priority):
+        with scheduler.slot(priority):
+            order.append(name)
+
+    threads = []
+    for name, priority in [("first", PRIORITY_NORMAL), ("second", PRIORITY_NORMAL), ("emergency", PRIORITY_EMERGENCY)]:
+        thread = threading.Thread(target=request, args=(name, priority))
+        thread.start()
+        threads.append(thread)
+        assert wait_for(lambda: scheduler.stats()["queue_depth"] == len(threads))
+
+    scheduler.release()
+    for thread in threads:
+        thread.join(1)
+    assert order == ["emergency", "first", "second"]
+
+
+def test_queue_positions_are_reported():
+    scheduler = RequestScheduler(max_in_flight=1)
+    scheduler.acquire()
+    positions = []
+    waiter = threading.Thread(target=scheduler.acquire, kwargs={"on_queue": positions.append})
+    waiter.start()
+    assert wait_for(lambda: positions == [1])
+    scheduler.release()
+    waiter.join(1)
+    assert positions == [1, 0]
+
+
+def test_queue_timeout():
+    scheduler = RequestScheduler(max_in_flight=1)
+    scheduler.acquire()
+    started = time.monotonic()
+    with pytest.raises(QueueTimeout):
+        scheduler.acquire(timeout=0.05)
+    assert time.monotonic() - started >= 0.05
+    stats = scheduler.stats()
+    assert (stats["timeouts"], stats["queue_depth"], stats["in_flight"]) == (1, 0, 1)
+
+    # A waiter that timed out no longer holds up the ones behind it
+    scheduler.release()
+    assert admitted(scheduler)
@@ -0,0 +1,84 @@
+import threading
+import time
+
+import pytest
+
+from single_flight import SingleFlight
+
+
+def run_concurrently(flight, key, fn, callers):
+    """Start ``callers`` threads calling ``flight.do(key, fn)``; the lists fill in as they finish"""
+    results, errors = [], []
+
+    def call():
+        try:
+            results.append(flight.do(key, fn))
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=call) for _ in range(callers)]
+    for thread in threads:
+        thread.start()
+    return threads, results, errors
+
+
+def wait_for_followers(flight, count, timeout=2.0):
+    # Followers are counted before they block on the leader
+    deadline = time.monotonic() + timeout
+    while flight.stats()["coalesced"] < count:
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.005)
+    return True
+
+
+def test_concurrent_calls_share_one_execution():
+    flight = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def fn():
+        calls.append(1)
+        release.wait(2)
+        return {"answer": [1, 2]}
+
+    threads, results, errors = run_concurrently(flight, "key", fn, 5)
+    assert wait_for_followers(flight, 4)
+    release.set()
+    for thread in threads:
+        thread.join(2)
+
+    assert len(calls) == 1
+    assert errors == []
+    assert results == [{"answer": [1, 2]}] * 5
+    # Every caller got its own copy
+    results[0]["answer"].append(3)
+    assert results[1] == {"answer": [1, 2]}
+    assert flight.stats() == {"in_flight": 0, "executed": 1, "coalesced": 4}
+
+
+def test_followers_get_the_leaders_exception():
+    flight = SingleFlight()
+    release = threading.Event()
+
+    def fn():
+        release.wait(2)
+        raise ValueError("upstream down")
+
+    threads, results, errors = run_concurrently(flight, "key", fn, 3)
+    assert wait_for_followers(flight, 2)
+    release.set()
+    for thread in threads:
+        thread.join(2)
+    assert results == []
+    assert [str(e) for e in errors] == ["upstream down"] * 3
+
+
+def test_keys_are_independent_and_forgotten_after_the_call():
+    flight = SingleFlight()
+    assert flight.do("a", lambda: 1) == 1
+    assert flight.do("b", lambda: 2) == 2
+    assert flight.do("a", lambda: 3) == 3
+    with pytest.raises(KeyError):
+        flight.do("a", lambda: {}["missing"])
+    assert flight.stats() == {"in_flight": 0, "executed": 4, "coalesced": 0}
@@ -0,0 +1,70 @@
+import pytest
+
+from stage_graph import StageGraph, fingerprint
+
+
+class Flaky:
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+def test_fingerprint_is_stable_and_input_sensitive():
+    assert fingerprint("a", b"b", {"x": 1, "y": 2}) == fingerprint("a", b"b", {"y": 2, "x": 1})
+    assert fingerprint("a", "b") != fingerprint("ab")
+    assert fingerprint(b"a") != fingerprint("a")
+
+
+def test_run_memoizes_by_inputs():
+    graph = StageGraph({})
+    compute = Flaky("one", "two")
+    assert graph.run("stage", ["in"], compute) == "one"
+    assert graph.run("stage", ["in"], compute) == "one"
+    assert graph.run("stage", ["changed"], compute) == "two"
+    assert compute.calls == 2
+    assert graph.get("stage", ["changed"]) == "two"
+    assert graph.get("stage", ["in"]) is None
+
+
+def test_downstream_inputs_follow_upstream_outputs():
+    graph = StageGraph({})
+    graph.put("summary", ["analysis"], "text")
+    before = graph.output("summary")
+    graph.put("summary", ["analysis", "es"], "text")
+    assert graph.output("summary") == before
+    graph.put("summary", ["analysis"], "texto")
+    assert graph.output("summary") != before
+
+
+def test_errors_are_retried_by_default():
+    graph = StageGraph({})
+    compute = Flaky(TimeoutError("tts"), b"audio")
+    with pytest.raises(TimeoutError):
+        graph.run("audio", ["summary"], compute)
+    assert graph.run("audio", ["summary"], compute) == b"audio"
+
+
+def test_remembered_errors_wait_for_an_input_change():
+    graph = StageGraph({})
+    compute = Flaky(TimeoutError("tts"), b"audio")
+    for _ in range(3):
+        with pytest.raises(TimeoutError):
+            graph.run("audio", ["summary", "voice"], compute, remember_errors=True)
+    assert compute.calls == 1
+    assert graph.run("audio", ["summary", "other voice"], compute, remember_errors=True) == b"audio"
+
+
+def test_put_records_a_failure_from_elsewhere():
+    graph = StageGraph({})
+    graph.put("audio", ["summary"], None, error=TimeoutError("tts"))
+    compute = Flaky(b"audio")
+    with pytest.raises(TimeoutError):
+        graph.run("audio", ["summary"], compute, remember_errors=True)
+    assert compute.calls == 0
@@ -0,0 +1,87 @@
+"""In-memory Edge TTS synthesis on a shared event loop and connector"""
+import asyncio
+import concurrent.futures
+import ssl
+import threading
+
+import aiohttp
+import certifi
+
+from circuit_breaker import get_breaker
+
+
+class _SharedConnector(aiohttp.TCPConnector):
+    """Connector that survives the per-request sessions edge_tts opens and closes"""
+
+    def close(self, *, abort_ssl=False):
+        # edge_tts wraps every synthesis in its own ClientSession, which owns
+        # (and would close) the connector it is given
+        return _noop()
+
+    async def shutdown(self):
+        await super().close()
+
+
+async def _noop():
+    return None
+
+
+class SpeechSynthesizer:
+    """Runs Edge TTS on one long-lived background loop
+
+    The loop owns a single certifi-verified connector, so DNS results and the
+    SSL context are shared by every synthesis. Edge TTS speaks over a
+    websocket, which is never returned to a keep-alive pool, so each
+    synthesis still performs its own upgrade handshake. Every run reports
+    to the ``tts`` circuit breaker, so a dead Edge TTS fails fast.
+    """
+
+    def __init__(self, breaker=None):
+        self.breaker = breaker or get_breaker("tts")
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="edge-tts", daemon=True)
+        self._thread.start()
+        self._connector = asyncio.run_coroutine_threadsafe(self._create_connector(), self._loop).result()
+
+    async def _create_connector(self):
+        ssl_context = ssl.create_default_context(cafile=certifi.where())
+        return _SharedConnector(ssl=ssl_context, ttl_dns_cache=300, limit=20)
+
+    def run(self, coroutine_factory, timeout=None):
+        """Run ``coroutine_factory(connector)`` on the TTS loop and wait for its result
+
+        Raises CircuitOpenError without running anything while the breaker is open.
+        """
+        self.breaker.before_call()
+        future = asyncio.run_coroutine_threadsafe(coroutine_factory(self._connector), self._loop)
+        try:
+            result = future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            self.breaker.record_failure()
+            raise
+        except Exception:
+            self.breaker.record_failure()
+            raise
+        except BaseException:
+            self.breaker.release()
+            raise
+        self.breaker.record_success()
+        return result
+
+    def close(self):
+        asyncio.run_coroutine_threadsafe(self._connector.shutdown(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+
+
+_synthesizer = None
+_synthesizer_lock = threading.Lock()
+
+
+def get_synthesizer():
+    """Process-wide synthesizer shared by all sessions and worker threads"""
+    global _synthesizer
+    with _synthesizer_lock:
+        if _synthesizer is None:
+            _synthesizer = SpeechSynthesizer()
+        return _synthesizer
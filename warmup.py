@@ -0,0 +1,72 @@
+"""One-time per-process warm-up of the slow first-call paths
+
+Usage (e.g. as a readiness probe before a replica takes traffic):
+    python warmup.py
+"""
+import json
+import sys
+import time
+from datetime import datetime
+
+from PIL import Image
+
+from image_prep import prepare_image
+from image_processing import compute_image_processing
+from openrouter_client import get_client
+from tts import get_synthesizer
+
+
+def warm_opencv():
+    """Run the CLAHE/Canny/histogram and JPEG encode paths once on a tiny image"""
+    image = Image.new("RGB", (64, 48), (200, 180, 170))
+    compute_image_processing(image)
+    prepare_image(image)
+
+
+def warm_openrouter():
+    """Open a pooled TLS connection to the OpenRouter API host"""
+    client = get_client()
+    # Any status is fine: the point is the TCP+TLS handshake kept in the pool
+    client.session.head(f"{client.base_url}/models", timeout=(client.connect_timeout, 10)).close()
+
+
+def warm_tts():
+    """Start the TTS loop, import edge_tts and resolve/handshake with its host"""
+    import edge_tts
+
+    get_synthesizer().run(lambda connector: edge_tts.list_voices(connector=connector), timeout=20)
+
+
+WARMUP_STEPS = (
+    ("opencv", warm_opencv),
+    ("openrouter", warm_openrouter),
+    ("edge_tts", warm_tts),
+)
+
+
+def run_warmup(steps=WARMUP_STEPS):
+    """Run every warm-up step, recording how long each took and whether it worked"""
+    started = time.perf_counter()
+    report = {"started_at": datetime.now().isoformat(timespec="seconds"), "steps": {}}
+    for name, step in steps:
+        step_started = time.perf_counter()
+        try:
+            step()
+            outcome = {"ok": True}
+        except Exception as e:
+            # A failed step only means the first real request pays that cost
+            outcome = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+        outcome["seconds"] = round(time.perf_counter() - step_started, 3)
+        report["steps"][name] = outcome
+    report["total_seconds"] = round(time.perf_counter() - started, 3)
+    report["ok"] = all(outcome["ok"] for outcome in report["steps"].values())
+    return report
+
+
+if __name__ == "__main__":
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    report = run_warmup()
+    print(json.dumps(report, indent=2))
+    sys.exit(0 if report["ok"] else 1)